@@ -45,7 +45,7 @@ pub(crate) use aether_ai_formats::api::{
     encode_kiro_sse_events, endpoint_config_forces_upstream_stream_policy,
     enforce_request_body_stream_field, estimate_kiro_tokens, extract_openai_text_content,
     find_kiro_real_thinking_end_tag, find_kiro_real_thinking_end_tag_at_buffer_end,
-    find_kiro_real_thinking_start_tag, force_upstream_streaming_for_provider,
+    find_kiro_real_thinking_start_tag, fold_ascii_case, force_upstream_streaming_for_provider,
     gemini_request_is_image_generation, implicit_sync_finalize_report_kind,
     is_core_error_finalize_kind, is_matching_stream_http_request, is_matching_stream_request,
     is_openai_image_stream_request, is_openai_responses_family_format, is_openai_responses_format,
@@ -1,5 +1,5 @@
-pub(crate) fn normalized_signature(api_format: &str) -> Option<&'static str> {
-    match crate::ai_serving::normalize_api_format_alias(api_format).as_str() {
+pub(crate) fn normalized_signature(normalized: &str) -> Option<&'static str> {
+    match normalized {
         "gemini:generate_content" => Some("gemini:generate_content"),
         "gemini:embedding" => Some("gemini:embedding"),
         "gemini:video" => Some("gemini:video"),
@@ -8,8 +8,8 @@ pub(crate) fn normalized_signature(api_format: &str) -> Option<&'static str> {
     }
 }
 
-pub(crate) fn local_path(api_format: &str) -> Option<&'static str> {
-    match crate::ai_serving::normalize_api_format_alias(api_format).as_str() {
+pub(crate) fn local_path(normalized: &str) -> Option<&'static str> {
+    match normalized {
         "gemini" | "gemini:generate_content" => Some("/v1beta/models/{model}:{action}"),
         "gemini:embedding" => Some("/v1beta/models/{model}:{action}"),
         "gemini:video" => Some("/v1beta/models/{model}:predictLongRunning"),
@@ -1,13 +1,13 @@
-pub(crate) fn normalized_signature(api_format: &str) -> Option<&'static str> {
-    match crate::ai_serving::normalize_api_format_alias(api_format).as_str() {
+pub(crate) fn normalized_signature(normalized: &str) -> Option<&'static str> {
+    match normalized {
         "jina:embedding" => Some("jina:embedding"),
         "jina:rerank" => Some("jina:rerank"),
         _ => None,
     }
 }
 
-pub(crate) fn local_path(api_format: &str) -> Option<&'static str> {
-    match crate::ai_serving::normalize_api_format_alias(api_format).as_str() {
+pub(crate) fn local_path(normalized: &str) -> Option<&'static str> {
+    match normalized {
         "jina:embedding" => Some("/v1/embeddings"),
         "jina:rerank" => Some("/v1/rerank"),
         _ => None,
@@ -1,5 +1,5 @@
-pub(crate) fn normalized_signature(api_format: &str) -> Option<&'static str> {
-    match crate::ai_serving::normalize_api_format_alias(api_format).as_str() {
+pub(crate) fn normalized_signature(normalized: &str) -> Option<&'static str> {
+    match normalized {
         "openai:chat" => Some("openai:chat"),
         "openai:embedding" => Some("openai:embedding"),
         "openai:rerank" => Some("openai:rerank"),
@@ -11,8 +11,8 @@ pub(crate) fn normalized_signature(api_format: &str) -> Option<&'static str> {
     }
 }
 
-pub(crate) fn local_path(api_format: &str) -> Option<&'static str> {
-    match crate::ai_serving::normalize_api_format_alias(api_format).as_str() {
+pub(crate) fn local_path(normalized: &str) -> Option<&'static str> {
+    match normalized {
         "openai" | "openai:chat" => Some("/v1/chat/completions"),
         "openai:embedding" => Some("/v1/embeddings"),
         "openai:rerank" => Some("/v1/rerank"),
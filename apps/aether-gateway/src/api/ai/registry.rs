@@ -50,7 +50,8 @@ pub(crate) fn mount_ai_routes(mut router: Router<AppState>) -> Router<AppState>
 }
 
 pub(crate) fn public_api_format_local_path(api_format: &str) -> &'static str {
-    let normalized = api_format.trim().to_ascii_lowercase();
+    // Normalize once here; the per-family matchers compare the normalized alias directly.
+    let normalized = crate::ai_serving::normalize_api_format_alias(api_format);
     openai::local_path(&normalized)
         .or_else(|| claude::local_path(&normalized))
         .or_else(|| gemini::local_path(&normalized))
@@ -61,7 +62,7 @@ pub(crate) fn public_api_format_local_path(api_format: &str) -> &'static str {
 }
 
 pub(crate) fn normalize_admin_endpoint_signature(api_format: &str) -> Option<&'static str> {
-    let normalized = api_format.trim().to_ascii_lowercase();
+    let normalized = crate::ai_serving::normalize_api_format_alias(api_format);
     openai::normalized_signature(&normalized)
         .or_else(|| claude::normalized_signature(&normalized))
         .or_else(|| gemini::normalized_signature(&normalized))
@@ -89,7 +90,10 @@ pub(crate) fn admin_default_body_rules_for_signature(
 
 #[cfg(test)]
 mod tests {
-    use super::{admin_endpoint_signature_parts, public_api_format_local_path};
+    use super::{
+        admin_endpoint_signature_parts, normalize_admin_endpoint_signature,
+        public_api_format_local_path,
+    };
 
     #[test]
     fn supports_data_api_endpoint_signatures_and_public_paths() {
@@ -119,4 +123,27 @@ mod tests {
             assert_eq!(public_api_format_local_path(api_format), path);
         }
     }
+
+    #[test]
+    fn normalizes_aliases_and_case_before_signature_lookup() {
+        assert_eq!(
+            normalize_admin_endpoint_signature(" OpenAI:Video "),
+            Some("openai:video")
+        );
+        assert_eq!(
+            normalize_admin_endpoint_signature("DashScope:multimodal_embedding"),
+            Some("aliyun:multimodal_embedding")
+        );
+        assert_eq!(
+            normalize_admin_endpoint_signature("openai"),
+            Some("openai:chat")
+        );
+        assert_eq!(normalize_admin_endpoint_signature("unknown:chat"), None);
+        assert_eq!(
+            public_api_format_local_path(" Gemini:Files "),
+            "/v1beta/files"
+        );
+        assert_eq!(public_api_format_local_path("claude"), "/v1/messages");
+        assert_eq!(public_api_format_local_path("unknown"), "/");
+    }
 }
@@ -1,3 +1,4 @@
+use std::collections::BTreeMap;
 use std::time::Duration;
 
 use aether_billing::enrich_usage_event_with_billing;
@@ -6,6 +7,7 @@ use aether_data_contracts::repository::video_tasks::{
     StoredVideoTask, UpsertVideoTask, VideoTaskStatus,
 };
 use aether_usage_runtime::{build_upsert_usage_record_from_event, settle_usage_if_needed};
+use futures_util::stream::{self, StreamExt};
 use serde_json::{Map, Value};
 use tokio::task::JoinHandle;
 use tracing::{debug, info, warn};
@@ -17,11 +19,14 @@ use crate::{AppState, GatewayError};
 
 const MAX_VIDEO_TASK_POLL_BACKOFF_SECONDS: u64 = 300;
 const VIDEO_TASK_POLL_CLAIM_SECONDS: u64 = 30;
+const VIDEO_TASK_POLL_CONCURRENCY: usize = 8;
+const VIDEO_TASK_POLL_ERROR_MESSAGE_MAX_CHARS: usize = 500;
 
 #[derive(Debug, Clone)]
 struct VideoTaskRefreshError {
     message: String,
     permanent: bool,
+    retry_after_seconds: Option<u64>,
 }
 
 enum VideoTaskRefreshAttempt {
@@ -76,64 +81,67 @@ async fn poll_video_tasks_once(state: &AppState, batch_size: usize) -> Result<us
             batch_size,
         )
         .await?;
-    let mut refreshed = 0usize;
-    for (index, task) in tasks.into_iter().enumerate() {
+    let mut prepared = Vec::with_capacity(tasks.len());
+    for (index, task) in tasks.iter().enumerate() {
         let trace_id = format!("video-task-poller-{index}");
+        // Decode the stored snapshot once before the upstream fetch; the
+        // refresh plan and the post-poll update are both built from it.
+        let Some(snapshot) = LocalVideoTaskSnapshot::from_stored_task(task) else {
+            continue;
+        };
         let Some(refresh_plan) = state
             .video_tasks
-            .prepare_poll_refresh_plan_for_stored_task(&task, &trace_id)
+            .prepare_poll_refresh_plan_for_snapshot(&snapshot, &trace_id)
         else {
             continue;
         };
+        prepared.push((task, snapshot, refresh_plan));
+    }
+
+    let attempts = stream::iter(prepared.into_iter().map(
+        |(task, snapshot, refresh_plan)| async move {
+            let attempt = fetch_video_task_refresh_attempt(state, &refresh_plan).await;
+            (task, snapshot, attempt)
+        },
+    ))
+    .buffer_unordered(VIDEO_TASK_POLL_CONCURRENCY)
+    .collect::<Vec<_>>()
+    .await;
 
-        match fetch_video_task_refresh_attempt(state, &refresh_plan).await? {
+    let mut updates = Vec::with_capacity(attempts.len());
+    for (task, snapshot, attempt) in attempts {
+        let updated = match attempt? {
             VideoTaskRefreshAttempt::Success { provider_body } => {
-                let Some(updated) =
-                    build_successful_poll_update(&task, &provider_body, now_unix_secs)?
-                else {
-                    continue;
-                };
-                match state.update_active_video_task(updated).await? {
-                    Some(stored) => {
-                        if let Some(snapshot) = LocalVideoTaskSnapshot::from_stored_task(&stored) {
-                            state.video_tasks.record_snapshot(snapshot);
-                        }
-                        info!(
-                            event_name = "video_task_status_updated",
-                            log_type = "event",
-                            request_id = %short_request_id(stored.request_id.as_str()),
-                            task_id = %stored.id,
-                            status = ?stored.status,
-                            "gateway updated video task status from poll refresh"
-                        );
-                        finalize_video_task_if_terminal(state, &stored).await;
-                        refreshed += 1;
-                    }
-                    None => continue,
-                }
+                build_successful_poll_update(task, snapshot, provider_body, now_unix_secs)?
             }
             VideoTaskRefreshAttempt::Error(err) => {
-                let updated = build_failed_poll_update(&task, &err, now_unix_secs);
-                match state.update_active_video_task(updated).await? {
-                    Some(stored) => {
-                        if let Some(snapshot) = LocalVideoTaskSnapshot::from_stored_task(&stored) {
-                            state.video_tasks.record_snapshot(snapshot);
-                        }
-                        info!(
-                            event_name = "video_task_status_updated",
-                            log_type = "event",
-                            request_id = %short_request_id(stored.request_id.as_str()),
-                            task_id = %stored.id,
-                            status = ?stored.status,
-                            "gateway updated video task status from poll refresh"
-                        );
-                        finalize_video_task_if_terminal(state, &stored).await;
-                        refreshed += 1;
-                    }
-                    None => continue,
-                }
+                build_failed_poll_update(task, &snapshot, &err, now_unix_secs)
             }
+        };
+        updates.push(updated);
+    }
+    if updates.is_empty() {
+        return Ok(0);
+    }
+
+    // The whole batch is written in one transaction; tasks that went
+    // terminal concurrently are skipped by the repository.
+    let stored_tasks = state.update_active_video_tasks(updates).await?;
+    let mut refreshed = 0usize;
+    for stored in stored_tasks {
+        if let Some(snapshot) = LocalVideoTaskSnapshot::from_stored_task(&stored) {
+            state.video_tasks.record_snapshot(snapshot);
         }
+        info!(
+            event_name = "video_task_status_updated",
+            log_type = "event",
+            request_id = %short_request_id(stored.request_id.as_str()),
+            task_id = %stored.id,
+            status = ?stored.status,
+            "gateway updated video task status from poll refresh"
+        );
+        finalize_video_task_if_terminal(state, &stored).await;
+        refreshed += 1;
     }
     Ok(refreshed)
 }
@@ -188,8 +196,9 @@ async fn fetch_video_task_refresh_attempt(
         Ok(result) => result,
         Err(err) => {
             return Ok(VideoTaskRefreshAttempt::Error(VideoTaskRefreshError {
-                message: format!("{err:?}"),
+                message: truncate_poll_error_message(&format!("{err:?}")),
                 permanent: false,
+                retry_after_seconds: None,
             }));
         }
     };
@@ -199,14 +208,11 @@ async fn fetch_video_task_refresh_attempt(
         ));
     }
 
-    let Some(provider_body) = result
-        .body
-        .and_then(|body| body.json_body)
-        .and_then(|body| body.as_object().cloned())
-    else {
+    let Some(Value::Object(provider_body)) = result.body.and_then(|body| body.json_body) else {
         return Ok(VideoTaskRefreshAttempt::Error(VideoTaskRefreshError {
             message: "video task refresh missing json provider body".to_string(),
             permanent: false,
+            retry_after_seconds: None,
         }));
     };
 
@@ -219,10 +225,12 @@ fn classify_refresh_result_error(result: &ExecutionResult) -> VideoTaskRefreshEr
         .as_ref()
         .and_then(|error| error.upstream_status)
         .unwrap_or(result.status_code);
+    // Upstream error pages can be large; only a bounded prefix is kept in
+    // the task's progress message and poll_error metadata.
     let message = result
         .error
         .as_ref()
-        .map(|error| error.message.clone())
+        .map(|error| error.message.as_str())
         .or_else(|| {
             result
                 .body
@@ -230,8 +238,8 @@ fn classify_refresh_result_error(result: &ExecutionResult) -> VideoTaskRefreshEr
                 .and_then(|body| body.json_body.as_ref())
                 .and_then(|value| value.get("error"))
                 .and_then(Value::as_str)
-                .map(str::to_string)
         })
+        .map(truncate_poll_error_message)
         .unwrap_or_else(|| format!("upstream returned {status_code}"));
     let permanent = result.error.as_ref().map_or(
         matches!(status_code, 400 | 401 | 403 | 404 | 422),
@@ -249,18 +257,37 @@ fn classify_refresh_result_error(result: &ExecutionResult) -> VideoTaskRefreshEr
         },
     );
 
-    VideoTaskRefreshError { message, permanent }
+    VideoTaskRefreshError {
+        message,
+        permanent,
+        retry_after_seconds: parse_retry_after_seconds(&result.headers),
+    }
+}
+
+fn parse_retry_after_seconds(headers: &BTreeMap<String, String>) -> Option<u64> {
+    headers
+        .iter()
+        .find(|(key, _)| key.eq_ignore_ascii_case("retry-after"))
+        .and_then(|(_, value)| value.trim().parse::<u64>().ok())
+}
+
+fn truncate_poll_error_message(message: &str) -> String {
+    match message
+        .char_indices()
+        .nth(VIDEO_TASK_POLL_ERROR_MESSAGE_MAX_CHARS)
+    {
+        Some((idx, _)) => format!("{}...", &message[..idx]),
+        None => message.to_string(),
+    }
 }
 
 fn build_successful_poll_update(
     task: &StoredVideoTask,
-    provider_body: &Map<String, Value>,
+    mut snapshot: LocalVideoTaskSnapshot,
+    provider_body: Map<String, Value>,
     now_unix_secs: u64,
-) -> Result<Option<UpsertVideoTask>, GatewayError> {
-    let Some(mut snapshot) = LocalVideoTaskSnapshot::from_stored_task(task) else {
-        return Ok(None);
-    };
-    snapshot.apply_provider_body(provider_body);
+) -> Result<UpsertVideoTask, GatewayError> {
+    snapshot.apply_provider_body(&provider_body);
 
     let mut record = snapshot.to_upsert_record();
     record.id = task.id.clone();
@@ -302,70 +329,85 @@ fn build_successful_poll_update(
     if !record.status.is_active() && record.completed_at_unix_secs.is_none() {
         record.completed_at_unix_secs = Some(now_unix_secs);
     }
-    if record.status.is_active() && record.poll_count >= record.max_poll_count {
-        record.status = VideoTaskStatus::Failed;
-        record.error_code = Some("poll_timeout".to_string());
-        record.error_message = Some(format!("Task timed out after {} polls", record.poll_count));
-        record.completed_at_unix_secs = Some(now_unix_secs);
-        record.next_poll_at_unix_secs = None;
-    }
+    fail_video_task_on_poll_limit(&mut record, now_unix_secs);
     record.request_metadata = merge_video_task_request_metadata(
-        task.request_metadata.clone(),
+        task.request_metadata.as_ref(),
         &snapshot,
         Some(provider_body),
         None,
+        now_unix_secs,
     )
     .map_err(|err| GatewayError::Internal(err.to_string()))?;
 
-    Ok(Some(record))
+    Ok(record)
 }
 
 fn build_failed_poll_update(
     task: &StoredVideoTask,
+    snapshot: &LocalVideoTaskSnapshot,
     err: &VideoTaskRefreshError,
     now_unix_secs: u64,
 ) -> UpsertVideoTask {
-    let mut record = stored_task_to_upsert(task);
+    let mut record = stored_task_to_upsert(task, snapshot);
     record.updated_at_unix_secs = now_unix_secs;
     record.poll_count = task.poll_count.saturating_add(1);
     record.progress_message = Some(format!("Poll error: {}", err.message));
     if err.permanent {
-        record.status = VideoTaskStatus::Failed;
-        record.error_code = Some("poll_permanent_error".to_string());
-        record.error_message = Some(err.message.clone());
-        record.completed_at_unix_secs = Some(now_unix_secs);
-        record.next_poll_at_unix_secs = None;
+        mark_video_task_poll_failed(
+            &mut record,
+            "poll_permanent_error",
+            err.message.clone(),
+            now_unix_secs,
+        );
     } else {
-        let backoff =
+        let mut backoff =
             compute_poll_backoff_seconds(task.poll_interval_seconds.max(1), task.retry_count);
+        // A throttled upstream knows better than our schedule when to come back.
+        if let Some(retry_after) = err.retry_after_seconds {
+            backoff = backoff.max(retry_after.min(MAX_VIDEO_TASK_POLL_BACKOFF_SECONDS));
+        }
         record.retry_count = task.retry_count.saturating_add(1);
         record.next_poll_at_unix_secs = Some(now_unix_secs.saturating_add(backoff));
     }
+    fail_video_task_on_poll_limit(&mut record, now_unix_secs);
+    record.request_metadata = merge_video_task_request_metadata(
+        task.request_metadata.as_ref(),
+        snapshot,
+        None,
+        Some(err),
+        now_unix_secs,
+    )
+    .ok()
+    .flatten()
+    .or_else(|| task.request_metadata.clone());
+    record
+}
+
+fn fail_video_task_on_poll_limit(record: &mut UpsertVideoTask, now_unix_secs: u64) {
     if record.status.is_active() && record.poll_count >= record.max_poll_count {
-        record.status = VideoTaskStatus::Failed;
-        record.error_code = Some("poll_timeout".to_string());
-        record.error_message = Some(format!("Task timed out after {} polls", record.poll_count));
-        record.completed_at_unix_secs = Some(now_unix_secs);
-        record.next_poll_at_unix_secs = None;
+        let message = format!("Task timed out after {} polls", record.poll_count);
+        mark_video_task_poll_failed(record, "poll_timeout", message, now_unix_secs);
     }
-    record.request_metadata = LocalVideoTaskSnapshot::from_stored_task(task)
-        .and_then(|snapshot| {
-            merge_video_task_request_metadata(
-                task.request_metadata.clone(),
-                &snapshot,
-                None,
-                Some(err),
-            )
-            .ok()
-            .flatten()
-        })
-        .or(task.request_metadata.clone());
-    record
 }
 
-fn stored_task_to_upsert(task: &StoredVideoTask) -> UpsertVideoTask {
-    let snapshot_record =
-        LocalVideoTaskSnapshot::from_stored_task(task).map(|snapshot| snapshot.to_upsert_record());
+fn mark_video_task_poll_failed(
+    record: &mut UpsertVideoTask,
+    error_code: &str,
+    error_message: String,
+    now_unix_secs: u64,
+) {
+    record.status = VideoTaskStatus::Failed;
+    record.error_code = Some(error_code.to_string());
+    record.error_message = Some(error_message);
+    record.completed_at_unix_secs = Some(now_unix_secs);
+    record.next_poll_at_unix_secs = None;
+}
+
+fn stored_task_to_upsert(
+    task: &StoredVideoTask,
+    snapshot: &LocalVideoTaskSnapshot,
+) -> UpsertVideoTask {
+    let snapshot_record = snapshot.to_upsert_record();
     UpsertVideoTask {
         id: task.id.clone(),
         short_id: task.short_id.clone(),
@@ -382,36 +424,15 @@ fn stored_task_to_upsert(task: &StoredVideoTask) -> UpsertVideoTask {
         provider_api_format: task.provider_api_format.clone(),
         format_converted: task.format_converted,
         model: task.model.clone(),
-        prompt: task.prompt.clone().or_else(|| {
-            snapshot_record
-                .as_ref()
-                .and_then(|record| record.prompt.clone())
-        }),
-        original_request_body: task.original_request_body.clone().or_else(|| {
-            snapshot_record
-                .as_ref()
-                .and_then(|record| record.original_request_body.clone())
-        }),
-        duration_seconds: task.duration_seconds.or_else(|| {
-            snapshot_record
-                .as_ref()
-                .and_then(|record| record.duration_seconds)
-        }),
-        resolution: task.resolution.clone().or_else(|| {
-            snapshot_record
-                .as_ref()
-                .and_then(|record| record.resolution.clone())
-        }),
-        aspect_ratio: task.aspect_ratio.clone().or_else(|| {
-            snapshot_record
-                .as_ref()
-                .and_then(|record| record.aspect_ratio.clone())
-        }),
-        size: task.size.clone().or_else(|| {
-            snapshot_record
-                .as_ref()
-                .and_then(|record| record.size.clone())
-        }),
+        prompt: task.prompt.clone().or(snapshot_record.prompt),
+        original_request_body: task
+            .original_request_body
+            .clone()
+            .or(snapshot_record.original_request_body),
+        duration_seconds: task.duration_seconds.or(snapshot_record.duration_seconds),
+        resolution: task.resolution.clone().or(snapshot_record.resolution),
+        aspect_ratio: task.aspect_ratio.clone().or(snapshot_record.aspect_ratio),
+        size: task.size.clone().or(snapshot_record.size),
         status: task.status,
         progress_percent: task.progress_percent,
         progress_message: task.progress_message.clone(),
@@ -440,13 +461,26 @@ fn compute_poll_backoff_seconds(poll_interval_seconds: u32, retry_count: u32) ->
 }
 
 fn merge_video_task_request_metadata(
-    existing: Option<Value>,
+    existing: Option<&Value>,
     snapshot: &LocalVideoTaskSnapshot,
-    provider_body: Option<&Map<String, Value>>,
+    provider_body: Option<Map<String, Value>>,
     poll_error: Option<&VideoTaskRefreshError>,
+    now_unix_secs: u64,
 ) -> Result<Option<Value>, serde_json::Error> {
+    // Only copy entries that survive the merge: the previous snapshot and raw
+    // poll response are replaced below and are usually the largest values.
+    let replaces_poll_state = provider_body.is_some() || poll_error.is_some();
     let mut metadata = match existing {
-        Some(Value::Object(object)) => object,
+        Some(Value::Object(object)) => object
+            .iter()
+            .filter(|(key, _)| match key.as_str() {
+                "rust_local_snapshot" => false,
+                "poll_raw_response" => provider_body.is_none(),
+                "poll_error" => !replaces_poll_state,
+                _ => true,
+            })
+            .map(|(key, value)| (key.clone(), value.clone()))
+            .collect(),
         _ => Map::new(),
     };
     metadata.insert(
@@ -460,9 +494,8 @@ fn merge_video_task_request_metadata(
     if let Some(provider_body) = provider_body {
         metadata.insert(
             "poll_raw_response".to_string(),
-            Value::Object(provider_body.clone()),
+            Value::Object(provider_body),
         );
-        metadata.remove("poll_error");
     }
     if let Some(poll_error) = poll_error {
         metadata.insert(
@@ -470,7 +503,7 @@ fn merge_video_task_request_metadata(
             serde_json::json!({
                 "message": poll_error.message,
                 "permanent": poll_error.permanent,
-                "observed_at_unix_secs": now_unix_secs(),
+                "observed_at_unix_secs": now_unix_secs,
             }),
         );
     }
@@ -594,13 +627,17 @@ fn now_unix_secs() -> u64 {
 
 #[cfg(test)]
 mod tests {
-    use super::{build_failed_poll_update, stored_task_to_upsert, VideoTaskRefreshError};
+    use super::{
+        build_failed_poll_update, build_successful_poll_update, parse_retry_after_seconds,
+        stored_task_to_upsert, truncate_poll_error_message, VideoTaskRefreshError,
+        MAX_VIDEO_TASK_POLL_BACKOFF_SECONDS, VIDEO_TASK_POLL_ERROR_MESSAGE_MAX_CHARS,
+    };
     use crate::video_tasks::{
         LocalVideoTaskPersistence, LocalVideoTaskSnapshot, LocalVideoTaskStatus,
         LocalVideoTaskTransport, OpenAiVideoTaskSeed,
     };
     use aether_data_contracts::repository::video_tasks::{StoredVideoTask, VideoTaskStatus};
-    use serde_json::json;
+    use serde_json::{json, Value};
     use std::collections::BTreeMap;
 
     fn sample_sparse_stored_task() -> StoredVideoTask {
@@ -698,7 +735,10 @@ mod tests {
 
     #[test]
     fn stored_task_to_upsert_restores_sparse_fields_from_snapshot() {
-        let record = stored_task_to_upsert(&sample_sparse_stored_task());
+        let task = sample_sparse_stored_task();
+        let snapshot =
+            LocalVideoTaskSnapshot::from_stored_task(&task).expect("snapshot should decode");
+        let record = stored_task_to_upsert(&task, &snapshot);
 
         assert_eq!(record.prompt.as_deref(), Some("hello"));
         assert_eq!(
@@ -719,11 +759,16 @@ mod tests {
 
     #[test]
     fn failed_poll_update_keeps_snapshot_backed_request_body() {
+        let task = sample_sparse_stored_task();
+        let snapshot =
+            LocalVideoTaskSnapshot::from_stored_task(&task).expect("snapshot should decode");
         let record = build_failed_poll_update(
-            &sample_sparse_stored_task(),
+            &task,
+            &snapshot,
             &VideoTaskRefreshError {
                 message: "temporary failure".to_string(),
                 permanent: false,
+                retry_after_seconds: None,
             },
             100,
         );
@@ -741,4 +786,118 @@ mod tests {
         assert_eq!(record.prompt.as_deref(), Some("hello"));
         assert_eq!(record.resolution.as_deref(), Some("720p"));
     }
+
+    #[test]
+    fn failed_poll_update_honors_upstream_retry_after() {
+        let task = sample_sparse_stored_task();
+        let snapshot =
+            LocalVideoTaskSnapshot::from_stored_task(&task).expect("snapshot should decode");
+        let throttled = |retry_after_seconds| {
+            build_failed_poll_update(
+                &task,
+                &snapshot,
+                &VideoTaskRefreshError {
+                    message: "rate limited".to_string(),
+                    permanent: false,
+                    retry_after_seconds,
+                },
+                100,
+            )
+        };
+
+        // retry_count 1 with a 10s interval backs off 20s on its own.
+        assert_eq!(throttled(None).next_poll_at_unix_secs, Some(120));
+        assert_eq!(throttled(Some(5)).next_poll_at_unix_secs, Some(120));
+        assert_eq!(throttled(Some(90)).next_poll_at_unix_secs, Some(190));
+        assert_eq!(
+            throttled(Some(86_400)).next_poll_at_unix_secs,
+            Some(100 + MAX_VIDEO_TASK_POLL_BACKOFF_SECONDS)
+        );
+        assert_eq!(
+            parse_retry_after_seconds(&BTreeMap::from([(
+                "Retry-After".to_string(),
+                " 30 ".to_string()
+            )])),
+            Some(30)
+        );
+    }
+
+    #[test]
+    fn failed_poll_update_times_out_at_poll_limit() {
+        let mut task = sample_sparse_stored_task();
+        task.max_poll_count = 3;
+        let snapshot =
+            LocalVideoTaskSnapshot::from_stored_task(&task).expect("snapshot should decode");
+        let record = build_failed_poll_update(
+            &task,
+            &snapshot,
+            &VideoTaskRefreshError {
+                message: "temporary failure".to_string(),
+                permanent: false,
+                retry_after_seconds: None,
+            },
+            100,
+        );
+
+        assert_eq!(record.status, VideoTaskStatus::Failed);
+        assert_eq!(record.error_code.as_deref(), Some("poll_timeout"));
+        assert_eq!(
+            record.error_message.as_deref(),
+            Some("Task timed out after 3 polls")
+        );
+        assert_eq!(record.completed_at_unix_secs, Some(100));
+        assert_eq!(record.next_poll_at_unix_secs, None);
+        assert_eq!(
+            record
+                .request_metadata
+                .as_ref()
+                .and_then(|metadata| metadata.pointer("/poll_error/observed_at_unix_secs")),
+            Some(&json!(100))
+        );
+    }
+
+    #[test]
+    fn successful_poll_update_replaces_poll_state_in_request_metadata() {
+        let mut task = sample_sparse_stored_task();
+        let metadata = task
+            .request_metadata
+            .as_mut()
+            .and_then(Value::as_object_mut)
+            .expect("metadata should be an object");
+        metadata.insert("poll_error".to_string(), json!({"message": "stale"}));
+        metadata.insert("poll_raw_response".to_string(), json!({"status": "queued"}));
+        metadata.insert("client_tag".to_string(), json!("kept"));
+        let snapshot =
+            LocalVideoTaskSnapshot::from_stored_task(&task).expect("snapshot should decode");
+        let provider_body = json!({"status": "processing", "progress": 40})
+            .as_object()
+            .cloned()
+            .expect("provider body should be an object");
+
+        let record = build_successful_poll_update(&task, snapshot, provider_body, 100)
+            .expect("poll update should build");
+        let metadata = record.request_metadata.expect("metadata should be present");
+
+        assert_eq!(metadata.get("poll_error"), None);
+        assert_eq!(
+            metadata.get("poll_raw_response"),
+            Some(&json!({"status": "processing", "progress": 40}))
+        );
+        assert_eq!(metadata.get("client_tag"), Some(&json!("kept")));
+        assert_eq!(metadata.get("rust_owner"), Some(&json!("async_task")));
+        assert!(metadata.get("rust_local_snapshot").is_some());
+    }
+
+    #[test]
+    fn poll_error_message_is_truncated_on_char_boundary() {
+        assert_eq!(truncate_poll_error_message("bad gateway"), "bad gateway");
+
+        let message = "é".repeat(VIDEO_TASK_POLL_ERROR_MESSAGE_MAX_CHARS + 10);
+        let truncated = truncate_poll_error_message(&message);
+        assert!(truncated.ends_with("..."));
+        assert_eq!(
+            truncated.chars().count(),
+            VIDEO_TASK_POLL_ERROR_MESSAGE_MAX_CHARS + 3
+        );
+    }
 }
@@ -300,16 +300,16 @@ fn rate_multiplier_for_api_format(
     context: &aether_data_contracts::repository::billing::StoredBillingModelContext,
     api_format: &str,
 ) -> f64 {
-    let normalized_api_format = api_format.trim().to_ascii_lowercase();
     let Some(mapping) = context
         .provider_api_key_rate_multipliers
         .as_ref()
         .and_then(serde_json::Value::as_object)
+        .filter(|mapping| !mapping.is_empty())
     else {
         return 1.0;
     };
     mapping
-        .get(&normalized_api_format)
+        .get(crate::ai_serving::fold_ascii_case(api_format.trim()).as_ref())
         .and_then(serde_json::Value::as_f64)
         .filter(|value| value.is_finite() && *value >= 0.0)
         .unwrap_or(1.0)
@@ -968,6 +968,16 @@ mod tests {
                 .expect("estimate should resolve");
 
         assert_eq!(estimate, 6.0);
+
+        let estimate = estimate_cost_from_billing_context(
+            &context,
+            " OpenAI:Chat ",
+            1_000_000,
+            Some(1_000_000),
+        )
+        .expect("estimate should resolve");
+
+        assert_eq!(estimate, 6.0);
     }
 
     #[test]
@@ -0,0 +1,498 @@
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::Arc;
+use std::time::Duration;
+
+use aether_cache::ExpiringMap;
+use aether_data::DataLayerError;
+use aether_data_contracts::repository::billing::{
+    AdminBillingCollectorRecord, AdminBillingCollectorWriteInput, AdminBillingMutationOutcome,
+    AdminBillingPresetApplyResult, AdminBillingRuleRecord, AdminBillingRuleWriteInput,
+    BillingPlanRecord, BillingPlanWriteInput, BillingReadRepository, PaymentGatewayConfigRecord,
+    PaymentGatewayConfigWriteInput, StoredBillingModelContext, UserDailyQuotaAvailabilityRecord,
+    UserPlanEntitlementRecord,
+};
+use async_trait::async_trait;
+
+const BILLING_MODEL_CONTEXT_CACHE_TTL: Duration = Duration::from_secs(5);
+const BILLING_MODEL_CONTEXT_CACHE_MAX_ENTRIES: usize = 2048;
+
+pub(super) struct CachedBillingReadRepository {
+    inner: Arc<dyn BillingReadRepository>,
+    model_contexts: ExpiringMap<BillingModelContextCacheKey, Option<StoredBillingModelContext>>,
+    epoch: AtomicU64,
+}
+
+impl CachedBillingReadRepository {
+    pub(super) fn new(inner: Arc<dyn BillingReadRepository>) -> Self {
+        Self {
+            inner,
+            model_contexts: ExpiringMap::new(),
+            epoch: AtomicU64::new(0),
+        }
+    }
+
+    fn cached_model_context(
+        &self,
+        key: &BillingModelContextCacheKey,
+    ) -> Option<Option<StoredBillingModelContext>> {
+        self.model_contexts
+            .get_fresh(key, BILLING_MODEL_CONTEXT_CACHE_TTL)
+    }
+
+    fn remember_model_context(
+        &self,
+        key: BillingModelContextCacheKey,
+        context: &Option<StoredBillingModelContext>,
+        load_epoch: u64,
+    ) {
+        // A write that landed while this lookup was reading must not be
+        // masked by caching the value read before it.
+        if load_epoch != self.epoch.load(Ordering::Acquire) {
+            return;
+        }
+        self.model_contexts.insert(
+            key,
+            context.clone(),
+            BILLING_MODEL_CONTEXT_CACHE_TTL,
+            BILLING_MODEL_CONTEXT_CACHE_MAX_ENTRIES,
+        );
+    }
+
+    fn invalidate_model_contexts<T>(&self, result: &Result<T, DataLayerError>) {
+        if result.is_ok() {
+            self.clear_local_cache();
+        }
+    }
+}
+
+#[async_trait]
+impl BillingReadRepository for CachedBillingReadRepository {
+    fn clear_local_cache(&self) {
+        self.epoch.fetch_add(1, Ordering::AcqRel);
+        self.model_contexts.clear();
+        self.inner.clear_local_cache();
+    }
+
+    async fn find_model_context(
+        &self,
+        provider_id: &str,
+        provider_api_key_id: Option<&str>,
+        global_model_name: &str,
+    ) -> Result<Option<StoredBillingModelContext>, DataLayerError> {
+        let key = BillingModelContextCacheKey::new(
+            BillingModelContextLookup::GlobalModelName,
+            provider_id,
+            provider_api_key_id,
+            global_model_name,
+        );
+        if let Some(context) = self.cached_model_context(&key) {
+            return Ok(context);
+        }
+        let load_epoch = self.epoch.load(Ordering::Acquire);
+        let context = self
+            .inner
+            .find_model_context(provider_id, provider_api_key_id, global_model_name)
+            .await?;
+        self.remember_model_context(key, &context, load_epoch);
+        Ok(context)
+    }
+
+    async fn find_model_context_by_model_id(
+        &self,
+        provider_id: &str,
+        provider_api_key_id: Option<&str>,
+        model_id: &str,
+    ) -> Result<Option<StoredBillingModelContext>, DataLayerError> {
+        let key = BillingModelContextCacheKey::new(
+            BillingModelContextLookup::ModelId,
+            provider_id,
+            provider_api_key_id,
+            model_id,
+        );
+        if let Some(context) = self.cached_model_context(&key) {
+            return Ok(context);
+        }
+        let load_epoch = self.epoch.load(Ordering::Acquire);
+        let context = self
+            .inner
+            .find_model_context_by_model_id(provider_id, provider_api_key_id, model_id)
+            .await?;
+        self.remember_model_context(key, &context, load_epoch);
+        Ok(context)
+    }
+
+    async fn admin_billing_enabled_default_value_exists(
+        &self,
+        api_format: &str,
+        task_type: &str,
+        dimension_name: &str,
+        existing_id: Option<&str>,
+    ) -> Result<Option<bool>, DataLayerError> {
+        self.inner
+            .admin_billing_enabled_default_value_exists(
+                api_format,
+                task_type,
+                dimension_name,
+                existing_id,
+            )
+            .await
+    }
+
+    async fn create_admin_billing_rule(
+        &self,
+        input: &AdminBillingRuleWriteInput,
+    ) -> Result<AdminBillingMutationOutcome<AdminBillingRuleRecord>, DataLayerError> {
+        let result = self.inner.create_admin_billing_rule(input).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn list_admin_billing_rules(
+        &self,
+        task_type: Option<&str>,
+        is_enabled: Option<bool>,
+        page: u32,
+        page_size: u32,
+    ) -> Result<Option<(Vec<AdminBillingRuleRecord>, u64)>, DataLayerError> {
+        self.inner
+            .list_admin_billing_rules(task_type, is_enabled, page, page_size)
+            .await
+    }
+
+    async fn find_admin_billing_rule(
+        &self,
+        rule_id: &str,
+    ) -> Result<Option<AdminBillingRuleRecord>, DataLayerError> {
+        self.inner.find_admin_billing_rule(rule_id).await
+    }
+
+    async fn update_admin_billing_rule(
+        &self,
+        rule_id: &str,
+        input: &AdminBillingRuleWriteInput,
+    ) -> Result<AdminBillingMutationOutcome<AdminBillingRuleRecord>, DataLayerError> {
+        let result = self.inner.update_admin_billing_rule(rule_id, input).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn create_admin_billing_collector(
+        &self,
+        input: &AdminBillingCollectorWriteInput,
+    ) -> Result<AdminBillingMutationOutcome<AdminBillingCollectorRecord>, DataLayerError> {
+        let result = self.inner.create_admin_billing_collector(input).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn list_admin_billing_collectors(
+        &self,
+        api_format: Option<&str>,
+        task_type: Option<&str>,
+        dimension_name: Option<&str>,
+        is_enabled: Option<bool>,
+        page: u32,
+        page_size: u32,
+    ) -> Result<Option<(Vec<AdminBillingCollectorRecord>, u64)>, DataLayerError> {
+        self.inner
+            .list_admin_billing_collectors(
+                api_format,
+                task_type,
+                dimension_name,
+                is_enabled,
+                page,
+                page_size,
+            )
+            .await
+    }
+
+    async fn find_admin_billing_collector(
+        &self,
+        collector_id: &str,
+    ) -> Result<Option<AdminBillingCollectorRecord>, DataLayerError> {
+        self.inner.find_admin_billing_collector(collector_id).await
+    }
+
+    async fn update_admin_billing_collector(
+        &self,
+        collector_id: &str,
+        input: &AdminBillingCollectorWriteInput,
+    ) -> Result<AdminBillingMutationOutcome<AdminBillingCollectorRecord>, DataLayerError> {
+        let result = self
+            .inner
+            .update_admin_billing_collector(collector_id, input)
+            .await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn apply_admin_billing_preset(
+        &self,
+        preset: &str,
+        mode: &str,
+        collectors: &[AdminBillingCollectorWriteInput],
+    ) -> Result<AdminBillingMutationOutcome<AdminBillingPresetApplyResult>, DataLayerError> {
+        let result = self
+            .inner
+            .apply_admin_billing_preset(preset, mode, collectors)
+            .await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn find_payment_gateway_config(
+        &self,
+        provider: &str,
+    ) -> Result<Option<PaymentGatewayConfigRecord>, DataLayerError> {
+        self.inner.find_payment_gateway_config(provider).await
+    }
+
+    async fn upsert_payment_gateway_config(
+        &self,
+        input: &PaymentGatewayConfigWriteInput,
+    ) -> Result<AdminBillingMutationOutcome<PaymentGatewayConfigRecord>, DataLayerError> {
+        let result = self.inner.upsert_payment_gateway_config(input).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn list_billing_plans(
+        &self,
+        include_disabled: bool,
+    ) -> Result<Option<Vec<BillingPlanRecord>>, DataLayerError> {
+        self.inner.list_billing_plans(include_disabled).await
+    }
+
+    async fn find_billing_plan(
+        &self,
+        plan_id: &str,
+    ) -> Result<Option<BillingPlanRecord>, DataLayerError> {
+        self.inner.find_billing_plan(plan_id).await
+    }
+
+    async fn create_billing_plan(
+        &self,
+        input: &BillingPlanWriteInput,
+    ) -> Result<AdminBillingMutationOutcome<BillingPlanRecord>, DataLayerError> {
+        let result = self.inner.create_billing_plan(input).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn update_billing_plan(
+        &self,
+        plan_id: &str,
+        input: &BillingPlanWriteInput,
+    ) -> Result<AdminBillingMutationOutcome<BillingPlanRecord>, DataLayerError> {
+        let result = self.inner.update_billing_plan(plan_id, input).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn set_billing_plan_enabled(
+        &self,
+        plan_id: &str,
+        enabled: bool,
+    ) -> Result<AdminBillingMutationOutcome<BillingPlanRecord>, DataLayerError> {
+        let result = self.inner.set_billing_plan_enabled(plan_id, enabled).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn delete_billing_plan(
+        &self,
+        plan_id: &str,
+    ) -> Result<AdminBillingMutationOutcome<()>, DataLayerError> {
+        let result = self.inner.delete_billing_plan(plan_id).await;
+        self.invalidate_model_contexts(&result);
+        result
+    }
+
+    async fn list_user_plan_entitlements(
+        &self,
+        user_id: &str,
+    ) -> Result<Option<Vec<UserPlanEntitlementRecord>>, DataLayerError> {
+        self.inner.list_user_plan_entitlements(user_id).await
+    }
+
+    async fn find_user_daily_quota_availability(
+        &self,
+        user_id: &str,
+    ) -> Result<Option<UserDailyQuotaAvailabilityRecord>, DataLayerError> {
+        self.inner.find_user_daily_quota_availability(user_id).await
+    }
+}
+
+#[derive(Clone, Copy, Debug, Eq, Hash, PartialEq)]
+enum BillingModelContextLookup {
+    GlobalModelName,
+    ModelId,
+}
+
+// Typed key so lookups hash the parts directly instead of formatting a
+// joined string that could collide when an id contains the separator.
+#[derive(Clone, Debug, Eq, Hash, PartialEq)]
+struct BillingModelContextCacheKey {
+    lookup: BillingModelContextLookup,
+    provider_id: String,
+    provider_api_key_id: Option<String>,
+    model: String,
+}
+
+impl BillingModelContextCacheKey {
+    fn new(
+        lookup: BillingModelContextLookup,
+        provider_id: &str,
+        provider_api_key_id: Option<&str>,
+        model: &str,
+    ) -> Self {
+        Self {
+            lookup,
+            provider_id: provider_id.to_owned(),
+            provider_api_key_id: provider_api_key_id.map(ToOwned::to_owned),
+            model: model.to_owned(),
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::atomic::AtomicUsize;
+    use std::sync::Mutex;
+
+    struct CountingBillingRepository {
+        calls: AtomicUsize,
+    }
+
+    #[async_trait]
+    impl BillingReadRepository for CountingBillingRepository {
+        async fn find_model_context(
+            &self,
+            _provider_id: &str,
+            _provider_api_key_id: Option<&str>,
+            _global_model_name: &str,
+        ) -> Result<Option<StoredBillingModelContext>, DataLayerError> {
+            self.calls.fetch_add(1, Ordering::SeqCst);
+            Ok(None)
+        }
+
+        async fn find_model_context_by_model_id(
+            &self,
+            _provider_id: &str,
+            _provider_api_key_id: Option<&str>,
+            _model_id: &str,
+        ) -> Result<Option<StoredBillingModelContext>, DataLayerError> {
+            self.calls.fetch_add(1, Ordering::SeqCst);
+            Ok(None)
+        }
+    }
+
+    #[tokio::test]
+    async fn reuses_model_context_lookups_per_typed_key() {
+        let inner = Arc::new(CountingBillingRepository {
+            calls: AtomicUsize::new(0),
+        });
+        let cache = CachedBillingReadRepository::new(inner.clone());
+
+        for _ in 0..3 {
+            cache
+                .find_model_context("provider-1", Some("key-1"), "gpt-5")
+                .await
+                .expect("lookup should succeed");
+        }
+        assert_eq!(inner.calls.load(Ordering::SeqCst), 1);
+
+        cache
+            .find_model_context_by_model_id("provider-1", Some("key-1"), "gpt-5")
+            .await
+            .expect("lookup should succeed");
+        cache
+            .find_model_context("provider-1", None, "gpt-5")
+            .await
+            .expect("lookup should succeed");
+        assert_eq!(inner.calls.load(Ordering::SeqCst), 3);
+    }
+
+    struct PricedBillingRepository {
+        price_per_request: Mutex<f64>,
+    }
+
+    #[async_trait]
+    impl BillingReadRepository for PricedBillingRepository {
+        async fn find_model_context(
+            &self,
+            provider_id: &str,
+            provider_api_key_id: Option<&str>,
+            global_model_name: &str,
+        ) -> Result<Option<StoredBillingModelContext>, DataLayerError> {
+            let price = *self.price_per_request.lock().expect("price lock");
+            StoredBillingModelContext::new(
+                provider_id.to_string(),
+                None,
+                provider_api_key_id.map(ToOwned::to_owned),
+                None,
+                None,
+                "global-model-1".to_string(),
+                global_model_name.to_string(),
+                None,
+                Some(price),
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+            )
+            .map(Some)
+        }
+
+        async fn update_admin_billing_rule(
+            &self,
+            _rule_id: &str,
+            _input: &AdminBillingRuleWriteInput,
+        ) -> Result<AdminBillingMutationOutcome<AdminBillingRuleRecord>, DataLayerError> {
+            *self.price_per_request.lock().expect("price lock") = 0.5;
+            Ok(AdminBillingMutationOutcome::NotFound)
+        }
+    }
+
+    #[tokio::test]
+    async fn billing_writes_invalidate_cached_model_contexts() {
+        let cache = CachedBillingReadRepository::new(Arc::new(PricedBillingRepository {
+            price_per_request: Mutex::new(0.1),
+        }));
+        let price = |context: Option<StoredBillingModelContext>| {
+            context.and_then(|context| context.default_price_per_request)
+        };
+
+        let before = cache
+            .find_model_context("provider-1", Some("key-1"), "gpt-5")
+            .await
+            .expect("lookup should succeed");
+        assert_eq!(price(before), Some(0.1));
+
+        cache
+            .update_admin_billing_rule(
+                "rule-1",
+                &AdminBillingRuleWriteInput {
+                    name: "per request".to_string(),
+                    task_type: "chat".to_string(),
+                    global_model_id: Some("global-model-1".to_string()),
+                    model_id: None,
+                    expression: "0.5".to_string(),
+                    variables: serde_json::json!({}),
+                    dimension_mappings: serde_json::json!({}),
+                    is_enabled: true,
+                },
+            )
+            .await
+            .expect("rule write should succeed");
+
+        let after = cache
+            .find_model_context("provider-1", Some("key-1"), "gpt-5")
+            .await
+            .expect("lookup should succeed");
+        assert_eq!(price(after), Some(0.5));
+    }
+}
@@ -1,4 +1,5 @@
 use aether_data::{DataBackends, DataLayerError, DatabaseDriver};
+use aether_data_contracts::repository::billing::BillingReadRepository;
 use aether_data_contracts::repository::candidate_selection::MinimalCandidateSelectionReadRepository;
 use aether_data_contracts::repository::provider_catalog::ProviderCatalogReadRepository;
 use aether_runtime_state::RuntimeQueueStore;
@@ -80,7 +81,11 @@ impl GatewayDataState {
         let oauth_provider_writer = backends.write().oauth_providers();
         let proxy_node_reader = backends.read().proxy_nodes();
         let proxy_node_writer = backends.write().proxy_nodes();
-        let billing_reader = backends.read().billing();
+        let billing_reader = backends.read().billing().map(|repository| {
+            Arc::new(super::billing_cache::CachedBillingReadRepository::new(
+                repository,
+            )) as Arc<dyn BillingReadRepository>
+        });
         let background_task_reader = backends.read().background_tasks();
         let background_task_writer = backends.write().background_tasks();
         let gemini_file_mapping_reader = backends.read().gemini_file_mappings();
@@ -285,6 +290,14 @@ impl GatewayDataState {
         if let Some(repository) = &self.provider_catalog_reader {
             repository.clear_local_cache();
         }
+        // Billing model contexts join provider and key rows from the catalog.
+        self.clear_billing_model_context_cache();
+    }
+
+    pub(crate) fn clear_billing_model_context_cache(&self) {
+        if let Some(repository) = &self.billing_reader {
+            repository.clear_local_cache();
+        }
     }
 
     pub(crate) fn has_request_candidate_reader(&self) -> bool {
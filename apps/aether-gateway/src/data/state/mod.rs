@@ -318,6 +318,7 @@ impl fmt::Debug for GatewayDataState {
 }
 
 mod auth;
+mod billing_cache;
 mod candidate_cache;
 mod catalog;
 mod core;
@@ -221,20 +221,28 @@ impl GatewayDataState {
         &self,
         record: &UpsertAdminProviderModelRecord,
     ) -> Result<Option<StoredAdminProviderModel>, DataLayerError> {
-        match &self.global_model_writer {
+        let written = match &self.global_model_writer {
             Some(repository) => repository.create_admin_provider_model(record).await,
             None => Ok(None),
+        }?;
+        if written.is_some() {
+            self.clear_billing_model_context_cache();
         }
+        Ok(written)
     }
 
     pub(crate) async fn update_admin_provider_model(
         &self,
         record: &UpsertAdminProviderModelRecord,
     ) -> Result<Option<StoredAdminProviderModel>, DataLayerError> {
-        match &self.global_model_writer {
+        let written = match &self.global_model_writer {
             Some(repository) => repository.update_admin_provider_model(record).await,
             None => Ok(None),
+        }?;
+        if written.is_some() {
+            self.clear_billing_model_context_cache();
         }
+        Ok(written)
     }
 
     pub(crate) async fn delete_admin_provider_model(
@@ -242,44 +250,60 @@ impl GatewayDataState {
         provider_id: &str,
         model_id: &str,
     ) -> Result<bool, DataLayerError> {
-        match &self.global_model_writer {
+        let deleted = match &self.global_model_writer {
             Some(repository) => {
                 repository
                     .delete_admin_provider_model(provider_id, model_id)
                     .await
             }
             None => Ok(false),
+        }?;
+        if deleted {
+            self.clear_billing_model_context_cache();
         }
+        Ok(deleted)
     }
 
     pub(crate) async fn create_admin_global_model(
         &self,
         record: &CreateAdminGlobalModelRecord,
     ) -> Result<Option<StoredAdminGlobalModel>, DataLayerError> {
-        match &self.global_model_writer {
+        let written = match &self.global_model_writer {
             Some(repository) => repository.create_admin_global_model(record).await,
             None => Ok(None),
+        }?;
+        if written.is_some() {
+            self.clear_billing_model_context_cache();
         }
+        Ok(written)
     }
 
     pub(crate) async fn update_admin_global_model(
         &self,
         record: &UpdateAdminGlobalModelRecord,
     ) -> Result<Option<StoredAdminGlobalModel>, DataLayerError> {
-        match &self.global_model_writer {
+        let written = match &self.global_model_writer {
             Some(repository) => repository.update_admin_global_model(record).await,
             None => Ok(None),
+        }?;
+        if written.is_some() {
+            self.clear_billing_model_context_cache();
         }
+        Ok(written)
     }
 
     pub(crate) async fn delete_admin_global_model(
         &self,
         global_model_id: &str,
     ) -> Result<bool, DataLayerError> {
-        match &self.global_model_writer {
+        let deleted = match &self.global_model_writer {
             Some(repository) => repository.delete_admin_global_model(global_model_id).await,
             None => Ok(false),
+        }?;
+        if deleted {
+            self.clear_billing_model_context_cache();
         }
+        Ok(deleted)
     }
 
     pub(crate) async fn list_provider_model_stats(
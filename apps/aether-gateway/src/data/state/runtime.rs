@@ -469,13 +469,13 @@ impl GatewayDataState {
         }
     }
 
-    pub(crate) async fn update_active_video_task(
+    pub(crate) async fn update_active_video_tasks(
         &self,
-        task: UpsertVideoTask,
-    ) -> Result<Option<StoredVideoTask>, DataLayerError> {
+        tasks: Vec<UpsertVideoTask>,
+    ) -> Result<Vec<StoredVideoTask>, DataLayerError> {
         match &self.video_task_writer {
-            Some(repository) => repository.update_if_active(task).await,
-            None => Ok(None),
+            Some(repository) => repository.update_many_if_active(tasks).await,
+            None => Ok(Vec::new()),
         }
     }
 
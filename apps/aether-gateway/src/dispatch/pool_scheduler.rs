@@ -1155,7 +1155,7 @@ async fn read_pool_catalog_key_contexts_by_id(
         }
     };
 
-    let provider_pool_service = ProviderPoolService::with_builtin_adapters();
+    let provider_pool_service = ProviderPoolService::builtin();
 
     keys.into_iter()
         .map(|key| {
@@ -1165,7 +1165,7 @@ async fn read_pool_catalog_key_contexts_by_id(
                 .unwrap_or_default();
             (
                 key.id.clone(),
-                build_pool_catalog_key_context(state, &provider_pool_service, &key, provider_type),
+                build_pool_catalog_key_context(state, provider_pool_service, &key, provider_type),
             )
         })
         .collect()
@@ -1507,7 +1507,7 @@ fn pool_key_candidate_order_for_group(
             })
             .collect::<Vec<_>>(),
     };
-    let active_presets = ProviderPoolService::with_builtin_adapters()
+    let active_presets = ProviderPoolService::builtin()
         .normalize_scheduling_presets(group.transport.provider.provider_type.as_str(), &presets)
         .into_iter()
         .map(|preset| preset.preset)
@@ -1569,7 +1569,7 @@ fn pool_scheduling_config(
     config: AdminProviderPoolConfig,
     provider_type: &str,
 ) -> PoolSchedulingConfig {
-    let service = ProviderPoolService::with_builtin_adapters();
+    let service = ProviderPoolService::builtin();
     let scheduling_presets = config
         .scheduling_presets
         .into_iter()
@@ -2624,7 +2624,7 @@ mod tests {
 
     #[test]
     fn normalizes_distribution_mode_before_strategy_presets() {
-        let presets = ProviderPoolService::with_builtin_adapters()
+        let presets = ProviderPoolService::builtin()
             .normalize_scheduling_presets(
                 "openai",
                 &[
@@ -3673,7 +3673,7 @@ mod tests {
 
         let context = build_pool_catalog_key_context(
             PlannerAppState::new(&app),
-            &ProviderPoolService::with_builtin_adapters(),
+            ProviderPoolService::builtin(),
             &key,
             "codex",
         );
@@ -3718,7 +3718,7 @@ mod tests {
         let app = app_state_with_catalog_key(key.clone());
         let context = build_pool_catalog_key_context(
             PlannerAppState::new(&app),
-            &ProviderPoolService::with_builtin_adapters(),
+            ProviderPoolService::builtin(),
             &key,
             "codex",
         );
@@ -3738,7 +3738,7 @@ mod tests {
         let app = app_state_with_catalog_key(key.clone());
         let context = build_pool_catalog_key_context(
             PlannerAppState::new(&app),
-            &ProviderPoolService::with_builtin_adapters(),
+            ProviderPoolService::builtin(),
             &key,
             "codex",
         );
@@ -3768,7 +3768,7 @@ mod tests {
         let app = app_state_with_catalog_key(key.clone());
         let context = build_pool_catalog_key_context(
             PlannerAppState::new(&app),
-            &ProviderPoolService::with_builtin_adapters(),
+            ProviderPoolService::builtin(),
             &key,
             "antigravity",
         );
@@ -3789,7 +3789,7 @@ mod tests {
         let app = app_state_with_catalog_key(key.clone());
         let context = build_pool_catalog_key_context(
             PlannerAppState::new(&app),
-            &ProviderPoolService::with_builtin_adapters(),
+            ProviderPoolService::builtin(),
             &key,
             "codex",
         );
@@ -784,12 +784,15 @@ fn maybe_bridge_non_sse_sync_json_to_stream(
 
     let decoded_body_bytes = decode_non_sse_response_body_bytes(headers, body_bytes)
         .unwrap_or_else(|| body_bytes.to_vec());
-    if !response_body_is_json(headers, &decoded_body_bytes) {
-        return Ok(None);
-    }
-
-    let body_json: Value = serde_json::from_slice(&decoded_body_bytes)
-        .map_err(|err| GatewayError::Internal(err.to_string()))?;
+    let body_json: Value = if response_content_type_is_json(headers) {
+        serde_json::from_slice(&decoded_body_bytes)
+            .map_err(|err| GatewayError::Internal(err.to_string()))?
+    } else {
+        match serde_json::from_slice(&decoded_body_bytes) {
+            Ok(body_json) => body_json,
+            Err(_) => return Ok(None),
+        }
+    };
     let client_api_format = report_context
         .get("client_api_format")
         .and_then(Value::as_str)
@@ -840,16 +843,11 @@ fn decode_non_sse_response_body_bytes(
     }
 }
 
-fn response_body_is_json(headers: &BTreeMap<String, String>, body_bytes: &[u8]) -> bool {
-    if headers
+fn response_content_type_is_json(headers: &BTreeMap<String, String>) -> bool {
+    headers
         .get("content-type")
         .map(|value| value.to_ascii_lowercase())
         .is_some_and(|value| value.contains("json"))
-    {
-        return true;
-    }
-
-    serde_json::from_slice::<Value>(body_bytes).is_ok()
 }
 
 fn format_error_chain(err: &(dyn std::error::Error + 'static)) -> String {
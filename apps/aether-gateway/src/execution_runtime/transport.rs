@@ -1,8 +1,11 @@
-use std::collections::BTreeMap;
+use std::collections::hash_map::DefaultHasher;
+use std::collections::{BTreeMap, HashMap};
 use std::error::Error as _;
 use std::future::Future;
+use std::hash::{Hash, Hasher};
 use std::io::Read;
 use std::io::Write;
+use std::sync::{LazyLock, RwLock};
 use std::time::{Duration, Instant};
 
 use aether_contracts::{
@@ -45,6 +48,19 @@ const DEFAULT_STREAM_FIRST_BYTE_TIMEOUT_MS: u64 = 30_000;
 const DEFAULT_NON_STREAM_TOTAL_TIMEOUT_MS: u64 = 300_000;
 const MIN_TUNNEL_TIMEOUT_SECS: u64 = 1;
 const MAX_TUNNEL_TIMEOUT_SECS: u64 = 300;
+const DIRECT_CLIENT_CACHE_SHARDS: usize = 8;
+const DIRECT_CLIENT_CACHE_SHARD_CAPACITY: usize = 64;
+// Upper bound for preallocating buffered stream bodies from Content-Length, so a
+// bogus header cannot force one huge allocation before any bytes arrive.
+const MAX_PREALLOCATED_STREAM_BODY_BYTES: usize = 16 * 1024 * 1024;
+
+// Direct upstream clients are reused across requests so their connection
+// pools survive between calls. The cache is split into shards so concurrent
+// requests to different upstream configurations do not contend on one lock,
+// and cache hits only take a shared read lock.
+static DIRECT_CLIENT_CACHE: LazyLock<
+    [RwLock<HashMap<DirectClientKey, reqwest::Client>>; DIRECT_CLIENT_CACHE_SHARDS],
+> = LazyLock::new(|| std::array::from_fn(|_| RwLock::new(HashMap::new())));
 pub(crate) fn format_upstream_request_error(err: &reqwest::Error) -> String {
     let mut kinds = Vec::new();
     if err.is_connect() {
@@ -720,7 +736,7 @@ async fn send_request_inner(
         .map(DirectHttpResponse::Reqwest);
     }
 
-    let client = build_client(
+    let client = direct_client(
         plan.timeouts.as_ref(),
         plan.proxy.as_ref(),
         plan.transport_profile.as_ref(),
@@ -827,13 +843,21 @@ where
     })
 }
 
+fn stream_body_capacity(headers: &HeaderMap) -> usize {
+    headers
+        .get(reqwest::header::CONTENT_LENGTH)
+        .and_then(|value| value.to_str().ok())
+        .and_then(|value| value.trim().parse::<usize>().ok())
+        .map_or(0, |length| length.min(MAX_PREALLOCATED_STREAM_BODY_BYTES))
+}
+
 async fn collect_reqwest_stream_body(
     response: reqwest::Response,
     started_at: Instant,
     first_byte_timeout: Option<Duration>,
 ) -> Result<(Bytes, Option<u64>), ExecutionRuntimeTransportError> {
+    let mut body_bytes = Vec::with_capacity(stream_body_capacity(response.headers()));
     let mut stream = response.bytes_stream();
-    let mut body_bytes = Vec::new();
     let mut first_byte_ms = None;
 
     loop {
@@ -862,8 +886,8 @@ async fn collect_wreq_stream_body(
     started_at: Instant,
     first_byte_timeout: Option<Duration>,
 ) -> Result<(Bytes, Option<u64>), ExecutionRuntimeTransportError> {
+    let mut body_bytes = Vec::with_capacity(stream_body_capacity(response.headers()));
     let mut stream = response.bytes_stream();
-    let mut body_bytes = Vec::new();
     let mut first_byte_ms = None;
 
     loop {
@@ -1078,8 +1102,8 @@ async fn send_relay_request(
 pub(crate) fn build_request_body(
     plan: &ExecutionPlan,
 ) -> Result<Vec<u8>, ExecutionRuntimeTransportError> {
-    let mut body_bytes = if let Some(json_body) = plan.body.json_body.clone() {
-        serde_json::to_vec(&json_body).map_err(ExecutionRuntimeTransportError::BodyEncode)?
+    let mut body_bytes = if let Some(json_body) = plan.body.json_body.as_ref() {
+        serde_json::to_vec(json_body).map_err(ExecutionRuntimeTransportError::BodyEncode)?
     } else if let Some(body_b64) = plan.body.body_bytes_b64.as_deref() {
         base64::engine::general_purpose::STANDARD
             .decode(body_b64)
@@ -1363,6 +1387,10 @@ fn build_client(
         builder,
         &HttpClientConfig {
             connect_timeout_ms: timeouts.and_then(|timeouts| timeouts.connect_ms),
+            // Cached clients multiplex concurrent requests to the same host
+            // over one h2 connection; size stream windows from the observed
+            // BDP so parallel bodies do not stall on the default window.
+            http2_adaptive_window: true,
             ..HttpClientConfig::default()
         },
     );
@@ -1380,6 +1408,75 @@ fn build_client(
         .map_err(ExecutionRuntimeTransportError::ClientBuild)
 }
 
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
+struct DirectClientKey {
+    connect_timeout_ms: Option<u64>,
+    proxy_url: Option<String>,
+    follow_redirects: bool,
+    http1_only: bool,
+    accept_invalid_certs: bool,
+}
+
+impl DirectClientKey {
+    fn shard(&self) -> usize {
+        let mut hasher = DefaultHasher::new();
+        self.hash(&mut hasher);
+        (hasher.finish() as usize) % DIRECT_CLIENT_CACHE_SHARDS
+    }
+}
+
+fn direct_client(
+    timeouts: Option<&aether_contracts::ExecutionTimeouts>,
+    proxy: Option<&ProxySnapshot>,
+    transport_profile: Option<&ResolvedTransportProfile>,
+    transport_controls: ExecutionTransportControls,
+) -> Result<reqwest::Client, ExecutionRuntimeTransportError> {
+    // Fingerprinted profiles may scope their pools per key, so only plain
+    // clients are shared.
+    if transport_profile.is_some_and(|profile| !profile.profile_id.trim().is_empty()) {
+        return build_client(timeouts, proxy, transport_profile, transport_controls);
+    }
+    validate_reqwest_transport_profile(transport_profile)?;
+
+    let key = DirectClientKey {
+        connect_timeout_ms: timeouts.and_then(|timeouts| timeouts.connect_ms),
+        proxy_url: resolve_proxy_url(proxy)?,
+        follow_redirects: transport_controls.follow_redirects == Some(true),
+        http1_only: transport_controls.http1_only
+            || transport_profile_http1_only(transport_profile),
+        accept_invalid_certs: transport_controls.accept_invalid_certs,
+    };
+    cached_direct_client(key, || {
+        build_client(timeouts, proxy, transport_profile, transport_controls)
+    })
+}
+
+fn cached_direct_client(
+    key: DirectClientKey,
+    build: impl FnOnce() -> Result<reqwest::Client, ExecutionRuntimeTransportError>,
+) -> Result<reqwest::Client, ExecutionRuntimeTransportError> {
+    let shard = &DIRECT_CLIENT_CACHE[key.shard()];
+    if let Ok(clients) = shard.read() {
+        if let Some(client) = clients.get(&key) {
+            return Ok(client.clone());
+        }
+    }
+
+    let client = build()?;
+    if let Ok(mut clients) = shard.write() {
+        // Another request may have built the same client while this one
+        // was outside the lock; keep the first so they share a pool.
+        if let Some(existing) = clients.get(&key) {
+            return Ok(existing.clone());
+        }
+        if clients.len() >= DIRECT_CLIENT_CACHE_SHARD_CAPACITY {
+            clients.clear();
+        }
+        clients.insert(key, client.clone());
+    }
+    Ok(client)
+}
+
 pub(crate) fn build_browser_wreq_client(
     timeouts: Option<&aether_contracts::ExecutionTimeouts>,
     proxy: Option<&ProxySnapshot>,
@@ -1778,20 +1875,18 @@ pub(crate) fn decode_response_body_bytes(
 }
 
 pub(crate) fn response_body_is_json(headers: &BTreeMap<String, String>, body_bytes: &[u8]) -> bool {
-    let content_type = headers
-        .get("content-type")
-        .map(|value| value.to_ascii_lowercase())
-        .unwrap_or_default();
+    response_content_type_json_hint(headers)
+        .unwrap_or_else(|| serde_json::from_slice::<Value>(body_bytes).is_ok())
+}
+
+fn response_content_type_json_hint(headers: &BTreeMap<String, String>) -> Option<bool> {
+    let content_type = headers.get("content-type")?.to_ascii_lowercase();
     if content_type.contains("application/connect+json")
         || content_type.contains("application/connect+proto")
     {
-        return false;
+        return Some(false);
     }
-    if content_type.contains("json") {
-        return true;
-    }
-
-    serde_json::from_slice::<Value>(body_bytes).is_ok()
+    content_type.contains("json").then_some(true)
 }
 
 pub(crate) fn build_execution_response_body(
@@ -1820,9 +1915,17 @@ pub(crate) fn build_execution_response_body(
         }));
     }
 
-    if response_body_is_json(headers, decoded_body_bytes) {
-        let body_json: Value = serde_json::from_slice(decoded_body_bytes)
-            .map_err(ExecutionRuntimeTransportError::InvalidJson)?;
+    // Sniffed bodies are parsed once and the value is kept, rather than
+    // validating first and parsing again.
+    let body_json = match response_content_type_json_hint(headers) {
+        Some(true) => Some(
+            serde_json::from_slice::<Value>(decoded_body_bytes)
+                .map_err(ExecutionRuntimeTransportError::InvalidJson)?,
+        ),
+        Some(false) => None,
+        None => serde_json::from_slice::<Value>(decoded_body_bytes).ok(),
+    };
+    if let Some(body_json) = body_json {
         return Ok(Some(ResponseBody {
             json_body: Some(body_json),
             body_bytes_b64: None,
@@ -1862,12 +1965,14 @@ mod tests {
 
     use super::{
         build_browser_wreq_client, build_client, build_direct_tunnel_request_meta,
-        build_execution_response_body, build_request_headers, execute_sync_plan,
-        record_manual_proxy_request_failure, record_manual_proxy_request_outcome,
-        record_manual_proxy_request_success, record_manual_proxy_stream_error,
-        resolve_execution_transport_controls, resolve_non_stream_total_timeout,
-        resolve_stream_first_byte_timeout, response_body_is_json, DirectSyncExecutionRuntime,
-        ExecutionRuntimeTransportError, ExecutionTransportControls,
+        build_execution_response_body, build_request_headers, cached_direct_client, direct_client,
+        execute_sync_plan, record_manual_proxy_request_failure,
+        record_manual_proxy_request_outcome, record_manual_proxy_request_success,
+        record_manual_proxy_stream_error, resolve_execution_transport_controls,
+        resolve_non_stream_total_timeout, resolve_stream_first_byte_timeout, response_body_is_json,
+        stream_body_capacity, DirectClientKey, DirectSyncExecutionRuntime,
+        ExecutionRuntimeTransportError, ExecutionTransportControls, DIRECT_CLIENT_CACHE,
+        MAX_PREALLOCATED_STREAM_BODY_BYTES,
     };
     use crate::constants::{
         EXECUTION_RUNTIME_LOOP_GUARD_HEADER, EXECUTION_RUNTIME_LOOP_GUARD_VIA_TOKEN,
@@ -1954,6 +2059,56 @@ mod tests {
         }
     }
 
+    #[test]
+    fn direct_client_reuses_cached_client_for_identical_configuration() {
+        let timeouts = ExecutionTimeouts {
+            connect_ms: Some(7_321),
+            ..ExecutionTimeouts::default()
+        };
+        let key = DirectClientKey {
+            connect_timeout_ms: Some(7_321),
+            proxy_url: None,
+            follow_redirects: false,
+            http1_only: false,
+            accept_invalid_certs: false,
+        };
+
+        direct_client(
+            Some(&timeouts),
+            None,
+            None,
+            ExecutionTransportControls::default(),
+        )
+        .expect("client should build");
+
+        assert!(DIRECT_CLIENT_CACHE[key.shard()]
+            .read()
+            .expect("client cache should lock")
+            .contains_key(&key));
+
+        let builds = Cell::new(0);
+        let counted_build = || {
+            builds.set(builds.get() + 1);
+            build_client(
+                Some(&timeouts),
+                None,
+                None,
+                ExecutionTransportControls::default(),
+            )
+        };
+        cached_direct_client(key.clone(), counted_build).expect("cached client should be returned");
+        assert_eq!(builds.get(), 0);
+
+        let uncached_key = DirectClientKey {
+            connect_timeout_ms: Some(7_322),
+            ..key
+        };
+        cached_direct_client(uncached_key.clone(), counted_build).expect("client should build");
+        cached_direct_client(uncached_key, counted_build)
+            .expect("cached client should be returned");
+        assert_eq!(builds.get(), 1);
+    }
+
     #[test]
     fn direct_sync_execution_runtime_strips_accept_invalid_certs_control_header() {
         let headers = BTreeMap::from([
@@ -1975,6 +2130,33 @@ mod tests {
             .is_none());
     }
 
+    #[test]
+    fn stream_body_capacity_uses_bounded_content_length() {
+        let mut headers = reqwest::header::HeaderMap::new();
+        assert_eq!(stream_body_capacity(&headers), 0);
+
+        headers.insert(
+            reqwest::header::CONTENT_LENGTH,
+            reqwest::header::HeaderValue::from_static("4096"),
+        );
+        assert_eq!(stream_body_capacity(&headers), 4096);
+
+        headers.insert(
+            reqwest::header::CONTENT_LENGTH,
+            reqwest::header::HeaderValue::from_static("99999999999"),
+        );
+        assert_eq!(
+            stream_body_capacity(&headers),
+            MAX_PREALLOCATED_STREAM_BODY_BYTES
+        );
+
+        headers.insert(
+            reqwest::header::CONTENT_LENGTH,
+            reqwest::header::HeaderValue::from_static("not-a-number"),
+        );
+        assert_eq!(stream_body_capacity(&headers), 0);
+    }
+
     #[test]
     fn tunnel_request_meta_uses_total_timeout_for_non_stream_requests() {
         let plan = tunnel_timeout_plan(false);
@@ -3660,6 +3842,25 @@ mod tests {
         assert!(body.body_bytes_b64.is_none());
     }
 
+    #[test]
+    fn untyped_response_body_is_sniffed_as_json_or_kept_as_bytes() {
+        let headers = BTreeMap::from([("content-type".to_string(), "text/plain".to_string())]);
+
+        let json_body = br#"{"status":"processing"}"#;
+        let body = build_execution_response_body(&headers, json_body, json_body, false)
+            .expect("body should build")
+            .expect("body should be present");
+        assert_eq!(body.json_body, Some(json!({"status": "processing"})));
+        assert!(body.body_bytes_b64.is_none());
+
+        let text_body = b"processing";
+        let body = build_execution_response_body(&headers, text_body, text_body, false)
+            .expect("body should build")
+            .expect("body should be present");
+        assert!(body.json_body.is_none());
+        assert!(body.body_bytes_b64.is_some());
+    }
+
     #[tokio::test]
     async fn direct_sync_execution_runtime_compresses_json_body_when_requested() {
         let listener = crate::test_support::bind_loopback_listener()
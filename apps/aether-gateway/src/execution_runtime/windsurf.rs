@@ -1514,6 +1514,20 @@ async fn sync_windsurf_user_status_with_panel(ls: &LsHandle, api_key: &str) {
     }
 }
 
+// Shared across calls so cascade polling reuses keep-alive connections to the
+// local language servers instead of reconnecting on every unary request.
+fn windsurf_ls_client() -> Result<&'static reqwest::Client, ExecutionRuntimeTransportError> {
+    static CLIENT: OnceLock<reqwest::Client> = OnceLock::new();
+    if let Some(client) = CLIENT.get() {
+        return Ok(client);
+    }
+    let client = reqwest::Client::builder()
+        .http1_only()
+        .build()
+        .map_err(ExecutionRuntimeTransportError::ClientBuild)?;
+    Ok(CLIENT.get_or_init(|| client))
+}
+
 async fn windsurf_grpc_unary(
     port: u16,
     csrf_token: &str,
@@ -1522,13 +1536,9 @@ async fn windsurf_grpc_unary(
     timeout: Duration,
 ) -> Result<Vec<u8>, ExecutionRuntimeTransportError> {
     let url = format!("http://127.0.0.1:{port}{LS_SERVICE}/{method}");
-    let client = reqwest::Client::builder()
-        .http1_only()
-        .timeout(timeout)
-        .build()
-        .map_err(ExecutionRuntimeTransportError::ClientBuild)?;
-    let response = client
+    let response = windsurf_ls_client()?
         .post(url)
+        .timeout(timeout)
         .header("content-type", "application/proto")
         .header("connect-protocol-version", "1")
         .header("user-agent", "connect-es/1.5.0")
@@ -131,7 +131,7 @@ async fn resolve_admin_provider_oauth_batch_import_tokens(
             ),
         };
         let executor = crate::oauth::GatewayOAuthHttpExecutor::new(*state);
-        let result = ProviderOAuthService::with_builtin_adapters()
+        let result = ProviderOAuthService::builtin()
             .import_credentials(
                 &executor,
                 &ctx,
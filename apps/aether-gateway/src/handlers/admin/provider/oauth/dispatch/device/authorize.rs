@@ -236,17 +236,16 @@ pub(super) async fn handle_admin_provider_oauth_device_authorize(
                 request_proxy.clone(),
             ),
         };
-        let mut authorization = match ProviderOAuthService::with_builtin_adapters()
-            .build_authorize_url(&ctx, &session_id, None)
-        {
-            Ok(authorization) => authorization,
-            Err(error) => {
-                return Ok(build_internal_control_error_response(
-                    http::StatusCode::BAD_REQUEST,
-                    format!("Windsurf 授权 URL 构建失败: {error}"),
-                ));
-            }
-        };
+        let mut authorization =
+            match ProviderOAuthService::builtin().build_authorize_url(&ctx, &session_id, None) {
+                Ok(authorization) => authorization,
+                Err(error) => {
+                    return Ok(build_internal_control_error_response(
+                        http::StatusCode::BAD_REQUEST,
+                        format!("Windsurf 授权 URL 构建失败: {error}"),
+                    ));
+                }
+            };
         authorization.authorize_url =
             build_windsurf_authorization_url(&authorization.authorize_url, &login_option);
         let now_unix_secs = current_unix_secs();
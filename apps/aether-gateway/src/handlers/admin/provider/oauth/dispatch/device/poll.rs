@@ -857,7 +857,7 @@ async fn handle_admin_provider_oauth_windsurf_browser_device_poll(
         ),
     };
     let executor = crate::oauth::GatewayOAuthHttpExecutor::new(*state);
-    let result = match ProviderOAuthService::with_builtin_adapters()
+    let result = match ProviderOAuthService::builtin()
         .import_credentials(
             &executor,
             &ctx,
@@ -346,7 +346,7 @@ async fn resolve_admin_provider_oauth_windsurf_single_import_tokens(
         ),
     };
     let executor = crate::oauth::GatewayOAuthHttpExecutor::new(*state);
-    let service = ProviderOAuthService::with_builtin_adapters();
+    let service = ProviderOAuthService::builtin();
     let result = service
         .import_credentials(
             &executor,
@@ -137,11 +137,11 @@ pub(crate) fn normalize_string_id_list(values: Option<Vec<String>>) -> Option<Ve
 }
 
 pub(crate) fn provider_type_supports_quota_refresh(provider_type: &str) -> bool {
-    ProviderPoolService::with_builtin_adapters().supports_quota_refresh(provider_type)
+    ProviderPoolService::builtin().supports_quota_refresh(provider_type)
 }
 
 pub(crate) fn unsupported_provider_quota_refresh_message(provider_type: &str) -> String {
-    ProviderPoolService::with_builtin_adapters().quota_refresh_unsupported_message(provider_type)
+    ProviderPoolService::builtin().quota_refresh_unsupported_message(provider_type)
 }
 
 pub(crate) fn provider_quota_refresh_endpoint_for_provider(
@@ -149,7 +149,7 @@ pub(crate) fn provider_quota_refresh_endpoint_for_provider(
     endpoints: &[StoredProviderCatalogEndpoint],
     include_inactive: bool,
 ) -> Option<StoredProviderCatalogEndpoint> {
-    ProviderPoolService::with_builtin_adapters().quota_refresh_endpoint_for_provider(
+    ProviderPoolService::builtin().quota_refresh_endpoint_for_provider(
         provider_type,
         endpoints,
         include_inactive,
@@ -157,8 +157,7 @@ pub(crate) fn provider_quota_refresh_endpoint_for_provider(
 }
 
 pub(crate) fn provider_quota_refresh_missing_endpoint_message(provider_type: &str) -> String {
-    ProviderPoolService::with_builtin_adapters()
-        .quota_refresh_missing_endpoint_message(provider_type)
+    ProviderPoolService::builtin().quota_refresh_missing_endpoint_message(provider_type)
 }
 
 pub(super) fn coerce_json_u64(value: &serde_json::Value) -> Option<u64> {
@@ -39,7 +39,7 @@ fn build_provider_oauth_authorization_url(
         key_config: None,
         network: aether_oauth::network::OAuthNetworkContext::provider_operation(None),
     };
-    ProviderOAuthService::with_builtin_adapters()
+    ProviderOAuthService::builtin()
         .build_authorize_url(&ctx, nonce, code_challenge)
         .ok()
         .map(|response| response.authorize_url)
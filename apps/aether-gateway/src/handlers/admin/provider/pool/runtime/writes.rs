@@ -8,8 +8,9 @@ use crate::handlers::admin::provider::shared::support::{
     AdminProviderPoolUnschedulableRule,
 };
 use aether_runtime_state::RuntimeState;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use std::collections::BTreeMap;
+use std::sync::LazyLock;
 use std::time::{SystemTime, UNIX_EPOCH};
 use tracing::warn;
 use uuid::Uuid;
@@ -54,6 +55,43 @@ const FORBIDDEN_ACCOUNT_PATTERNS: &[&str] = &[
     "access denied",
 ];
 
+static ACCOUNT_DISABLE_PATTERN_SET: LazyLock<ErrorPatternSet> =
+    LazyLock::new(|| ErrorPatternSet::new(ACCOUNT_DISABLE_PATTERNS));
+static WORKSPACE_DISABLE_PATTERN_SET: LazyLock<ErrorPatternSet> =
+    LazyLock::new(|| ErrorPatternSet::new(WORKSPACE_DISABLE_PATTERNS));
+static FORBIDDEN_ACCOUNT_PATTERN_SET: LazyLock<ErrorPatternSet> =
+    LazyLock::new(|| ErrorPatternSet::new(FORBIDDEN_ACCOUNT_PATTERNS));
+
+// Literal error indicators compiled into one automaton, so each error
+// message is scanned once instead of once per indicator.
+struct ErrorPatternSet {
+    patterns: &'static [&'static str],
+    set: RegexSet,
+}
+
+impl ErrorPatternSet {
+    fn new(patterns: &'static [&'static str]) -> Self {
+        Self {
+            patterns,
+            set: RegexSet::new(patterns.iter().map(|pattern| regex::escape(pattern)))
+                .expect("escaped error patterns should compile"),
+        }
+    }
+
+    fn is_match(&self, error_message: &str) -> bool {
+        self.set.is_match(error_message)
+    }
+
+    /// Returns the earliest listed pattern contained in the message.
+    fn first_match(&self, error_message: &str) -> Option<&'static str> {
+        self.set
+            .matches(error_message)
+            .iter()
+            .next()
+            .map(|index| self.patterns[index])
+    }
+}
+
 fn current_unix_secs_f64() -> f64 {
     SystemTime::now()
         .duration_since(UNIX_EPOCH)
@@ -227,35 +265,22 @@ pub(crate) fn admin_provider_pool_key_terminal_error_reason(
     error_body: Option<&str>,
 ) -> Option<String> {
     let error_message = extract_error_message(error_body).to_ascii_lowercase();
-    if let Some(pattern) = WORKSPACE_DISABLE_PATTERNS
-        .iter()
-        .find(|pattern| error_message.contains(**pattern))
-    {
+    if let Some(pattern) = WORKSPACE_DISABLE_PATTERN_SET.first_match(&error_message) {
         return Some(format!("workspace_deactivated_{status_code}:{pattern}"));
     }
 
     match status_code {
-        401 if ACCOUNT_DISABLE_PATTERNS
-            .iter()
-            .any(|pattern| error_message.contains(pattern)) =>
-        {
+        401 if ACCOUNT_DISABLE_PATTERN_SET.is_match(&error_message) => {
             Some("account_deactivated_401".to_string())
         }
         402 => Some("payment_required_402".to_string()),
-        403 if FORBIDDEN_ACCOUNT_PATTERNS
-            .iter()
-            .any(|pattern| error_message.contains(pattern)) =>
-        {
+        403 if FORBIDDEN_ACCOUNT_PATTERN_SET.is_match(&error_message) => {
             Some("forbidden_403".to_string())
         }
-        400 => ACCOUNT_DISABLE_PATTERNS
-            .iter()
-            .find(|pattern| error_message.contains(**pattern))
+        400 => ACCOUNT_DISABLE_PATTERN_SET
+            .first_match(&error_message)
             .map(|pattern| format!("account_disabled_400:{pattern}")),
-        423 if FORBIDDEN_ACCOUNT_PATTERNS
-            .iter()
-            .any(|pattern| error_message.contains(pattern)) =>
-        {
+        423 if FORBIDDEN_ACCOUNT_PATTERN_SET.is_match(&error_message) => {
             Some("account_locked_423".to_string())
         }
         _ => None,
@@ -455,10 +480,7 @@ pub(crate) async fn record_admin_provider_pool_error(
     }
 
     if status_code == 403 {
-        if FORBIDDEN_ACCOUNT_PATTERNS
-            .iter()
-            .any(|pattern| error_message.contains(pattern))
-        {
+        if FORBIDDEN_ACCOUNT_PATTERN_SET.is_match(&error_message) {
             spawn_remove_pool_active_probe_member(runtime, provider_id, key_id);
             return;
         }
@@ -766,6 +788,20 @@ mod tests {
         );
     }
 
+    #[test]
+    fn terminal_error_reason_reports_first_listed_account_disable_pattern() {
+        assert_eq!(
+            admin_provider_pool_key_terminal_error_reason(
+                400,
+                Some(
+                    r#"{"error":{"message":"account disabled because organization has been disabled"}}"#
+                ),
+            )
+            .as_deref(),
+            Some("account_disabled_400:organization has been disabled")
+        );
+    }
+
     #[test]
     fn terminal_error_reason_detects_account_ban_errors() {
         assert_eq!(
@@ -349,12 +349,8 @@ fn endpoint_matches_fixed_provider_template(
         || api_format_matches(&endpoint.api_format, endpoint_template.api_format)
 }
 
-fn normalize_api_format_alias(value: &str) -> String {
-    crate::ai_serving::normalize_api_format_alias(value)
-}
-
 fn api_format_matches(left: &str, right: &str) -> bool {
-    normalize_api_format_alias(left) == normalize_api_format_alias(right)
+    crate::ai_serving::api_format_alias_matches(left, right)
 }
 
 fn fixed_provider_endpoint_metadata(
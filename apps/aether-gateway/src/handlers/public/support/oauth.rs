@@ -297,7 +297,7 @@ async fn handle_oauth_callback(
         network,
     };
     let executor = crate::oauth::GatewayOAuthHttpExecutor::from_app(state);
-    let service = IdentityOAuthService::with_builtin_providers();
+    let service = IdentityOAuthService::builtin();
     let claims = match service.login(&executor, &config, &exchange_ctx).await {
         Ok(outcome) => outcome.claims,
         Err(err) => {
@@ -426,8 +426,7 @@ async fn start_identity_oauth(
         code_challenge: Some(code_challenge),
         network,
     };
-    let authorize = match IdentityOAuthService::with_builtin_providers().start(&config, &start_ctx)
-    {
+    let authorize = match IdentityOAuthService::builtin().start(&config, &start_ctx) {
         Ok(value) => value,
         Err(_) => {
             return build_auth_error_response(
@@ -142,10 +142,26 @@ pub(crate) fn ip_rules_allow(rules: Option<&[String]>, remote_ip: IpAddr) -> boo
     let Some(rules) = rules else {
         return true;
     };
-    if rules.is_empty() {
+    ip_rule_strs_allow(rules.iter().map(String::as_str), remote_ip)
+}
+
+pub(crate) fn json_ip_rules_allow(value: Option<&Value>, remote_ip: IpAddr) -> bool {
+    let Some(value) = value else {
+        return true;
+    };
+    if value.is_null() {
         return true;
     }
+    let Some(items) = value.as_array() else {
+        return false;
+    };
+    if !items.iter().all(Value::is_string) {
+        return false;
+    }
+    ip_rule_strs_allow(items.iter().filter_map(Value::as_str), remote_ip)
+}
 
+fn ip_rule_strs_allow<'a>(rules: impl IntoIterator<Item = &'a str>, remote_ip: IpAddr) -> bool {
     let mut has_allow_rule = false;
     let mut matched_allow_rule = false;
     for raw in rules {
@@ -176,26 +192,6 @@ pub(crate) fn ip_rules_allow(rules: Option<&[String]>, remote_ip: IpAddr) -> boo
     }
 }
 
-pub(crate) fn json_ip_rules_allow(value: Option<&Value>, remote_ip: IpAddr) -> bool {
-    let Some(value) = value else {
-        return true;
-    };
-    if value.is_null() {
-        return true;
-    }
-    let Some(items) = value.as_array() else {
-        return false;
-    };
-    let mut rules = Vec::with_capacity(items.len());
-    for item in items {
-        let Some(rule) = item.as_str() else {
-            return false;
-        };
-        rules.push(rule.to_string());
-    }
-    ip_rules_allow(Some(&rules), remote_ip)
-}
-
 fn normalize_ip_rule(raw: &str) -> Result<String, String> {
     if raw.is_empty() {
         return Err("IP 限制规则不能为空".to_string());
@@ -298,15 +294,17 @@ fn ipv4_wildcard_matches(pattern: &str, remote_ip: IpAddr) -> bool {
     let IpAddr::V4(remote_ip) = remote_ip else {
         return false;
     };
-    if !valid_ipv4_wildcard_pattern(pattern) {
+    if !pattern.contains('*') {
         return false;
     }
-    pattern
-        .split('.')
-        .zip(remote_ip.octets())
-        .all(|(pattern_part, remote_part)| {
-            pattern_part == "*" || pattern_part.parse::<u8>() == Ok(remote_part)
-        })
+    // Validate and match in one pass: a malformed octet never equals the
+    // remote octet, and the trailing check rejects more than four parts.
+    let mut parts = pattern.split('.');
+    remote_ip.octets().iter().all(|octet| match parts.next() {
+        Some("*") => true,
+        Some(part) => part.parse::<u8>() == Ok(*octet),
+        None => false,
+    }) && parts.next().is_none()
 }
 
 pub(crate) fn deserialize_optional_json_patch<'de, D>(
@@ -490,6 +488,16 @@ mod tests {
         assert!(ip_rules_allow(Some(&rules), v4(203, 0, 113, 10)));
     }
 
+    #[test]
+    fn ip_rules_allow_ignores_malformed_wildcard_rules() {
+        for rule in ["10.*.0", "10.*.0.1.5", "10.*.0.300", "10.*.x.1"] {
+            let rules = vec![rule.to_string()];
+            assert!(!ip_rules_allow(Some(&rules), v4(10, 0, 0, 1)), "{rule}");
+        }
+        let rules = vec!["10.*.0.1".to_string()];
+        assert!(ip_rules_allow(Some(&rules), v4(10, 42, 0, 1)));
+    }
+
     #[test]
     fn parse_json_ip_rules_normalizes_empty_and_string_arrays() {
         assert_eq!(
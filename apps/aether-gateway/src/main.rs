@@ -420,6 +420,18 @@ impl GatewayDataArgs {
         match self.effective_encryption_key() {
             Some(value) => {
                 warm_python_fernet_secret(&value);
+                // Legacy ciphertexts are retried with these keys; derive them
+                // now so the first fallback decrypt does not run PBKDF2 on a
+                // request worker.
+                for env_key in ["AETHER_GATEWAY_DATA_ENCRYPTION_KEY", "ENCRYPTION_KEY"] {
+                    let Ok(fallback) = std::env::var(env_key) else {
+                        continue;
+                    };
+                    let fallback = fallback.trim();
+                    if !fallback.is_empty() && fallback != value {
+                        warm_python_fernet_secret(fallback);
+                    }
+                }
                 config.with_encryption_key(value)
             }
             None => config,
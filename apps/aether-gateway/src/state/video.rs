@@ -98,12 +98,12 @@ impl AppState {
             .map_err(|err| GatewayError::Internal(err.to_string()))
     }
 
-    pub(crate) async fn update_active_video_task(
+    pub(crate) async fn update_active_video_tasks(
         &self,
-        task: UpsertVideoTask,
-    ) -> Result<Option<StoredVideoTask>, GatewayError> {
+        tasks: Vec<UpsertVideoTask>,
+    ) -> Result<Vec<StoredVideoTask>, GatewayError> {
         self.data
-            .update_active_video_task(task)
+            .update_active_video_tasks(tasks)
             .await
             .map_err(|err| GatewayError::Internal(err.to_string()))
     }
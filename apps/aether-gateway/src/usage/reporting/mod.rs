@@ -144,8 +144,9 @@ pub(crate) async fn submit_sync_report(
 }
 
 pub(crate) fn spawn_sync_report(state: AppState, payload: GatewaySyncReportRequest) {
-    let report_request_id_for_log =
-        short_request_id(report_request_id(payload.report_context.as_ref()));
+    // Only the failure log needs the shortened id, so keep the raw id and
+    // format it there instead of on every submitted report.
+    let report_request_id_for_log = report_request_id(payload.report_context.as_ref()).to_owned();
     spawn_fire_and_forget(TASK_KEY_USAGE_SYNC_REPORT, async move {
         let trace_id = payload.trace_id.clone();
         if let Err(err) = submit_sync_report(&state, payload).await {
@@ -154,7 +155,7 @@ pub(crate) fn spawn_sync_report(state: AppState, payload: GatewaySyncReportReque
                 log_type = "ops",
                 trace_id = %trace_id,
                 report_scope = "sync",
-                report_request_id = %report_request_id_for_log,
+                report_request_id = %short_request_id(&report_request_id_for_log),
                 error = ?err,
                 "gateway failed to submit sync execution report"
             );
@@ -308,9 +308,9 @@ fn rust_authoritative_service_builds_gemini_read_refresh_plan() {
 }
 
 #[test]
-fn rust_authoritative_service_builds_poll_refresh_batch_for_active_tasks_only() {
+fn rust_authoritative_service_builds_poll_refresh_plan_for_active_snapshots_only() {
     let service = VideoTaskService::new(VideoTaskTruthSourceMode::RustAuthoritative);
-    service.record_snapshot(LocalVideoTaskSnapshot::OpenAi(OpenAiVideoTaskSeed {
+    let active = LocalVideoTaskSnapshot::OpenAi(OpenAiVideoTaskSeed {
         local_task_id: "task-active-123".to_string(),
         upstream_task_id: "ext-video-task-123".to_string(),
         created_at_unix_ms: 1712345678,
@@ -330,8 +330,8 @@ fn rust_authoritative_service_builds_poll_refresh_batch_for_active_tasks_only()
         video_url: None,
         persistence: sample_persistence("openai:video"),
         transport: sample_transport("https://api.openai.example", "openai:video"),
-    }));
-    service.record_snapshot(LocalVideoTaskSnapshot::OpenAi(OpenAiVideoTaskSeed {
+    });
+    let completed = LocalVideoTaskSnapshot::OpenAi(OpenAiVideoTaskSeed {
         local_task_id: "task-completed-123".to_string(),
         upstream_task_id: "ext-video-task-999".to_string(),
         created_at_unix_ms: 1712345678,
@@ -351,16 +351,20 @@ fn rust_authoritative_service_builds_poll_refresh_batch_for_active_tasks_only()
         video_url: Some("https://cdn.example.com/ext-video-task-999.mp4".to_string()),
         persistence: sample_persistence("openai:video"),
         transport: sample_transport("https://api.openai.example", "openai:video"),
-    }));
+    });
 
-    let batch = service.prepare_poll_refresh_batch(10, "trace-poller");
+    let refresh = service
+        .prepare_poll_refresh_plan_for_snapshot(&active, "trace-poller-0")
+        .expect("active task should build a poll refresh plan");
 
-    assert_eq!(batch.len(), 1);
-    assert_eq!(batch[0].plan.method, "GET");
+    assert_eq!(refresh.plan.method, "GET");
     assert_eq!(
-        batch[0].plan.url,
+        refresh.plan.url,
         "https://api.openai.example/v1/videos/ext-video-task-123"
     );
+    assert!(service
+        .prepare_poll_refresh_plan_for_snapshot(&completed, "trace-poller-1")
+        .is_none());
 }
 
 #[test]
@@ -2190,28 +2190,28 @@ pub fn admin_usage_build_curl_command(
 
 fn summarize_admin_usage_stats(usage: &[StoredRequestUsageAudit]) -> StoredUsageAuditSummary {
     let aggregate = aggregate_usage_stats(usage);
-    StoredUsageAuditSummary {
+    let mut summary = StoredUsageAuditSummary {
         total_requests: aggregate.total_requests,
-        input_tokens: usage.iter().map(|item| item.input_tokens).sum(),
-        output_tokens: usage.iter().map(|item| item.output_tokens).sum(),
         recorded_total_tokens: aggregate.total_tokens,
-        cache_creation_tokens: usage.iter().map(admin_usage_cache_creation_tokens).sum(),
-        cache_creation_ephemeral_5m_tokens: usage
-            .iter()
-            .map(|item| item.cache_creation_ephemeral_5m_input_tokens)
-            .sum(),
-        cache_creation_ephemeral_1h_tokens: usage
-            .iter()
-            .map(|item| item.cache_creation_ephemeral_1h_input_tokens)
-            .sum(),
-        cache_read_tokens: usage.iter().map(|item| item.cache_read_input_tokens).sum(),
         total_cost_usd: aggregate.total_cost,
         actual_total_cost_usd: aggregate.actual_total_cost,
-        cache_creation_cost_usd: usage.iter().map(|item| item.cache_creation_cost_usd).sum(),
-        cache_read_cost_usd: usage.iter().map(|item| item.cache_read_cost_usd).sum(),
         total_response_time_ms: aggregate.total_response_time_ms,
         error_requests: aggregate.error_requests,
-    }
+        ..StoredUsageAuditSummary::default()
+    };
+    // Accumulate the remaining token and cost totals in one pass instead of
+    // re-walking the usage slice once per field.
+    for item in usage {
+        summary.input_tokens += item.input_tokens;
+        summary.output_tokens += item.output_tokens;
+        summary.cache_creation_tokens += admin_usage_cache_creation_tokens(item);
+        summary.cache_creation_ephemeral_5m_tokens += item.cache_creation_ephemeral_5m_input_tokens;
+        summary.cache_creation_ephemeral_1h_tokens += item.cache_creation_ephemeral_1h_input_tokens;
+        summary.cache_read_tokens += item.cache_read_input_tokens;
+        summary.cache_creation_cost_usd += item.cache_creation_cost_usd;
+        summary.cache_read_cost_usd += item.cache_read_cost_usd;
+    }
+    summary
 }
 
 pub fn build_admin_usage_summary_stats_response_from_summary(
@@ -241,8 +241,9 @@ pub use aether_ai_formats::formats::conversion::response::{
     convert_openai_responses_response_to_openai_chat, OpenAiResponsesResponseUsage,
 };
 pub use aether_ai_formats::{
-    api_format_alias_matches, api_format_storage_aliases, is_openai_responses_compact_format,
-    is_openai_responses_family_format, is_openai_responses_format, normalize_api_format_alias,
+    api_format_alias_matches, api_format_storage_aliases, fold_ascii_case,
+    is_openai_responses_compact_format, is_openai_responses_family_format,
+    is_openai_responses_format, normalize_api_format_alias,
 };
 pub use aether_ai_formats::{
     canonical_request_unknown_block_count, canonical_response_unknown_block_count,
@@ -1,6 +1,6 @@
 //! Format identity and aliases.
 
-use std::{fmt, str::FromStr};
+use std::{borrow::Cow, fmt, str::FromStr};
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq, PartialOrd, Ord, Hash)]
 pub enum FormatFamily {
@@ -93,7 +93,7 @@ impl FromStr for FormatId {
     type Err = ();
 
     fn from_str(value: &str) -> Result<Self, Self::Err> {
-        match value.trim().to_ascii_lowercase().as_str() {
+        match fold_ascii_case(value.trim()).as_ref() {
             "openai" | "openai:chat" | "/v1/chat/completions" => Ok(Self::OpenAiChat),
             "openai:responses" | "/v1/responses" => Ok(Self::OpenAiResponses),
             "openai:responses:compact" | "/v1/responses/compact" => {
@@ -119,14 +119,39 @@ impl FromStr for FormatId {
 }
 
 pub fn normalize_api_format_alias(value: &str) -> String {
-    let normalized = value.trim().to_ascii_lowercase();
-    FormatId::parse(&normalized)
-        .map(|format| format.as_str().to_string())
-        .unwrap_or(normalized)
+    match FormatId::parse(value) {
+        Some(format) => format.as_str().to_string(),
+        None => value.trim().to_ascii_lowercase(),
+    }
+}
+
+/// ASCII-lowercases `value`, borrowing it unchanged when it has no uppercase
+/// letters. Stored and routed identifiers are almost always lowercase already,
+/// so this skips the allocation `to_ascii_lowercase` would make.
+pub fn fold_ascii_case(value: &str) -> Cow<'_, str> {
+    if value.bytes().any(|byte| byte.is_ascii_uppercase()) {
+        Cow::Owned(value.to_ascii_lowercase())
+    } else {
+        Cow::Borrowed(value)
+    }
 }
 
 pub fn api_format_alias_matches(left: &str, right: &str) -> bool {
-    normalize_api_format_alias(left) == normalize_api_format_alias(right)
+    api_format_alias_matches_parsed(left, FormatId::parse(right), right)
+}
+
+/// Same as [`api_format_alias_matches`] for callers that match many
+/// candidates against one format and have already parsed it.
+pub fn api_format_alias_matches_parsed(
+    candidate: &str,
+    parsed: Option<FormatId>,
+    raw: &str,
+) -> bool {
+    match (FormatId::parse(candidate), parsed) {
+        (Some(candidate), Some(parsed)) => candidate == parsed,
+        (None, None) => candidate.trim().eq_ignore_ascii_case(raw.trim()),
+        _ => false,
+    }
 }
 
 pub fn api_format_storage_aliases(value: &str) -> Vec<String> {
@@ -140,17 +165,17 @@ pub fn api_format_storage_aliases(value: &str) -> Vec<String> {
 }
 
 pub fn is_openai_responses_format(value: &str) -> bool {
-    normalize_api_format_alias(value) == "openai:responses"
+    FormatId::parse(value) == Some(FormatId::OpenAiResponses)
 }
 
 pub fn is_openai_responses_compact_format(value: &str) -> bool {
-    normalize_api_format_alias(value) == "openai:responses:compact"
+    FormatId::parse(value) == Some(FormatId::OpenAiResponsesCompact)
 }
 
 pub fn is_openai_responses_family_format(value: &str) -> bool {
     matches!(
-        normalize_api_format_alias(value).as_str(),
-        "openai:responses" | "openai:responses:compact"
+        FormatId::parse(value),
+        Some(FormatId::OpenAiResponses | FormatId::OpenAiResponsesCompact)
     )
 }
 
@@ -163,9 +188,13 @@ pub fn api_format_uses_body_stream_field(value: &str) -> bool {
 
 #[cfg(test)]
 mod tests {
+    use std::borrow::Cow;
+
     use super::{
-        api_format_alias_matches, api_format_storage_aliases, api_format_uses_body_stream_field,
-        normalize_api_format_alias, FormatId,
+        api_format_alias_matches, api_format_alias_matches_parsed, api_format_storage_aliases,
+        api_format_uses_body_stream_field, fold_ascii_case, is_openai_responses_compact_format,
+        is_openai_responses_family_format, is_openai_responses_format, normalize_api_format_alias,
+        FormatId,
     };
 
     #[test]
@@ -313,6 +342,49 @@ mod tests {
         );
     }
 
+    #[test]
+    fn folds_ascii_case_only_when_needed() {
+        assert!(matches!(
+            fold_ascii_case("openai:chat"),
+            Cow::Borrowed("openai:chat")
+        ));
+        assert_eq!(fold_ascii_case("OpenAI:Chat"), "openai:chat");
+    }
+
+    #[test]
+    fn matches_api_format_aliases_without_normalizing() {
+        assert!(api_format_alias_matches(
+            " OpenAI:Responses ",
+            "openai:responses"
+        ));
+        assert!(api_format_alias_matches("Custom:Format", " custom:format "));
+        assert!(!api_format_alias_matches("custom:format", "openai:chat"));
+        assert!(api_format_alias_matches_parsed(
+            " OpenAI:Responses ",
+            FormatId::parse("openai:responses"),
+            "openai:responses"
+        ));
+        assert!(api_format_alias_matches_parsed(
+            "Custom:Format",
+            None,
+            " custom:format "
+        ));
+        assert!(!api_format_alias_matches_parsed(
+            "custom:format",
+            FormatId::parse("openai:chat"),
+            "openai:chat"
+        ));
+        assert!(is_openai_responses_format(" OPENAI:RESPONSES "));
+        assert!(!is_openai_responses_format("openai:responses:compact"));
+        assert!(is_openai_responses_compact_format(
+            "OpenAI:Responses:Compact"
+        ));
+        assert!(is_openai_responses_family_format(
+            "openai:responses:compact"
+        ));
+        assert!(!is_openai_responses_family_format("openai:chat"));
+    }
+
     #[test]
     fn storage_aliases_only_include_normalized_value() {
         assert_eq!(
@@ -1,6 +1,6 @@
 use crate::{
     api_format_alias_matches,
-    formats::id::{is_openai_responses_compact_format, normalize_api_format_alias},
+    formats::id::{is_openai_responses_compact_format, FormatId},
 };
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -46,41 +46,48 @@ const EMBEDDING_CANDIDATE_API_FORMATS: &[&str] = &[
 ];
 const RERANK_CANDIDATE_API_FORMATS: &[&str] = &["openai:rerank", "jina:rerank"];
 
+/// Resolves an API format alias to its interned canonical name.
+///
+/// Every format this matrix distinguishes is a `FormatId`, so unknown formats
+/// can be rejected up front instead of normalizing them into a fresh string.
+fn known_api_format(api_format: &str) -> Option<&'static str> {
+    FormatId::parse(api_format).map(FormatId::as_str)
+}
+
 pub fn request_candidate_api_format_preference(
     client_api_format: &str,
     provider_api_format: &str,
 ) -> Option<(u8, u8)> {
-    let client_api_format = normalize_api_format_alias(client_api_format);
-    let provider_api_format = normalize_api_format_alias(provider_api_format);
+    let client_api_format = known_api_format(client_api_format)?;
+    let provider_api_format = known_api_format(provider_api_format)?;
 
     if client_api_format == "openai:responses:compact" {
         return (provider_api_format == "openai:responses:compact").then_some((0, 0));
     }
-    if is_embedding_api_format(client_api_format.as_str()) {
-        return is_embedding_api_format(provider_api_format.as_str()).then_some((
+    if is_embedding_api_format(client_api_format) {
+        return is_embedding_api_format(provider_api_format).then_some((
             if client_api_format == provider_api_format {
                 0
             } else {
                 1
             },
-            embedding_api_format_priority(provider_api_format.as_str()),
+            embedding_api_format_priority(provider_api_format),
         ));
     }
-    if is_rerank_api_format(client_api_format.as_str()) {
-        return is_rerank_api_format(provider_api_format.as_str()).then_some((
+    if is_rerank_api_format(client_api_format) {
+        return is_rerank_api_format(provider_api_format).then_some((
             if client_api_format == provider_api_format {
                 0
             } else {
                 1
             },
-            rerank_api_format_priority(provider_api_format.as_str()),
+            rerank_api_format_priority(provider_api_format),
         ));
     }
 
-    let (client_family, client_kind) =
-        parse_non_compact_standard_api_format(client_api_format.as_str())?;
+    let (client_family, client_kind) = parse_non_compact_standard_api_format(client_api_format)?;
     let (provider_family, provider_kind) =
-        parse_non_compact_standard_api_format(provider_api_format.as_str())?;
+        parse_non_compact_standard_api_format(provider_api_format)?;
     let preference_bucket = if client_api_format == provider_api_format {
         0
     } else if client_kind == provider_kind {
@@ -93,7 +100,7 @@ pub fn request_candidate_api_format_preference(
 
     Some((
         preference_bucket,
-        standard_api_format_priority(provider_api_format.as_str()),
+        standard_api_format_priority(provider_api_format),
     ))
 }
 
@@ -101,33 +108,35 @@ pub fn request_candidate_api_formats(
     client_api_format: &str,
     _require_streaming: bool,
 ) -> Vec<&'static str> {
-    let client_api_format = normalize_api_format_alias(client_api_format);
+    let Some(client_api_format) = known_api_format(client_api_format) else {
+        return Vec::new();
+    };
     if client_api_format == "openai:responses:compact" {
         return vec!["openai:responses:compact"];
     }
-    if is_embedding_api_format(client_api_format.as_str()) {
+    if is_embedding_api_format(client_api_format) {
         let mut candidate_api_formats = EMBEDDING_CANDIDATE_API_FORMATS.to_vec();
         candidate_api_formats.sort_by_key(|provider_api_format| {
-            request_candidate_api_format_preference(client_api_format.as_str(), provider_api_format)
+            request_candidate_api_format_preference(client_api_format, provider_api_format)
                 .unwrap_or((u8::MAX, u8::MAX))
         });
         return candidate_api_formats;
     }
-    if is_rerank_api_format(client_api_format.as_str()) {
+    if is_rerank_api_format(client_api_format) {
         let mut candidate_api_formats = RERANK_CANDIDATE_API_FORMATS.to_vec();
         candidate_api_formats.sort_by_key(|provider_api_format| {
-            request_candidate_api_format_preference(client_api_format.as_str(), provider_api_format)
+            request_candidate_api_format_preference(client_api_format, provider_api_format)
                 .unwrap_or((u8::MAX, u8::MAX))
         });
         return candidate_api_formats;
     }
-    if parse_non_compact_standard_api_format(client_api_format.as_str()).is_none() {
+    if parse_non_compact_standard_api_format(client_api_format).is_none() {
         return Vec::new();
     }
 
     let mut candidate_api_formats = NON_COMPACT_STANDARD_CANDIDATE_API_FORMATS.to_vec();
     candidate_api_formats.sort_by_key(|provider_api_format| {
-        request_candidate_api_format_preference(client_api_format.as_str(), provider_api_format)
+        request_candidate_api_format_preference(client_api_format, provider_api_format)
             .unwrap_or((u8::MAX, u8::MAX))
     });
     candidate_api_formats
@@ -137,23 +146,21 @@ pub fn request_conversion_kind(
     client_api_format: &str,
     provider_api_format: &str,
 ) -> Option<RequestConversionKind> {
-    let client_api_format = normalize_api_format_alias(client_api_format);
-    let provider_api_format = normalize_api_format_alias(provider_api_format);
+    let client_api_format = known_api_format(client_api_format)?;
+    let provider_api_format = known_api_format(provider_api_format)?;
     if client_api_format == provider_api_format {
         return None;
     }
-    if !is_standard_api_format(client_api_format.as_str())
-        || !is_standard_api_format(provider_api_format.as_str())
-    {
+    if !is_standard_api_format(client_api_format) || !is_standard_api_format(provider_api_format) {
         return None;
     }
-    if is_openai_responses_compact_format(client_api_format.as_str())
-        || is_openai_responses_compact_format(provider_api_format.as_str())
+    if is_openai_responses_compact_format(client_api_format)
+        || is_openai_responses_compact_format(provider_api_format)
     {
         return None;
     }
 
-    match provider_api_format.as_str() {
+    match provider_api_format {
         "openai:chat" => Some(RequestConversionKind::ToOpenAIChat),
         "openai:responses" => Some(RequestConversionKind::ToOpenAiResponses),
         "claude:messages" => Some(RequestConversionKind::ToClaudeStandard),
@@ -166,16 +173,16 @@ pub fn sync_chat_response_conversion_kind(
     provider_api_format: &str,
     client_api_format: &str,
 ) -> Option<SyncChatResponseConversionKind> {
-    let provider_api_format = normalize_api_format_alias(provider_api_format);
-    let client_api_format = normalize_api_format_alias(client_api_format);
+    let provider_api_format = known_api_format(provider_api_format)?;
+    let client_api_format = known_api_format(client_api_format)?;
     if provider_api_format == client_api_format {
         return None;
     }
-    if !is_standard_api_format(provider_api_format.as_str()) {
+    if !is_standard_api_format(provider_api_format) {
         return None;
     }
-    request_conversion_kind(client_api_format.as_str(), provider_api_format.as_str())?;
-    match client_api_format.as_str() {
+    request_conversion_kind(client_api_format, provider_api_format)?;
+    match client_api_format {
         "openai:chat" => Some(SyncChatResponseConversionKind::ToOpenAIChat),
         "claude:messages" => Some(SyncChatResponseConversionKind::ToClaudeChat),
         "gemini:generate_content" => Some(SyncChatResponseConversionKind::ToGeminiChat),
@@ -187,18 +194,18 @@ pub fn sync_cli_response_conversion_kind(
     provider_api_format: &str,
     client_api_format: &str,
 ) -> Option<SyncCliResponseConversionKind> {
-    let provider_api_format = normalize_api_format_alias(provider_api_format);
-    let client_api_format = normalize_api_format_alias(client_api_format);
+    let provider_api_format = known_api_format(provider_api_format)?;
+    let client_api_format = known_api_format(client_api_format)?;
     if provider_api_format == client_api_format {
         return None;
     }
-    if !is_standard_api_format(provider_api_format.as_str()) {
+    if !is_standard_api_format(provider_api_format) {
         return None;
     }
-    if !is_openai_responses_compact_format(client_api_format.as_str()) {
-        request_conversion_kind(client_api_format.as_str(), provider_api_format.as_str())?;
+    if !is_openai_responses_compact_format(client_api_format) {
+        request_conversion_kind(client_api_format, provider_api_format)?;
     }
-    match client_api_format.as_str() {
+    match client_api_format {
         "openai:responses" | "openai:responses:compact" => {
             Some(SyncCliResponseConversionKind::ToOpenAiResponses)
         }
@@ -212,11 +219,9 @@ pub fn request_conversion_requires_enable_flag(
     client_api_format: &str,
     provider_api_format: &str,
 ) -> bool {
-    let client_api_format = normalize_api_format_alias(client_api_format);
-    let provider_api_format = normalize_api_format_alias(provider_api_format);
     match (
-        api_data_format_id(client_api_format.as_str()),
-        api_data_format_id(provider_api_format.as_str()),
+        api_data_format_id(client_api_format),
+        api_data_format_id(provider_api_format),
     ) {
         (Some(client_data_format), Some(provider_data_format)) => {
             client_data_format != provider_data_format
@@ -227,57 +232,63 @@ pub fn request_conversion_requires_enable_flag(
 
 pub fn is_standard_api_format(api_format: &str) -> bool {
     matches!(
-        normalize_api_format_alias(api_format).as_str(),
-        "openai:chat"
-            | "openai:responses"
-            | "openai:responses:compact"
-            | "claude:messages"
-            | "gemini:generate_content"
+        known_api_format(api_format),
+        Some(
+            "openai:chat"
+                | "openai:responses"
+                | "openai:responses:compact"
+                | "claude:messages"
+                | "gemini:generate_content"
+        )
     )
 }
 
 pub fn is_embedding_api_format(api_format: &str) -> bool {
     matches!(
-        normalize_api_format_alias(api_format).as_str(),
-        "openai:embedding"
-            | "gemini:embedding"
-            | "jina:embedding"
-            | "doubao:embedding"
-            | "aliyun:multimodal_embedding"
+        known_api_format(api_format),
+        Some(
+            "openai:embedding"
+                | "gemini:embedding"
+                | "jina:embedding"
+                | "doubao:embedding"
+                | "aliyun:multimodal_embedding"
+        )
     )
 }
 
 pub fn is_rerank_api_format(api_format: &str) -> bool {
     matches!(
-        normalize_api_format_alias(api_format).as_str(),
-        "openai:rerank" | "jina:rerank"
+        known_api_format(api_format),
+        Some("openai:rerank" | "jina:rerank")
     )
 }
 
 pub fn parse_non_compact_standard_api_format(
     api_format: &str,
 ) -> Option<(&'static str, &'static str)> {
-    match normalize_api_format_alias(api_format).as_str() {
-        "openai:chat" => Some(("openai", "chat")),
-        "openai:responses" => Some(("openai", "responses")),
-        "claude:messages" => Some(("claude", "messages")),
-        "gemini:generate_content" => Some(("gemini", "generate_content")),
+    match known_api_format(api_format) {
+        Some("openai:chat") => Some(("openai", "chat")),
+        Some("openai:responses") => Some(("openai", "responses")),
+        Some("claude:messages") => Some(("claude", "messages")),
+        Some("gemini:generate_content") => Some(("gemini", "generate_content")),
         _ => None,
     }
 }
 
 pub fn api_data_format_id(api_format: &str) -> Option<&'static str> {
-    match normalize_api_format_alias(api_format).as_str() {
-        "claude:messages" => Some("claude"),
-        "gemini:generate_content" => Some("gemini"),
-        "openai:chat" => Some("openai_chat"),
-        "openai:responses" | "openai:responses:compact" => Some("openai_responses"),
-        "openai:embedding"
-        | "gemini:embedding"
-        | "jina:embedding"
-        | "doubao:embedding"
-        | "aliyun:multimodal_embedding" => Some("embedding"),
-        "openai:rerank" | "jina:rerank" => Some("rerank"),
+    match known_api_format(api_format) {
+        Some("claude:messages") => Some("claude"),
+        Some("gemini:generate_content") => Some("gemini"),
+        Some("openai:chat") => Some("openai_chat"),
+        Some("openai:responses" | "openai:responses:compact") => Some("openai_responses"),
+        Some(
+            "openai:embedding"
+            | "gemini:embedding"
+            | "jina:embedding"
+            | "doubao:embedding"
+            | "aliyun:multimodal_embedding",
+        ) => Some("embedding"),
+        Some("openai:rerank" | "jina:rerank") => Some("rerank"),
         _ => None,
     }
 }
@@ -287,26 +298,32 @@ pub fn normalized_same_standard_api_format(left: &str, right: &str) -> bool {
 }
 
 fn standard_api_format_priority(api_format: &str) -> u8 {
-    let api_format = normalize_api_format_alias(api_format);
-    STANDARD_API_FORMAT_ORDER
-        .iter()
-        .position(|candidate| *candidate == api_format)
+    known_api_format(api_format)
+        .and_then(|api_format| {
+            STANDARD_API_FORMAT_ORDER
+                .iter()
+                .position(|candidate| *candidate == api_format)
+        })
         .unwrap_or(STANDARD_API_FORMAT_ORDER.len()) as u8
 }
 
 fn embedding_api_format_priority(api_format: &str) -> u8 {
-    let api_format = normalize_api_format_alias(api_format);
-    EMBEDDING_CANDIDATE_API_FORMATS
-        .iter()
-        .position(|candidate| *candidate == api_format)
+    known_api_format(api_format)
+        .and_then(|api_format| {
+            EMBEDDING_CANDIDATE_API_FORMATS
+                .iter()
+                .position(|candidate| *candidate == api_format)
+        })
         .unwrap_or(EMBEDDING_CANDIDATE_API_FORMATS.len()) as u8
 }
 
 fn rerank_api_format_priority(api_format: &str) -> u8 {
-    let api_format = normalize_api_format_alias(api_format);
-    RERANK_CANDIDATE_API_FORMATS
-        .iter()
-        .position(|candidate| *candidate == api_format)
+    known_api_format(api_format)
+        .and_then(|api_format| {
+            RERANK_CANDIDATE_API_FORMATS
+                .iter()
+                .position(|candidate| *candidate == api_format)
+        })
         .unwrap_or(RERANK_CANDIDATE_API_FORMATS.len()) as u8
 }
 
@@ -13,7 +13,7 @@ pub mod shared;
 
 pub use context::{FormatContext, FormatError};
 pub use id::{
-    api_format_alias_matches, api_format_storage_aliases, is_openai_responses_compact_format,
-    is_openai_responses_family_format, is_openai_responses_format, normalize_api_format_alias,
-    FormatFamily, FormatId, FormatProfile,
+    api_format_alias_matches, api_format_alias_matches_parsed, api_format_storage_aliases,
+    fold_ascii_case, is_openai_responses_compact_format, is_openai_responses_family_format,
+    is_openai_responses_format, normalize_api_format_alias, FormatFamily, FormatId, FormatProfile,
 };
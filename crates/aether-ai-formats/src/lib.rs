@@ -11,9 +11,10 @@ pub use formats::context::{
     FormatError,
 };
 pub use formats::id::{
-    api_format_alias_matches, api_format_storage_aliases, api_format_uses_body_stream_field,
-    is_openai_responses_compact_format, is_openai_responses_family_format,
-    is_openai_responses_format, normalize_api_format_alias, FormatFamily, FormatId, FormatProfile,
+    api_format_alias_matches, api_format_alias_matches_parsed, api_format_storage_aliases,
+    api_format_uses_body_stream_field, fold_ascii_case, is_openai_responses_compact_format,
+    is_openai_responses_family_format, is_openai_responses_format, normalize_api_format_alias,
+    FormatFamily, FormatId, FormatProfile,
 };
 pub use formats::matrix::{
     is_embedding_api_format, is_rerank_api_format, request_candidate_api_format_preference,
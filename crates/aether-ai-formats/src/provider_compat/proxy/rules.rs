@@ -1,6 +1,6 @@
 use std::{
-    collections::{BTreeMap, HashSet},
-    sync::OnceLock,
+    collections::{BTreeMap, HashMap, HashSet},
+    sync::{Mutex, OnceLock},
 };
 
 use regex::{Regex, RegexBuilder};
@@ -12,7 +12,12 @@ const ITEM_EXACT: &str = "$item";
 const CONDITION_SOURCES: &[&str] = &["body", "request_headers", "headers", "original", "current"];
 const CONDITION_TYPE_VALUES: &[&str] = &["string", "number", "boolean", "array", "object", "null"];
 
+// Rule patterns come from provider config and are re-evaluated for every request (and every
+// wildcard item), so compiled patterns are cached. Invalid patterns are cached as `None`.
+const MAX_CACHED_RULE_REGEXES: usize = 256;
+
 static RANGE_RE: OnceLock<Regex> = OnceLock::new();
+static RULE_REGEX_CACHE: OnceLock<Mutex<HashMap<(u8, String), Option<Regex>>>> = OnceLock::new();
 
 #[derive(Clone, Copy)]
 enum ConditionHeaders<'a> {
@@ -532,7 +537,7 @@ fn condition_is_locally_supported(condition: &Value) -> bool {
             .and_then(Value::as_str)
             .is_some_and(|value| {
                 if op == "matches" {
-                    Regex::new(value).is_ok()
+                    compile_regex(value, "").is_some()
                 } else {
                     true
                 }
@@ -642,9 +647,7 @@ fn evaluate_local_condition(
             .as_str()
             .zip(expected.and_then(Value::as_str))
             .is_some_and(|(current, expected)| {
-                Regex::new(expected)
-                    .map(|pattern| pattern.is_match(current))
-                    .unwrap_or(false)
+                compile_regex(expected, "").is_some_and(|pattern| pattern.is_match(current))
             }),
         "in" => expected
             .and_then(Value::as_array)
@@ -1125,22 +1128,35 @@ fn resolve_item_condition(condition: &Value, item_path_prefix: &str) -> Value {
 }
 
 fn compile_regex(pattern: &str, flags: &str) -> Option<Regex> {
-    let mut builder = RegexBuilder::new(pattern);
-    for flag in flags.chars() {
-        match flag {
-            'i' => {
-                builder.case_insensitive(true);
-            }
-            'm' => {
-                builder.multi_line(true);
-            }
-            's' => {
-                builder.dot_matches_new_line(true);
-            }
-            _ => {}
+    const CASE_INSENSITIVE: u8 = 1;
+    const MULTI_LINE: u8 = 1 << 1;
+    const DOT_MATCHES_NEW_LINE: u8 = 1 << 2;
+
+    let flag_bits = flags.chars().fold(0u8, |bits, flag| match flag {
+        'i' => bits | CASE_INSENSITIVE,
+        'm' => bits | MULTI_LINE,
+        's' => bits | DOT_MATCHES_NEW_LINE,
+        _ => bits,
+    });
+    let key = (flag_bits, pattern.to_string());
+    let cache = RULE_REGEX_CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    if let Some(cached) = cache.lock().ok().and_then(|cache| cache.get(&key).cloned()) {
+        return cached;
+    }
+
+    let compiled = RegexBuilder::new(pattern)
+        .case_insensitive(flag_bits & CASE_INSENSITIVE != 0)
+        .multi_line(flag_bits & MULTI_LINE != 0)
+        .dot_matches_new_line(flag_bits & DOT_MATCHES_NEW_LINE != 0)
+        .build()
+        .ok();
+    if let Ok(mut cache) = cache.lock() {
+        if cache.len() >= MAX_CACHED_RULE_REGEXES {
+            cache.clear();
         }
+        cache.insert(key, compiled.clone());
     }
-    builder.build().ok()
+    compiled
 }
 
 fn parse_insert_index(value: &Value) -> Option<isize> {
@@ -1333,9 +1349,22 @@ mod tests {
         apply_local_body_rules, apply_local_body_rules_with_request_headers,
         apply_local_header_rules, apply_local_header_rules_with_request_headers,
         body_rules_are_locally_supported, body_rules_handle_path, body_rules_have_enabled_rules,
-        header_rules_are_locally_supported, header_rules_have_enabled_rules,
+        compile_regex, header_rules_are_locally_supported, header_rules_have_enabled_rules,
     };
 
+    #[test]
+    fn compiled_rule_regexes_are_cached_per_pattern_and_flags() {
+        let sensitive = compile_regex("^abc$", "").expect("valid pattern");
+        let insensitive = compile_regex("^abc$", "i").expect("valid pattern");
+        assert!(!sensitive.is_match("ABC"));
+        assert!(insensitive.is_match("ABC"));
+        assert!(!compile_regex("^abc$", "")
+            .expect("cached pattern")
+            .is_match("ABC"));
+        assert!(compile_regex("(", "").is_none());
+        assert!(compile_regex("(", "").is_none());
+    }
+
     #[test]
     fn header_rules_allow_simple_set_drop_and_rename() {
         let rules = serde_json::json!([
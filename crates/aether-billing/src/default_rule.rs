@@ -24,11 +24,11 @@ impl DefaultBillingRuleGenerator {
         task_type: &str,
     ) -> Option<VirtualBillingRule> {
         let pricing_config = pricing.effective_tiered_pricing();
-        let tiers = pricing
-            .effective_tiered_pricing()
+        let price_per_request = pricing.effective_price_per_request();
+        let tiers: &[Value] = pricing_config
             .and_then(|value| value.get("tiers"))
             .and_then(Value::as_array)
-            .cloned()
+            .map(Vec::as_slice)
             .unwrap_or_default();
         let explicit_image_output_price_default =
             explicit_image_output_price_default(pricing_config);
@@ -41,21 +41,18 @@ impl DefaultBillingRuleGenerator {
             || has_image_output_ranges
             || explicit_image_output_price_default.is_some();
 
-        if tiers.is_empty()
-            && pricing.effective_price_per_request().is_none()
-            && !has_image_output_pricing
-        {
+        if tiers.is_empty() && price_per_request.is_none() && !has_image_output_pricing {
             return None;
         }
 
-        let first_tier = tiers.first().cloned().unwrap_or_else(|| json!({}));
-        let base_input_price = tier_value(&first_tier, "input_price_per_1m", 0.0);
-        let base_output_price = tier_value(&first_tier, "output_price_per_1m", 0.0);
+        let first_tier = tiers.first().unwrap_or(&Value::Null);
+        let base_input_price = tier_value(first_tier, "input_price_per_1m", 0.0);
+        let base_output_price = tier_value(first_tier, "output_price_per_1m", 0.0);
         let base_cache_creation_price =
-            tier_value_with_fallback(&first_tier, "cache_creation_price_per_1m", 1.25);
+            tier_value_with_fallback(first_tier, "cache_creation_price_per_1m", 1.25);
         let base_cache_read_price =
-            tier_value_with_fallback(&first_tier, "cache_read_price_per_1m", 0.1);
-        let base_request_price = pricing.effective_price_per_request().unwrap_or(0.0);
+            tier_value_with_fallback(first_tier, "cache_read_price_per_1m", 0.1);
+        let base_request_price = price_per_request.unwrap_or(0.0);
 
         let mut variables = BTreeMap::new();
         variables.insert("input_price_per_1m".to_string(), json!(base_input_price));
@@ -171,7 +168,7 @@ impl DefaultBillingRuleGenerator {
                     "source": "tiered",
                     "tier_key": "total_input_context",
                     "allow_zero": true,
-                    "tiers": build_tier_entries(&tiers, "input_price_per_1m", None, false),
+                    "tiers": build_tier_entries(tiers, "input_price_per_1m", None, false),
                     "default": base_input_price,
                 }),
             );
@@ -181,7 +178,7 @@ impl DefaultBillingRuleGenerator {
                     "source": "tiered",
                     "tier_key": "total_input_context",
                     "allow_zero": true,
-                    "tiers": build_tier_entries(&tiers, "output_price_per_1m", None, false),
+                    "tiers": build_tier_entries(tiers, "output_price_per_1m", None, false),
                     "default": base_output_price,
                 }),
             );
@@ -193,7 +190,7 @@ impl DefaultBillingRuleGenerator {
                     "allow_zero": true,
                     "ttl_key": "cache_ttl_minutes",
                     "ttl_value_key": "cache_creation_price_per_1m",
-                    "tiers": build_tier_entries(&tiers, "cache_creation_price_per_1m", Some(1.25), true),
+                    "tiers": build_tier_entries(tiers, "cache_creation_price_per_1m", Some(1.25), true),
                     "default": base_cache_creation_price,
                 }),
             );
@@ -205,7 +202,7 @@ impl DefaultBillingRuleGenerator {
                     "allow_zero": true,
                     "ttl_key": "cache_creation_ephemeral_5m_ttl_minutes",
                     "ttl_value_key": "cache_creation_price_per_1m",
-                    "tiers": build_tier_entries(&tiers, "cache_creation_price_per_1m", Some(1.25), true),
+                    "tiers": build_tier_entries(tiers, "cache_creation_price_per_1m", Some(1.25), true),
                     "default": base_cache_creation_price,
                 }),
             );
@@ -217,7 +214,7 @@ impl DefaultBillingRuleGenerator {
                     "allow_zero": true,
                     "ttl_key": "cache_creation_ephemeral_1h_ttl_minutes",
                     "ttl_value_key": "cache_creation_price_per_1m",
-                    "tiers": build_tier_entries(&tiers, "cache_creation_price_per_1m", Some(1.25), true),
+                    "tiers": build_tier_entries(tiers, "cache_creation_price_per_1m", Some(1.25), true),
                     "default": base_cache_creation_price,
                 }),
             );
@@ -229,7 +226,7 @@ impl DefaultBillingRuleGenerator {
                     "allow_zero": true,
                     "ttl_key": "cache_ttl_minutes",
                     "ttl_value_key": "cache_read_price_per_1m",
-                    "tiers": build_tier_entries(&tiers, "cache_read_price_per_1m", Some(0.1), true),
+                    "tiers": build_tier_entries(tiers, "cache_read_price_per_1m", Some(0.1), true),
                     "default": base_cache_read_price,
                 }),
             );
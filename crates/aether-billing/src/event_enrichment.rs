@@ -10,6 +10,7 @@ use crate::{
 };
 
 const SETTLEMENT_SNAPSHOT_SCHEMA_VERSION: &str = "3.0";
+static BILLING_SERVICE: BillingService = BillingService::new();
 
 #[async_trait]
 pub trait BillingModelContextLookup: Send + Sync {
@@ -76,7 +77,8 @@ pub async fn enrich_usage_event_with_billing(
     }
 
     let mut first_no_rule = None;
-    for lookup_name in billing_model_lookup_names(&event.data) {
+    let lookup_names = billing_model_lookup_names(&event.data);
+    for lookup_name in lookup_names.iter().flatten().copied() {
         let Some(context) = data
             .find_billing_model_context(
                 provider_id,
@@ -107,18 +109,17 @@ pub async fn enrich_usage_event_with_billing(
     Ok(())
 }
 
-fn billing_model_lookup_names(data: &aether_usage_runtime::UsageEventData) -> Vec<&str> {
-    let mut names = Vec::new();
-    for value in [data.target_model.as_deref(), Some(data.model.as_str())]
-        .into_iter()
-        .flatten()
-    {
-        let value = value.trim();
-        if !value.is_empty() && !names.contains(&value) {
-            names.push(value);
-        }
-    }
-    names
+// At most two names are ever tried (target model, then model), so return them
+// in a fixed-size array rather than collecting a Vec for every event.
+fn billing_model_lookup_names(data: &aether_usage_runtime::UsageEventData) -> [Option<&str>; 2] {
+    let target_model = data
+        .target_model
+        .as_deref()
+        .map(str::trim)
+        .filter(|value| !value.is_empty());
+    let model =
+        Some(data.model.trim()).filter(|value| !value.is_empty() && Some(*value) != target_model);
+    [target_model, model]
 }
 
 fn calculate_billing_computation(
@@ -175,11 +176,9 @@ fn calculate_billing_computation(
         cache_ttl_minutes: pricing.provider_api_key_cache_ttl_minutes,
     };
 
-    BillingService::new()
-        .calculate(pricing, &input)
-        .map_err(|err| {
-            DataLayerError::UnexpectedValue(format!("billing calculation failed: {err}"))
-        })
+    BILLING_SERVICE.calculate(pricing, &input).map_err(|err| {
+        DataLayerError::UnexpectedValue(format!("billing calculation failed: {err}"))
+    })
 }
 
 fn usage_event_is_image_usage(data: &aether_usage_runtime::UsageEventData) -> bool {
@@ -308,11 +307,12 @@ fn merge_billing_snapshot_metadata(
     })?;
     let settlement_snapshot = build_settlement_snapshot(
         pricing,
-        snapshot,
+        &billing_snapshot,
         actual_total_cost,
         rate_multiplier,
         is_free_tier,
     );
+    let billing_dimensions = snapshot_field(&billing_snapshot, "resolved_dimensions");
 
     let mut metadata = match request_metadata.take() {
         Some(Value::Object(object)) => object,
@@ -324,19 +324,18 @@ fn merge_billing_snapshot_metadata(
         Value::from(SETTLEMENT_SNAPSHOT_SCHEMA_VERSION),
     );
     metadata.insert("settlement_snapshot".to_string(), settlement_snapshot);
-    metadata.insert(
-        "billing_dimensions".to_string(),
-        Value::Object(snapshot.resolved_dimensions.clone().into_iter().collect()),
-    );
+    metadata.insert("billing_dimensions".to_string(), billing_dimensions);
     metadata.insert("rate_multiplier".to_string(), Value::from(rate_multiplier));
     metadata.insert("is_free_tier".to_string(), Value::from(is_free_tier));
     *request_metadata = Some(Value::Object(metadata));
     Ok(())
 }
 
+// Settlement fields are copied out of the already-serialized billing snapshot
+// so the dimension, variable and breakdown maps are only converted to JSON once.
 fn build_settlement_snapshot(
     pricing: &BillingModelPricingSnapshot,
-    snapshot: &crate::BillingSnapshot,
+    billing_snapshot: &Value,
     actual_total_cost: f64,
     rate_multiplier: f64,
     is_free_tier: bool,
@@ -358,22 +357,26 @@ fn build_settlement_snapshot(
             "is_free_tier": is_free_tier,
         },
         "billing_plan_snapshot": {
-            "rule_id": snapshot.rule_id.clone(),
-            "rule_name": snapshot.rule_name.clone(),
-            "scope": snapshot.scope.clone(),
-            "expression": snapshot.expression.clone(),
-            "engine_version": snapshot.engine_version.clone(),
+            "rule_id": snapshot_field(billing_snapshot, "rule_id"),
+            "rule_name": snapshot_field(billing_snapshot, "rule_name"),
+            "scope": snapshot_field(billing_snapshot, "scope"),
+            "expression": snapshot_field(billing_snapshot, "expression"),
+            "engine_version": snapshot_field(billing_snapshot, "engine_version"),
         },
-        "resolved_dimensions": snapshot.resolved_dimensions.clone(),
-        "resolved_variables": snapshot.resolved_variables.clone(),
-        "cost_breakdown": snapshot.cost_breakdown.clone(),
-        "total_cost": snapshot.total_cost,
+        "resolved_dimensions": snapshot_field(billing_snapshot, "resolved_dimensions"),
+        "resolved_variables": snapshot_field(billing_snapshot, "resolved_variables"),
+        "cost_breakdown": snapshot_field(billing_snapshot, "cost_breakdown"),
+        "total_cost": snapshot_field(billing_snapshot, "total_cost"),
         "actual_total_cost": actual_total_cost,
-        "status": snapshot.status,
-        "calculated_at": snapshot.calculated_at.clone(),
+        "status": snapshot_field(billing_snapshot, "status"),
+        "calculated_at": snapshot_field(billing_snapshot, "calculated_at"),
     })
 }
 
+fn snapshot_field(billing_snapshot: &Value, key: &str) -> Value {
+    billing_snapshot.get(key).cloned().unwrap_or(Value::Null)
+}
+
 #[cfg(test)]
 mod tests {
     use aether_data_contracts::repository::billing::StoredBillingModelContext;
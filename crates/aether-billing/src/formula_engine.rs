@@ -1,4 +1,5 @@
-use std::collections::{BTreeMap, BTreeSet};
+use std::collections::{BTreeMap, BTreeSet, HashMap};
+use std::sync::{Arc, LazyLock, RwLock};
 
 use thiserror::Error;
 
@@ -54,7 +55,7 @@ impl Default for FormulaEngine {
 }
 
 impl FormulaEngine {
-    pub fn new() -> Self {
+    pub const fn new() -> Self {
         Self
     }
 
@@ -66,8 +67,26 @@ impl FormulaEngine {
         dimension_mappings: Option<&BTreeMap<String, serde_json::Value>>,
         strict_mode: bool,
     ) -> Result<FormulaEvaluationResult, ExpressionEvaluationError> {
-        let dims = dimensions.cloned().unwrap_or_default();
-        let mut resolved = variables.cloned().unwrap_or_default();
+        self.evaluate_owned(
+            expression,
+            variables.cloned().unwrap_or_default(),
+            dimensions.cloned().unwrap_or_default(),
+            dimension_mappings,
+            strict_mode,
+        )
+    }
+
+    /// Like [`FormulaEngine::evaluate`], but moves caller-built maps instead of cloning them.
+    pub fn evaluate_owned(
+        &self,
+        expression: &str,
+        variables: BTreeMap<String, serde_json::Value>,
+        dimensions: BTreeMap<String, serde_json::Value>,
+        dimension_mappings: Option<&BTreeMap<String, serde_json::Value>>,
+        strict_mode: bool,
+    ) -> Result<FormulaEvaluationResult, ExpressionEvaluationError> {
+        let dims = dimensions;
+        let mut resolved = variables;
         let mut missing_required = Vec::new();
         let mut tier_index = None;
         let mut tier_info = None;
@@ -109,11 +128,10 @@ impl FormulaEngine {
                 let mut progressed = false;
                 let names: Vec<String> = unresolved.keys().cloned().collect();
                 for var_name in names {
-                    let mapping = match unresolved.get(&var_name).cloned() {
-                        Some(value) => value,
-                        None => continue,
+                    let Some(mapping) = unresolved.get(&var_name) else {
+                        continue;
                     };
-                    let (status, value) = try_resolve_computed(&mapping, &dims, &resolved)?;
+                    let (status, value) = try_resolve_computed(mapping, &dims, &resolved)?;
                     match status {
                         ComputedStatus::Pending => {}
                         ComputedStatus::MissingRequired => {
@@ -202,17 +220,7 @@ impl FormulaEngine {
 }
 
 pub fn extract_variable_names(expression: &str) -> Result<BTreeSet<String>, UnsafeExpressionError> {
-    let tokens = tokenize(expression)?;
-    let mut names = BTreeSet::new();
-    for index in 0..tokens.len() {
-        if let Token::Identifier(name) = &tokens[index] {
-            if matches!(tokens.get(index + 1), Some(Token::LeftParen)) {
-                continue;
-            }
-            names.insert(name.clone());
-        }
-    }
-    Ok(names)
+    Ok(compile_expression(expression)?.variable_names.clone())
 }
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -232,10 +240,14 @@ fn try_resolve_computed(
         .get("required")
         .and_then(|v| v.as_bool())
         .unwrap_or(false);
-    let default = mapping
-        .get("default")
-        .cloned()
-        .unwrap_or_else(|| serde_json::json!(0));
+    // The default is only needed when the expression cannot be evaluated, so
+    // successful computations skip cloning it.
+    let default = || {
+        mapping
+            .get("default")
+            .cloned()
+            .unwrap_or_else(|| serde_json::json!(0))
+    };
     let expr = mapping
         .get("expression")
         .or_else(|| mapping.get("transform_expression"))
@@ -248,32 +260,35 @@ fn try_resolve_computed(
             } else {
                 ComputedStatus::Defaulted
             },
-            default,
+            default(),
         ));
     }
 
-    let needed = extract_variable_names(expr)
+    let compiled = compile_expression(expr)
         .map_err(|err| ExpressionEvaluationError::Failed(err.to_string()))?;
-    let env: BTreeMap<String, serde_json::Value> = dims
+    let scope = VariableScope {
+        primary: resolved,
+        fallback: Some(dims),
+    };
+    if compiled
+        .variable_names
         .iter()
-        .map(|(k, v)| (k.clone(), v.clone()))
-        .chain(resolved.iter().map(|(k, v)| (k.clone(), v.clone())))
-        .collect();
-    if needed.iter().any(|name| !env.contains_key(name)) {
+        .any(|name| !scope.contains(name))
+    {
         return Ok((
             if required {
                 ComputedStatus::Pending
             } else {
                 ComputedStatus::Defaulted
             },
-            default,
+            default(),
         ));
     }
 
-    match evaluate_expression(expr, &env) {
+    match compiled.evaluate(scope) {
         Ok(value) => Ok((ComputedStatus::Ok, serde_json::json!(value))),
         Err(err) if required => Err(ExpressionEvaluationError::Failed(err.to_string())),
-        Err(_) => Ok((ComputedStatus::Defaulted, default)),
+        Err(_) => Ok((ComputedStatus::Defaulted, default())),
     }
 }
 
@@ -446,8 +461,9 @@ fn is_zero_like(value: &serde_json::Value) -> bool {
     as_f64(value).map(|number| number == 0.0).unwrap_or(false)
 }
 
+// serde_json already widens integer numbers, so no i64 fallback is needed.
 fn as_f64(value: &serde_json::Value) -> Option<f64> {
-    value.as_f64().or_else(|| value.as_i64().map(|v| v as f64))
+    value.as_f64()
 }
 
 #[derive(Debug, Clone, PartialEq)]
@@ -548,87 +564,212 @@ fn tokenize(input: &str) -> Result<Vec<Token>, UnsafeExpressionError> {
     Ok(tokens)
 }
 
-fn evaluate_expression(
-    expression: &str,
-    variables: &BTreeMap<String, serde_json::Value>,
-) -> Result<f64, UnsafeExpressionError> {
+const MAX_COMPILED_EXPRESSIONS: usize = 512;
+
+static COMPILED_EXPRESSION_CACHE: LazyLock<RwLock<HashMap<String, Arc<CompiledExpression>>>> =
+    LazyLock::new(|| RwLock::new(HashMap::new()));
+
+/// An expression tokenized and parsed once, then evaluated against any
+/// variable set. Parse failures are kept so they still surface at evaluation
+/// time, matching the behaviour of the uncompiled evaluator.
+#[derive(Debug)]
+struct CompiledExpression {
+    variable_names: BTreeSet<String>,
+    program: Result<ExpressionNode, String>,
+}
+
+impl CompiledExpression {
+    fn evaluate(&self, scope: VariableScope<'_>) -> Result<f64, UnsafeExpressionError> {
+        match &self.program {
+            Ok(node) => node.evaluate(scope),
+            Err(message) => Err(UnsafeExpressionError::Unsupported(message.clone())),
+        }
+    }
+}
+
+/// Variable lookup over resolved values with the raw dimensions as a
+/// fallback, so computed mappings never have to merge both maps.
+#[derive(Debug, Clone, Copy)]
+struct VariableScope<'a> {
+    primary: &'a BTreeMap<String, serde_json::Value>,
+    fallback: Option<&'a BTreeMap<String, serde_json::Value>>,
+}
+
+impl<'a> VariableScope<'a> {
+    fn get(&self, name: &str) -> Option<&'a serde_json::Value> {
+        self.primary
+            .get(name)
+            .or_else(|| self.fallback.and_then(|fallback| fallback.get(name)))
+    }
+
+    fn contains(&self, name: &str) -> bool {
+        self.get(name).is_some()
+    }
+}
+
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum BinaryOperator {
+    Add,
+    Subtract,
+    Multiply,
+    Divide,
+    FloorDivide,
+    Remainder,
+    Power,
+}
+
+#[derive(Debug, Clone, PartialEq)]
+enum ExpressionNode {
+    Number(f64),
+    Variable(String),
+    Negate(Box<ExpressionNode>),
+    Binary(BinaryOperator, Box<ExpressionNode>, Box<ExpressionNode>),
+    Call(String, Vec<ExpressionNode>),
+}
+
+impl ExpressionNode {
+    fn evaluate(&self, scope: VariableScope<'_>) -> Result<f64, UnsafeExpressionError> {
+        match self {
+            Self::Number(value) => Ok(*value),
+            Self::Variable(name) => scope.get(name).and_then(as_f64).ok_or_else(|| {
+                UnsafeExpressionError::Unsupported(format!("unknown variable: {name}"))
+            }),
+            Self::Negate(inner) => Ok(-inner.evaluate(scope)?),
+            Self::Binary(operator, left, right) => {
+                let left = left.evaluate(scope)?;
+                let right = right.evaluate(scope)?;
+                Ok(match operator {
+                    BinaryOperator::Add => left + right,
+                    BinaryOperator::Subtract => left - right,
+                    BinaryOperator::Multiply => left * right,
+                    BinaryOperator::Divide => left / right,
+                    BinaryOperator::FloorDivide => (left / right).floor(),
+                    BinaryOperator::Remainder => left % right,
+                    BinaryOperator::Power => left.powf(right),
+                })
+            }
+            Self::Call(name, args) => {
+                let args = args
+                    .iter()
+                    .map(|arg| arg.evaluate(scope))
+                    .collect::<Result<Vec<_>, _>>()?;
+                evaluate_function(name, &args)
+            }
+        }
+    }
+}
+
+fn compile_expression(expression: &str) -> Result<Arc<CompiledExpression>, UnsafeExpressionError> {
+    if let Some(compiled) = COMPILED_EXPRESSION_CACHE
+        .read()
+        .ok()
+        .and_then(|cache| cache.get(expression).cloned())
+    {
+        return Ok(compiled);
+    }
+
     let tokens = tokenize(expression)?;
+    let mut variable_names = BTreeSet::new();
+    for index in 0..tokens.len() {
+        if let Token::Identifier(name) = &tokens[index] {
+            if matches!(tokens.get(index + 1), Some(Token::LeftParen)) {
+                continue;
+            }
+            variable_names.insert(name.clone());
+        }
+    }
     let mut parser = Parser {
         tokens: &tokens,
         index: 0,
-        variables,
     };
-    let value = parser.parse_expression()?;
-    if parser.index != tokens.len() {
-        return Err(UnsafeExpressionError::Unsupported(
-            "unexpected trailing tokens".to_string(),
-        ));
+    let program = parser
+        .parse_expression()
+        .and_then(|node| {
+            if parser.index != tokens.len() {
+                return Err(UnsafeExpressionError::Unsupported(
+                    "unexpected trailing tokens".to_string(),
+                ));
+            }
+            Ok(node)
+        })
+        .map_err(|UnsafeExpressionError::Unsupported(message)| message);
+    let compiled = Arc::new(CompiledExpression {
+        variable_names,
+        program,
+    });
+
+    if let Ok(mut cache) = COMPILED_EXPRESSION_CACHE.write() {
+        if cache.len() >= MAX_COMPILED_EXPRESSIONS {
+            cache.clear();
+        }
+        cache.insert(expression.to_string(), Arc::clone(&compiled));
     }
-    Ok(value)
+    Ok(compiled)
+}
+
+fn evaluate_expression(
+    expression: &str,
+    variables: &BTreeMap<String, serde_json::Value>,
+) -> Result<f64, UnsafeExpressionError> {
+    compile_expression(expression)?.evaluate(VariableScope {
+        primary: variables,
+        fallback: None,
+    })
 }
 
 struct Parser<'a> {
     tokens: &'a [Token],
     index: usize,
-    variables: &'a BTreeMap<String, serde_json::Value>,
 }
 
 impl<'a> Parser<'a> {
-    fn parse_expression(&mut self) -> Result<f64, UnsafeExpressionError> {
+    fn parse_expression(&mut self) -> Result<ExpressionNode, UnsafeExpressionError> {
         let mut left = self.parse_term()?;
         loop {
-            match self.peek() {
-                Some(Token::Plus) => {
-                    self.index += 1;
-                    left += self.parse_term()?;
-                }
-                Some(Token::Minus) => {
-                    self.index += 1;
-                    left -= self.parse_term()?;
-                }
+            let operator = match self.peek() {
+                Some(Token::Plus) => BinaryOperator::Add,
+                Some(Token::Minus) => BinaryOperator::Subtract,
                 _ => break,
-            }
+            };
+            self.index += 1;
+            let right = self.parse_term()?;
+            left = ExpressionNode::Binary(operator, Box::new(left), Box::new(right));
         }
         Ok(left)
     }
 
-    fn parse_term(&mut self) -> Result<f64, UnsafeExpressionError> {
+    fn parse_term(&mut self) -> Result<ExpressionNode, UnsafeExpressionError> {
         let mut left = self.parse_power()?;
         loop {
-            match self.peek() {
-                Some(Token::Star) => {
-                    self.index += 1;
-                    left *= self.parse_power()?;
-                }
-                Some(Token::Slash) => {
-                    self.index += 1;
-                    left /= self.parse_power()?;
-                }
-                Some(Token::DoubleSlash) => {
-                    self.index += 1;
-                    left = (left / self.parse_power()?).floor();
-                }
-                Some(Token::Percent) => {
-                    self.index += 1;
-                    left %= self.parse_power()?;
-                }
+            let operator = match self.peek() {
+                Some(Token::Star) => BinaryOperator::Multiply,
+                Some(Token::Slash) => BinaryOperator::Divide,
+                Some(Token::DoubleSlash) => BinaryOperator::FloorDivide,
+                Some(Token::Percent) => BinaryOperator::Remainder,
                 _ => break,
-            }
+            };
+            self.index += 1;
+            let right = self.parse_power()?;
+            left = ExpressionNode::Binary(operator, Box::new(left), Box::new(right));
         }
         Ok(left)
     }
 
-    fn parse_power(&mut self) -> Result<f64, UnsafeExpressionError> {
+    fn parse_power(&mut self) -> Result<ExpressionNode, UnsafeExpressionError> {
         let left = self.parse_unary()?;
         if matches!(self.peek(), Some(Token::DoubleStar)) {
             self.index += 1;
             let right = self.parse_power()?;
-            return Ok(left.powf(right));
+            return Ok(ExpressionNode::Binary(
+                BinaryOperator::Power,
+                Box::new(left),
+                Box::new(right),
+            ));
         }
         Ok(left)
     }
 
-    fn parse_unary(&mut self) -> Result<f64, UnsafeExpressionError> {
+    fn parse_unary(&mut self) -> Result<ExpressionNode, UnsafeExpressionError> {
         match self.peek() {
             Some(Token::Plus) => {
                 self.index += 1;
@@ -636,25 +777,22 @@ impl<'a> Parser<'a> {
             }
             Some(Token::Minus) => {
                 self.index += 1;
-                Ok(-self.parse_unary()?)
+                Ok(ExpressionNode::Negate(Box::new(self.parse_unary()?)))
             }
             _ => self.parse_primary(),
         }
     }
 
-    fn parse_primary(&mut self) -> Result<f64, UnsafeExpressionError> {
+    fn parse_primary(&mut self) -> Result<ExpressionNode, UnsafeExpressionError> {
         match self.next() {
-            Some(Token::Number(value)) => Ok(*value),
+            Some(Token::Number(value)) => Ok(ExpressionNode::Number(*value)),
             Some(Token::Identifier(name)) => {
                 if matches!(self.peek(), Some(Token::LeftParen)) {
                     self.index += 1;
                     let args = self.parse_arguments()?;
-                    evaluate_function(name, &args)
+                    Ok(ExpressionNode::Call(name.clone(), args))
                 } else {
-                    let value = self.variables.get(name).and_then(as_f64).ok_or_else(|| {
-                        UnsafeExpressionError::Unsupported(format!("unknown variable: {name}"))
-                    })?;
-                    Ok(value)
+                    Ok(ExpressionNode::Variable(name.clone()))
                 }
             }
             Some(Token::LeftParen) => {
@@ -672,7 +810,7 @@ impl<'a> Parser<'a> {
         }
     }
 
-    fn parse_arguments(&mut self) -> Result<Vec<f64>, UnsafeExpressionError> {
+    fn parse_arguments(&mut self) -> Result<Vec<ExpressionNode>, UnsafeExpressionError> {
         let mut args = Vec::new();
         if matches!(self.peek(), Some(Token::RightParen)) {
             self.index += 1;
@@ -745,7 +883,9 @@ fn evaluate_function(name: &str, args: &[f64]) -> Result<f64, UnsafeExpressionEr
 
 #[cfg(test)]
 mod tests {
-    use super::{extract_variable_names, FormulaEngine, FormulaEvaluationStatus};
+    use super::{
+        evaluate_expression, extract_variable_names, FormulaEngine, FormulaEvaluationStatus,
+    };
     use std::collections::BTreeMap;
 
     #[test]
@@ -758,6 +898,33 @@ mod tests {
         assert!(!names.contains("min"));
     }
 
+    #[test]
+    fn compiled_expression_is_reused_across_variable_sets() {
+        let expression = "max(a, b) * 2 - c // 3";
+        let first = BTreeMap::from([
+            ("a".to_string(), serde_json::json!(1)),
+            ("b".to_string(), serde_json::json!(4)),
+            ("c".to_string(), serde_json::json!(7)),
+        ]);
+        let second = BTreeMap::from([
+            ("a".to_string(), serde_json::json!(10)),
+            ("b".to_string(), serde_json::json!(2.5)),
+            ("c".to_string(), serde_json::json!(-3)),
+        ]);
+
+        assert_eq!(evaluate_expression(expression, &first).ok(), Some(6.0));
+        assert_eq!(evaluate_expression(expression, &second).ok(), Some(21.0));
+    }
+
+    #[test]
+    fn parse_errors_surface_at_evaluation_not_name_extraction() {
+        let names = extract_variable_names("input_cost +").expect("tokens should be valid");
+        assert!(names.contains("input_cost"));
+
+        let variables = BTreeMap::from([("input_cost".to_string(), serde_json::json!(1.0))]);
+        assert!(evaluate_expression("input_cost +", &variables).is_err());
+    }
+
     #[test]
     fn evaluates_formula_with_computed_variables() {
         let engine = FormulaEngine::new();
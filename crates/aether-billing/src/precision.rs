@@ -2,7 +2,8 @@ pub const BILLING_STORAGE_PRECISION: u32 = 8;
 pub const BILLING_DISPLAY_PRECISION: u32 = 6;
 
 pub fn quantize_value(value: f64, precision: u32) -> f64 {
-    if !value.is_finite() {
+    // Zero-cost breakdown entries are common and already exact.
+    if value == 0.0 || !value.is_finite() {
         return value;
     }
     let factor = 10_f64.powi(precision as i32);
@@ -60,16 +60,16 @@ impl BillingModelPricingSnapshot {
         let Some(api_format) = api_format.map(str::trim).filter(|value| !value.is_empty()) else {
             return 1.0;
         };
-        let normalized = api_format.to_ascii_lowercase();
         let Some(mapping) = self
             .provider_api_key_rate_multipliers
             .as_ref()
             .and_then(Value::as_object)
+            .filter(|mapping| !mapping.is_empty())
         else {
             return 1.0;
         };
         mapping
-            .get(&normalized)
+            .get(aether_ai_formats::fold_ascii_case(api_format).as_ref())
             .and_then(|value| value.as_f64())
             .unwrap_or(1.0)
     }
@@ -1,6 +1,8 @@
+use std::borrow::Cow;
 use std::collections::BTreeMap;
 
 pub const BILLING_SNAPSHOT_SCHEMA_VERSION: &str = "2.0";
+pub(crate) const BILLING_ENGINE_VERSION: &str = "2.0";
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq, serde::Serialize, serde::Deserialize)]
 #[serde(rename_all = "snake_case")]
@@ -30,7 +32,9 @@ impl std::fmt::Display for BillingSnapshotStatus {
 
 #[derive(Debug, Clone, PartialEq, serde::Serialize, serde::Deserialize)]
 pub struct BillingSnapshot {
-    pub schema_version: String,
+    // Version tags are constants for every snapshot this crate builds, so
+    // they borrow the static strings instead of allocating per computation.
+    pub schema_version: Cow<'static, str>,
     pub rule_id: Option<String>,
     pub rule_name: Option<String>,
     pub scope: Option<String>,
@@ -44,13 +48,13 @@ pub struct BillingSnapshot {
     pub missing_required: Vec<String>,
     pub status: BillingSnapshotStatus,
     pub calculated_at: String,
-    pub engine_version: String,
+    pub engine_version: Cow<'static, str>,
 }
 
 impl Default for BillingSnapshot {
     fn default() -> Self {
         Self {
-            schema_version: BILLING_SNAPSHOT_SCHEMA_VERSION.to_string(),
+            schema_version: Cow::Borrowed(BILLING_SNAPSHOT_SCHEMA_VERSION),
             rule_id: None,
             rule_name: None,
             scope: None,
@@ -64,7 +68,7 @@ impl Default for BillingSnapshot {
             missing_required: Vec::new(),
             status: BillingSnapshotStatus::NoRule,
             calculated_at: String::new(),
-            engine_version: "2.0".to_string(),
+            engine_version: Cow::Borrowed(BILLING_ENGINE_VERSION),
         }
     }
 }
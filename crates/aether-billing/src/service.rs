@@ -1,3 +1,4 @@
+use std::borrow::Cow;
 use std::collections::BTreeMap;
 use std::time::{SystemTime, UNIX_EPOCH};
 
@@ -10,7 +11,8 @@ use crate::default_rule::{
 use crate::precision::quantize_cost;
 use crate::pricing::{BillingComputation, BillingModelPricingSnapshot, BillingUsageInput};
 use crate::schema::{
-    BillingSnapshot, BillingSnapshotStatus, CostResult, BILLING_SNAPSHOT_SCHEMA_VERSION,
+    BillingSnapshot, BillingSnapshotStatus, CostResult, BILLING_ENGINE_VERSION,
+    BILLING_SNAPSHOT_SCHEMA_VERSION,
 };
 use crate::{
     normalize_input_tokens_for_billing, normalize_total_input_context_for_cache_hit_rate,
@@ -22,7 +24,7 @@ pub struct BillingService {
 }
 
 impl BillingService {
-    pub fn new() -> Self {
+    pub const fn new() -> Self {
         Self {
             engine: FormulaEngine::new(),
         }
@@ -33,6 +35,8 @@ impl BillingService {
         pricing: &BillingModelPricingSnapshot,
         input: &BillingUsageInput,
     ) -> Result<BillingComputation, ExpressionEvaluationError> {
+        let rate_multiplier = pricing.rate_multiplier_for_api_format(input.api_format.as_deref());
+        let is_free_tier = pricing.is_free_tier();
         let Some(rule) =
             DefaultBillingRuleGenerator::generate_for_pricing(pricing, &input.task_type)
         else {
@@ -41,7 +45,7 @@ impl BillingService {
                     cost: 0.0,
                     status: BillingSnapshotStatus::NoRule,
                     snapshot: BillingSnapshot {
-                        schema_version: BILLING_SNAPSHOT_SCHEMA_VERSION.to_string(),
+                        schema_version: Cow::Borrowed(BILLING_SNAPSHOT_SCHEMA_VERSION),
                         rule_id: None,
                         rule_name: None,
                         scope: None,
@@ -55,21 +59,20 @@ impl BillingService {
                         missing_required: Vec::new(),
                         status: BillingSnapshotStatus::NoRule,
                         calculated_at: now_marker(),
-                        engine_version: "2.0".to_string(),
+                        engine_version: Cow::Borrowed(BILLING_ENGINE_VERSION),
                     },
                 },
                 actual_total_cost: 0.0,
-                rate_multiplier: pricing
-                    .rate_multiplier_for_api_format(input.api_format.as_deref()),
-                is_free_tier: pricing.is_free_tier(),
+                rate_multiplier,
+                is_free_tier,
             });
         };
 
         let dims = build_dimensions(input, pricing);
-        let result = self.engine.evaluate(
+        let result = self.engine.evaluate_owned(
             &rule.expression,
-            Some(&rule.variables),
-            Some(&dims),
+            rule.variables,
+            dims,
             Some(&rule.dimension_mappings),
             false,
         )?;
@@ -83,8 +86,6 @@ impl BillingService {
         } else {
             0.0
         };
-        let rate_multiplier = pricing.rate_multiplier_for_api_format(input.api_format.as_deref());
-        let is_free_tier = pricing.is_free_tier();
         let actual_total_cost = if is_free_tier {
             0.0
         } else {
@@ -96,7 +97,7 @@ impl BillingService {
                 cost: total_cost,
                 status,
                 snapshot: BillingSnapshot {
-                    schema_version: BILLING_SNAPSHOT_SCHEMA_VERSION.to_string(),
+                    schema_version: Cow::Borrowed(BILLING_SNAPSHOT_SCHEMA_VERSION),
                     rule_id: Some(rule.id),
                     rule_name: Some(rule.name),
                     scope: Some(rule.scope),
@@ -110,7 +111,7 @@ impl BillingService {
                     missing_required: result.missing_required,
                     status,
                     calculated_at: now_marker(),
-                    engine_version: "2.0".to_string(),
+                    engine_version: Cow::Borrowed(BILLING_ENGINE_VERSION),
                 },
             },
             actual_total_cost,
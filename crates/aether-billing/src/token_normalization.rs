@@ -6,22 +6,32 @@ enum ApiFamily {
     Unknown,
 }
 
+/// Whether billed input tokens exclude cache reads, indexed by `ApiFamily as usize`.
+const DEDUCTS_CACHE_READ_BY_FAMILY: [bool; 4] = {
+    let mut table = [false; 4];
+    table[ApiFamily::OpenAi as usize] = true;
+    table[ApiFamily::Gemini as usize] = true;
+    table
+};
+
+const API_FAMILY_ALIASES: [(&str, ApiFamily); 5] = [
+    ("openai", ApiFamily::OpenAi),
+    ("claude", ApiFamily::Claude),
+    ("anthropic", ApiFamily::Claude),
+    ("gemini", ApiFamily::Gemini),
+    ("google", ApiFamily::Gemini),
+];
+
 fn parse_api_family(api_format: Option<&str>) -> ApiFamily {
     let Some(api_format) = api_format else {
         return ApiFamily::Unknown;
     };
-    let family = api_format
-        .split(':')
-        .next()
-        .unwrap_or_default()
-        .trim()
-        .to_ascii_lowercase();
-    match family.as_str() {
-        "openai" => ApiFamily::OpenAi,
-        "claude" | "anthropic" => ApiFamily::Claude,
-        "gemini" | "google" => ApiFamily::Gemini,
-        _ => ApiFamily::Unknown,
-    }
+    let family = api_format.split(':').next().unwrap_or_default().trim();
+    API_FAMILY_ALIASES
+        .iter()
+        .find(|(alias, _)| family.eq_ignore_ascii_case(alias))
+        .map(|(_, family)| *family)
+        .unwrap_or(ApiFamily::Unknown)
 }
 
 pub fn normalize_input_tokens_for_billing(
@@ -36,10 +46,23 @@ pub fn normalize_input_tokens_for_billing(
         return input_tokens;
     }
 
-    match parse_api_family(api_format) {
-        ApiFamily::Claude => input_tokens,
-        ApiFamily::OpenAi | ApiFamily::Gemini => (input_tokens - cache_read_tokens).max(0),
-        ApiFamily::Unknown => input_tokens,
+    normalize_input_tokens_for_family(
+        parse_api_family(api_format),
+        input_tokens,
+        cache_read_tokens,
+    )
+}
+
+fn normalize_input_tokens_for_family(
+    family: ApiFamily,
+    input_tokens: i64,
+    cache_read_tokens: i64,
+) -> i64 {
+    let deducted = (input_tokens - cache_read_tokens).max(0);
+    if DEDUCTS_CACHE_READ_BY_FAMILY[family as usize] {
+        deducted
+    } else {
+        input_tokens
     }
 }
 
@@ -57,8 +80,8 @@ pub fn normalize_total_input_context_for_cache_hit_rate(
         ApiFamily::Claude => {
             normalized_input_tokens.saturating_add(normalized_cache_creation_tokens)
         }
-        ApiFamily::OpenAi | ApiFamily::Gemini => normalize_input_tokens_for_billing(
-            api_format,
+        family @ (ApiFamily::OpenAi | ApiFamily::Gemini) => normalize_input_tokens_for_family(
+            family,
             normalized_input_tokens,
             normalized_cache_read_tokens,
         ),
@@ -239,6 +239,8 @@ pub struct UserDailyQuotaAvailabilityRecord {
 
 #[async_trait]
 pub trait BillingReadRepository: Send + Sync {
+    fn clear_local_cache(&self) {}
+
     async fn find_model_context(
         &self,
         provider_id: &str,
@@ -1773,6 +1773,7 @@ pub trait UsageWriteRepository: Send + Sync {
         usage: UpsertUsageRecord,
     ) -> Result<StoredRequestUsageAudit, crate::DataLayerError>;
 
+    /// Recomputes API key totals from usage, returning how many keys have usage.
     async fn rebuild_api_key_usage_stats(&self) -> Result<u64, crate::DataLayerError>;
 
     async fn rebuild_provider_api_key_usage_stats(&self) -> Result<u64, crate::DataLayerError>;
@@ -18,7 +18,7 @@ pub enum VideoTaskStatus {
 
 impl VideoTaskStatus {
     pub fn from_database(value: &str) -> Result<Self, crate::DataLayerError> {
-        match value.trim().to_ascii_lowercase().as_str() {
+        match aether_ai_formats::fold_ascii_case(value.trim()).as_ref() {
             "pending" => Ok(Self::Pending),
             "submitted" => Ok(Self::Submitted),
             "queued" => Ok(Self::Queued),
@@ -436,6 +436,21 @@ pub trait VideoTaskWriteRepository: Send + Sync {
         task: UpsertVideoTask,
     ) -> Result<Option<StoredVideoTask>, crate::DataLayerError>;
 
+    /// Applies a batch of poll results, returning the tasks that were still
+    /// active and therefore updated, in input order.
+    async fn update_many_if_active(
+        &self,
+        tasks: Vec<UpsertVideoTask>,
+    ) -> Result<Vec<StoredVideoTask>, crate::DataLayerError> {
+        let mut updated = Vec::with_capacity(tasks.len());
+        for task in tasks {
+            if let Some(stored) = self.update_if_active(task).await? {
+                updated.push(stored);
+            }
+        }
+        Ok(updated)
+    }
+
     async fn claim_due(
         &self,
         now_unix_secs: u64,
@@ -557,6 +572,10 @@ mod tests {
             VideoTaskStatus::from_database("processing").expect("status should parse"),
             VideoTaskStatus::Processing
         );
+        assert_eq!(
+            VideoTaskStatus::from_database(" Completed ").expect("status should parse"),
+            VideoTaskStatus::Completed
+        );
     }
 
     #[test]
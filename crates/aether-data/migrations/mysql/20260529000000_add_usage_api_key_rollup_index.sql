@@ -0,0 +1,15 @@
+SET @aether_usage_api_key_rollup_index_sql := IF(
+    (
+        SELECT COUNT(*)
+        FROM information_schema.statistics
+        WHERE table_schema = DATABASE()
+          AND table_name = 'usage'
+          AND index_name = 'usage_api_key_rollup_idx'
+    ) = 0,
+    'CREATE INDEX usage_api_key_rollup_idx ON `usage` (api_key_id, updated_at_unix_secs, total_tokens, total_cost_usd)',
+    'DO 0'
+);
+
+PREPARE aether_usage_api_key_rollup_index_stmt FROM @aether_usage_api_key_rollup_index_sql;
+EXECUTE aether_usage_api_key_rollup_index_stmt;
+DEALLOCATE PREPARE aether_usage_api_key_rollup_index_stmt;
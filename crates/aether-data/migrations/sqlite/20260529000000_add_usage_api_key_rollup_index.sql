@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS usage_api_key_rollup_idx
+    ON "usage" (api_key_id, updated_at_unix_secs, total_tokens, total_cost_usd);
@@ -8,6 +8,23 @@ pub(crate) fn sql_error(error: impl std::fmt::Display) -> DataLayerError {
     DataLayerError::sql(error)
 }
 
+/// Whether `error` was caused by the values of the row being written, such as
+/// a constraint violation or data exception, rather than by the connection or
+/// server. Other rows of the same batch can still be written after one.
+pub(crate) fn is_row_level_sql_error(error: &sqlx::Error) -> bool {
+    let sqlx::Error::Database(database_error) = error else {
+        return false;
+    };
+    if !matches!(database_error.kind(), sqlx::error::ErrorKind::Other) {
+        return true;
+    }
+    // Postgres and MySQL report SQLSTATE codes; classes 22 and 23 are data
+    // exceptions and integrity constraint violations.
+    database_error
+        .code()
+        .is_some_and(|code| code.len() == 5 && (code.starts_with("22") || code.starts_with("23")))
+}
+
 pub(crate) trait SqlxResultExt<T> {
     fn map_postgres_err(self) -> Result<T, DataLayerError>;
 }
@@ -727,6 +727,7 @@ fn mysql_and_sqlite_migrations_include_enabled_incrementals() {
             20260524000000,
             20260527000000,
             20260528000000,
+            20260529000000,
         ]
     );
     assert_eq!(
@@ -753,6 +754,7 @@ fn mysql_and_sqlite_migrations_include_enabled_incrementals() {
             20260524000000,
             20260527000000,
             20260528000000,
+            20260529000000,
         ]
     );
 }
@@ -1,3 +1,5 @@
+use std::sync::LazyLock;
+
 use async_trait::async_trait;
 use sqlx::{mysql::MySqlRow, Row};
 
@@ -35,6 +37,49 @@ SELECT
 FROM providers p
 "#;
 
+static FIND_MODEL_CONTEXT_SQL: LazyLock<String> = LazyLock::new(|| {
+    format!(
+        r#"
+{MODEL_CONTEXT_COLUMNS}
+INNER JOIN global_models gm
+  ON gm.is_active = 1
+LEFT JOIN models m
+  ON m.global_model_id = gm.id
+ AND m.provider_id = p.id
+ AND m.is_active = 1
+LEFT JOIN provider_api_keys pak
+  ON pak.id = ?
+ AND pak.provider_id = p.id
+WHERE p.id = ?
+  AND (
+    gm.name = ?
+    OR m.provider_model_name = ?
+    OR m.provider_model_mappings IS NOT NULL
+  )
+"#
+    )
+});
+
+static FIND_MODEL_CONTEXT_BY_MODEL_ID_SQL: LazyLock<String> = LazyLock::new(|| {
+    format!(
+        r#"
+{MODEL_CONTEXT_COLUMNS}
+INNER JOIN models m
+  ON m.id = ?
+ AND m.provider_id = p.id
+ AND m.is_active = 1
+INNER JOIN global_models gm
+  ON gm.id = m.global_model_id
+ AND gm.is_active = 1
+LEFT JOIN provider_api_keys pak
+  ON pak.id = ?
+ AND pak.provider_id = p.id
+WHERE p.id = ?
+LIMIT 1
+"#
+    )
+});
+
 #[derive(Debug, Clone)]
 pub struct MysqlBillingReadRepository {
     pool: MysqlPool,
@@ -54,33 +99,14 @@ impl BillingReadRepository for MysqlBillingReadRepository {
         provider_api_key_id: Option<&str>,
         global_model_name: &str,
     ) -> Result<Option<StoredBillingModelContext>, DataLayerError> {
-        let rows = sqlx::query(&format!(
-            r#"
-{MODEL_CONTEXT_COLUMNS}
-INNER JOIN global_models gm
-  ON gm.is_active = 1
-LEFT JOIN models m
-  ON m.global_model_id = gm.id
- AND m.provider_id = p.id
- AND m.is_active = 1
-LEFT JOIN provider_api_keys pak
-  ON pak.id = ?
- AND pak.provider_id = p.id
-WHERE p.id = ?
-  AND (
-    gm.name = ?
-    OR m.provider_model_name = ?
-    OR m.provider_model_mappings IS NOT NULL
-  )
-"#
-        ))
-        .bind(provider_api_key_id)
-        .bind(provider_id)
-        .bind(global_model_name)
-        .bind(global_model_name)
-        .fetch_all(&self.pool)
-        .await
-        .map_sql_err()?;
+        let rows = sqlx::query(FIND_MODEL_CONTEXT_SQL.as_str())
+            .bind(provider_api_key_id)
+            .bind(provider_id)
+            .bind(global_model_name)
+            .bind(global_model_name)
+            .fetch_all(&self.pool)
+            .await
+            .map_sql_err()?;
 
         rows.iter()
             .filter_map(|row| match_rank(row, global_model_name).transpose())
@@ -104,29 +130,13 @@ WHERE p.id = ?
         provider_api_key_id: Option<&str>,
         model_id: &str,
     ) -> Result<Option<StoredBillingModelContext>, DataLayerError> {
-        let row = sqlx::query(&format!(
-            r#"
-{MODEL_CONTEXT_COLUMNS}
-INNER JOIN models m
-  ON m.id = ?
- AND m.provider_id = p.id
- AND m.is_active = 1
-INNER JOIN global_models gm
-  ON gm.id = m.global_model_id
- AND gm.is_active = 1
-LEFT JOIN provider_api_keys pak
-  ON pak.id = ?
- AND pak.provider_id = p.id
-WHERE p.id = ?
-LIMIT 1
-"#
-        ))
-        .bind(model_id)
-        .bind(provider_api_key_id)
-        .bind(provider_id)
-        .fetch_optional(&self.pool)
-        .await
-        .map_sql_err()?;
+        let row = sqlx::query(FIND_MODEL_CONTEXT_BY_MODEL_ID_SQL.as_str())
+            .bind(model_id)
+            .bind(provider_api_key_id)
+            .bind(provider_id)
+            .fetch_optional(&self.pool)
+            .await
+            .map_sql_err()?;
         row.as_ref().map(map_row).transpose()
     }
 
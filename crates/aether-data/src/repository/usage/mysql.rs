@@ -3,6 +3,7 @@ use std::time::{SystemTime, UNIX_EPOCH};
 
 use aether_ai_formats::UPSTREAM_IS_STREAM_KEY;
 use async_trait::async_trait;
+use futures_util::TryStreamExt;
 use sqlx::{mysql::MySqlRow, MySql, QueryBuilder, Row};
 
 use super::{
@@ -760,6 +761,7 @@ impl UsageWriteRepository for MysqlUsageWriteRepository {
     }
 
     async fn rebuild_api_key_usage_stats(&self) -> Result<u64, DataLayerError> {
+        let mut tx = self.pool.begin().await.map_sql_err()?;
         sqlx::query(
             r#"
 UPDATE api_keys
@@ -767,74 +769,74 @@ SET total_requests = 0,
     total_tokens = 0,
     total_cost_usd = 0,
     last_used_at = NULL
+WHERE (
+    total_requests <> 0
+    OR total_tokens <> 0
+    OR total_cost_usd <> 0
+    OR last_used_at IS NOT NULL
+  )
+  AND id NOT IN (
+    SELECT api_key_id
+    FROM `usage`
+    WHERE api_key_id IS NOT NULL AND api_key_id <> ''
+  )
 "#,
         )
-        .execute(&self.pool)
+        .execute(&mut *tx)
         .await
         .map_sql_err()?;
 
-        let rows = sqlx::query(
+        sqlx::query(
             r#"
-SELECT
-  api_key_id,
-  COUNT(*) AS total_requests,
-  CAST(COALESCE(SUM(total_tokens), 0) AS SIGNED) AS total_tokens,
-  CAST(COALESCE(SUM(total_cost_usd), 0) AS DOUBLE) AS total_cost_usd,
-  MAX(updated_at_unix_secs) AS last_used_at
-FROM `usage`
-WHERE api_key_id IS NOT NULL AND api_key_id <> ''
-GROUP BY api_key_id
+UPDATE api_keys
+INNER JOIN (
+  SELECT
+    api_key_id,
+    COUNT(*) AS total_requests,
+    CAST(COALESCE(SUM(total_tokens), 0) AS SIGNED) AS total_tokens,
+    CAST(COALESCE(SUM(total_cost_usd), 0) AS DOUBLE) AS total_cost_usd,
+    MAX(updated_at_unix_secs) AS last_used_at
+  FROM `usage`
+  WHERE api_key_id IS NOT NULL AND api_key_id <> ''
+  GROUP BY api_key_id
+) AS aggregated
+  ON api_keys.id = aggregated.api_key_id
+SET api_keys.total_requests = aggregated.total_requests,
+    api_keys.total_tokens = aggregated.total_tokens,
+    api_keys.total_cost_usd = aggregated.total_cost_usd,
+    api_keys.last_used_at = aggregated.last_used_at
+WHERE NOT (
+    api_keys.total_requests <=> aggregated.total_requests
+    AND api_keys.total_tokens <=> aggregated.total_tokens
+    AND api_keys.total_cost_usd <=> aggregated.total_cost_usd
+    AND api_keys.last_used_at <=> aggregated.last_used_at
+  )
 "#,
         )
-        .fetch_all(&self.pool)
+        .execute(&mut *tx)
         .await
         .map_sql_err()?;
 
-        for row in &rows {
-            sqlx::query(
-                r#"
-UPDATE api_keys
-SET total_requests = ?,
-    total_tokens = ?,
-    total_cost_usd = ?,
-    last_used_at = ?
-WHERE id = ?
-"#,
-            )
-            .bind(row.try_get::<i64, _>("total_requests").map_sql_err()?)
-            .bind(row.try_get::<i64, _>("total_tokens").map_sql_err()?)
-            .bind(row.try_get::<f64, _>("total_cost_usd").map_sql_err()?)
-            .bind(
-                row.try_get::<Option<i64>, _>("last_used_at")
-                    .map_sql_err()?,
-            )
-            .bind(row.try_get::<String, _>("api_key_id").map_sql_err()?)
-            .execute(&self.pool)
-            .await
-            .map_sql_err()?;
-        }
-
-        Ok(rows.len() as u64)
-    }
-
-    async fn rebuild_provider_api_key_usage_stats(&self) -> Result<u64, DataLayerError> {
-        sqlx::query(
+        // Report the number of keys with usage, like the other backends,
+        // rather than how many rows the change-filtered UPDATE touched.
+        let aggregated_keys: i64 = sqlx::query_scalar(
             r#"
-UPDATE provider_api_keys
-SET request_count = 0,
-    success_count = 0,
-    error_count = 0,
-    total_tokens = 0,
-    total_cost_usd = 0,
-    total_response_time_ms = 0,
-    last_used_at = NULL
+SELECT COUNT(DISTINCT api_key_id)
+FROM `usage`
+WHERE api_key_id IS NOT NULL AND api_key_id <> ''
 "#,
         )
-        .execute(&self.pool)
+        .fetch_one(&mut *tx)
         .await
         .map_sql_err()?;
 
-        let rows = sqlx::query(
+        tx.commit().await.map_sql_err()?;
+
+        Ok(aggregated_keys as u64)
+    }
+
+    async fn rebuild_provider_api_key_usage_stats(&self) -> Result<u64, DataLayerError> {
+        let mut rows = sqlx::query(
             r#"
 SELECT
   provider_api_key_id,
@@ -849,29 +851,30 @@ FROM `usage`
 WHERE provider_api_key_id IS NOT NULL AND provider_api_key_id <> ''
 "#,
         )
-        .fetch_all(&self.pool)
-        .await
-        .map_sql_err()?;
+        .fetch(&self.pool);
 
         let mut stats = BTreeMap::<String, ProviderKeyStats>::new();
-        for row in rows {
-            let key_id: String = row.try_get("provider_api_key_id").map_sql_err()?;
-            let status: String = row.try_get("status").map_sql_err()?;
+        while let Some(row) = rows.try_next().await.map_sql_err()? {
+            let key_id: &str = row.try_get("provider_api_key_id").map_sql_err()?;
+            let status: &str = row.try_get("status").map_sql_err()?;
             let status_code = row.try_get::<Option<i64>, _>("status_code").map_sql_err()?;
             let status_code_u16 = status_code.and_then(|value| u16::try_from(value).ok());
-            let error_message: Option<String> = row.try_get("error_message").map_sql_err()?;
-            let entry = stats.entry(key_id).or_default();
+            let error_message: Option<&str> = row.try_get("error_message").map_sql_err()?;
+            // Most rows belong to a key that is already in the map; only
+            // allocate an owned id the first time a key is seen.
+            let entry = if let Some(entry) = stats.get_mut(key_id) {
+                entry
+            } else {
+                stats.entry(key_id.to_owned()).or_default()
+            };
             entry.request_count += 1;
-            let is_success = provider_api_key_usage_is_success(
-                &status,
-                status_code_u16,
-                error_message.as_deref(),
-            );
-            let is_in_flight = matches!(status.as_str(), "pending" | "streaming");
+            let is_success =
+                provider_api_key_usage_is_success(status, status_code_u16, error_message);
+            let is_in_flight = matches!(status, "pending" | "streaming");
             if is_success {
                 entry.success_count += 1;
             }
-            if provider_api_key_usage_is_error(&status, status_code_u16, error_message.as_deref()) {
+            if provider_api_key_usage_is_error(status, status_code_u16, error_message) {
                 entry.error_count += 1;
             }
             if !is_in_flight {
@@ -889,6 +892,26 @@ WHERE provider_api_key_id IS NOT NULL AND provider_api_key_id <> ''
                     .map_sql_err()?,
             );
         }
+        drop(rows);
+
+        // Reset and per-key writes share one transaction so a failing key
+        // rolls the whole rebuild back instead of leaving keys zeroed.
+        let mut tx = self.pool.begin().await.map_sql_err()?;
+        sqlx::query(
+            r#"
+UPDATE provider_api_keys
+SET request_count = 0,
+    success_count = 0,
+    error_count = 0,
+    total_tokens = 0,
+    total_cost_usd = 0,
+    total_response_time_ms = 0,
+    last_used_at = NULL
+"#,
+        )
+        .execute(&mut *tx)
+        .await
+        .map_sql_err()?;
 
         for (key_id, stat) in &stats {
             sqlx::query(
@@ -912,11 +935,13 @@ WHERE id = ?
             .bind(stat.total_response_time_ms)
             .bind(stat.last_used_at)
             .bind(key_id)
-            .execute(&self.pool)
+            .execute(&mut *tx)
             .await
             .map_sql_err()?;
         }
 
+        tx.commit().await.map_sql_err()?;
+
         Ok(stats.len() as u64)
     }
 
@@ -3697,6 +3697,7 @@ impl UsageWriteRepository for SqliteUsageWriteRepository {
     }
 
     async fn rebuild_api_key_usage_stats(&self) -> Result<u64, DataLayerError> {
+        let mut tx = self.pool.begin().await.map_sql_err()?;
         sqlx::query(
             r#"
 UPDATE api_keys
@@ -3704,57 +3705,74 @@ SET total_requests = 0,
     total_tokens = 0,
     total_cost_usd = 0.0,
     last_used_at = NULL
+WHERE (
+    total_requests <> 0
+    OR total_tokens <> 0
+    OR total_cost_usd <> 0
+    OR last_used_at IS NOT NULL
+  )
+  AND id NOT IN (
+    SELECT api_key_id
+    FROM "usage"
+    WHERE api_key_id IS NOT NULL AND api_key_id <> ''
+  )
 "#,
         )
-        .execute(&self.pool)
+        .execute(&mut *tx)
         .await
         .map_sql_err()?;
 
-        let rows = sqlx::query(
+        sqlx::query(
             r#"
-SELECT
-  api_key_id,
-  COUNT(*) AS total_requests,
-  COALESCE(SUM(total_tokens), 0) AS total_tokens,
-  CAST(COALESCE(SUM(total_cost_usd), 0) AS REAL) AS total_cost_usd,
-  MAX(updated_at_unix_secs) AS last_used_at
+UPDATE api_keys
+SET total_requests = aggregated.total_requests,
+    total_tokens = aggregated.total_tokens,
+    total_cost_usd = aggregated.total_cost_usd,
+    last_used_at = aggregated.last_used_at
+FROM (
+  SELECT
+    api_key_id,
+    COUNT(*) AS total_requests,
+    COALESCE(SUM(total_tokens), 0) AS total_tokens,
+    CAST(COALESCE(SUM(total_cost_usd), 0) AS REAL) AS total_cost_usd,
+    MAX(updated_at_unix_secs) AS last_used_at
+  FROM "usage"
+  WHERE api_key_id IS NOT NULL AND api_key_id <> ''
+  GROUP BY api_key_id
+) AS aggregated
+WHERE api_keys.id = aggregated.api_key_id
+  AND (
+    api_keys.total_requests IS NOT aggregated.total_requests
+    OR api_keys.total_tokens IS NOT aggregated.total_tokens
+    OR api_keys.total_cost_usd IS NOT aggregated.total_cost_usd
+    OR api_keys.last_used_at IS NOT aggregated.last_used_at
+  )
+"#,
+        )
+        .execute(&mut *tx)
+        .await
+        .map_sql_err()?;
+
+        // Report the number of keys with usage, like the other backends,
+        // rather than how many rows the change-filtered UPDATE touched.
+        let aggregated_keys: i64 = sqlx::query_scalar(
+            r#"
+SELECT COUNT(DISTINCT api_key_id)
 FROM "usage"
 WHERE api_key_id IS NOT NULL AND api_key_id <> ''
-GROUP BY api_key_id
 "#,
         )
-        .fetch_all(&self.pool)
+        .fetch_one(&mut *tx)
         .await
         .map_sql_err()?;
 
-        for row in &rows {
-            sqlx::query(
-                r#"
-UPDATE api_keys
-SET total_requests = ?,
-    total_tokens = ?,
-    total_cost_usd = ?,
-    last_used_at = ?
-WHERE id = ?
-"#,
-            )
-            .bind(row.try_get::<i64, _>("total_requests").map_sql_err()?)
-            .bind(row.try_get::<i64, _>("total_tokens").map_sql_err()?)
-            .bind(sqlite_real(row, "total_cost_usd")?)
-            .bind(
-                row.try_get::<Option<i64>, _>("last_used_at")
-                    .map_sql_err()?,
-            )
-            .bind(row.try_get::<String, _>("api_key_id").map_sql_err()?)
-            .execute(&self.pool)
-            .await
-            .map_sql_err()?;
-        }
+        tx.commit().await.map_sql_err()?;
 
-        Ok(rows.len() as u64)
+        Ok(aggregated_keys as u64)
     }
 
     async fn rebuild_provider_api_key_usage_stats(&self) -> Result<u64, DataLayerError> {
+        let mut tx = self.pool.begin().await.map_sql_err()?;
         sqlx::query(
             r#"
 UPDATE provider_api_keys
@@ -3767,80 +3785,58 @@ SET request_count = 0,
     last_used_at = NULL
 "#,
         )
-        .execute(&self.pool)
+        .execute(&mut *tx)
         .await
         .map_sql_err()?;
 
-        let rows = sqlx::query(&format!(
+        let rows_affected = sqlx::query(&format!(
             r#"
-SELECT
-  provider_api_key_id,
-  COUNT(*) AS request_count,
-  COALESCE(SUM({success_flag_expr}), 0) AS success_count,
-  COALESCE(SUM({error_flag_expr}), 0) AS error_count,
-  COALESCE(SUM(CASE
-    WHEN status IN ('pending', 'streaming') THEN 0
-    ELSE MAX(COALESCE(total_tokens, 0), 0)
-  END), 0) AS total_tokens,
-  COALESCE(SUM(CASE
-    WHEN status IN ('pending', 'streaming') THEN 0
-    ELSE COALESCE(CAST(total_cost_usd AS REAL), 0)
-  END), 0) AS total_cost_usd,
-  COALESCE(SUM(CASE
-    WHEN {success_flag_expr} = 1 AND response_time_ms IS NOT NULL
-    THEN MAX(COALESCE(response_time_ms, 0), 0)
-    ELSE 0
-  END), 0) AS total_response_time_ms,
-  MAX(created_at_unix_ms) AS last_used_at
-FROM "usage"
-WHERE provider_api_key_id IS NOT NULL
-  AND TRIM(provider_api_key_id) <> ''
-GROUP BY provider_api_key_id
+UPDATE provider_api_keys
+SET request_count = aggregated.request_count,
+    success_count = aggregated.success_count,
+    error_count = aggregated.error_count,
+    total_tokens = aggregated.total_tokens,
+    total_cost_usd = aggregated.total_cost_usd,
+    total_response_time_ms = aggregated.total_response_time_ms,
+    last_used_at = aggregated.last_used_at
+FROM (
+  SELECT
+    provider_api_key_id,
+    COUNT(*) AS request_count,
+    COALESCE(SUM({success_flag_expr}), 0) AS success_count,
+    COALESCE(SUM({error_flag_expr}), 0) AS error_count,
+    COALESCE(SUM(CASE
+      WHEN status IN ('pending', 'streaming') THEN 0
+      ELSE MAX(COALESCE(total_tokens, 0), 0)
+    END), 0) AS total_tokens,
+    COALESCE(SUM(CASE
+      WHEN status IN ('pending', 'streaming') THEN 0
+      ELSE COALESCE(CAST(total_cost_usd AS REAL), 0)
+    END), 0) AS total_cost_usd,
+    COALESCE(SUM(CASE
+      WHEN {success_flag_expr} = 1 AND response_time_ms IS NOT NULL
+      THEN MAX(COALESCE(response_time_ms, 0), 0)
+      ELSE 0
+    END), 0) AS total_response_time_ms,
+    MAX(created_at_unix_ms) AS last_used_at
+  FROM "usage"
+  WHERE provider_api_key_id IS NOT NULL
+    AND TRIM(provider_api_key_id) <> ''
+  GROUP BY provider_api_key_id
+) AS aggregated
+WHERE provider_api_keys.id = aggregated.provider_api_key_id
 "#,
             success_flag_expr = SQLITE_PROVIDER_KEY_SUCCESS_FLAG_EXPR,
             error_flag_expr = SQLITE_PROVIDER_KEY_ERROR_FLAG_EXPR
         ))
-        .fetch_all(&self.pool)
+        .execute(&mut *tx)
         .await
-        .map_sql_err()?;
+        .map_sql_err()?
+        .rows_affected();
 
-        for row in &rows {
-            sqlx::query(
-                r#"
-UPDATE provider_api_keys
-SET request_count = ?,
-    success_count = ?,
-    error_count = ?,
-    total_tokens = ?,
-    total_cost_usd = ?,
-    total_response_time_ms = ?,
-    last_used_at = ?
-WHERE id = ?
-"#,
-            )
-            .bind(row.try_get::<i64, _>("request_count").map_sql_err()?)
-            .bind(row.try_get::<i64, _>("success_count").map_sql_err()?)
-            .bind(row.try_get::<i64, _>("error_count").map_sql_err()?)
-            .bind(row.try_get::<i64, _>("total_tokens").map_sql_err()?)
-            .bind(sqlite_real(row, "total_cost_usd")?)
-            .bind(
-                row.try_get::<i64, _>("total_response_time_ms")
-                    .map_sql_err()?,
-            )
-            .bind(
-                row.try_get::<Option<i64>, _>("last_used_at")
-                    .map_sql_err()?,
-            )
-            .bind(
-                row.try_get::<String, _>("provider_api_key_id")
-                    .map_sql_err()?,
-            )
-            .execute(&self.pool)
-            .await
-            .map_sql_err()?;
-        }
+        tx.commit().await.map_sql_err()?;
 
-        Ok(rows.len() as u64)
+        Ok(rows_affected)
     }
 
     async fn cleanup_stale_pending_requests(
@@ -4447,6 +4443,13 @@ mod tests {
         .await
         .expect("api key stats should load");
         assert_eq!(stats, (1, 7, 0.5, Some(1_000)));
+        assert_eq!(
+            repository
+                .rebuild_api_key_usage_stats()
+                .await
+                .expect("api key stats should rebuild"),
+            1
+        );
 
         let provider_stats = sqlx::query_as::<_, (i64, i64, i64, i64, f64, i64, Option<i64>)>(
             "SELECT request_count, success_count, error_count, total_tokens, total_cost_usd, total_response_time_ms, last_used_at FROM provider_api_keys WHERE id = 'provider-key-1'",
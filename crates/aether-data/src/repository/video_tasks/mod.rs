@@ -13,3 +13,35 @@ pub use memory::InMemoryVideoTaskRepository;
 pub use mysql::MysqlVideoTaskRepository;
 pub use postgres::{SqlxVideoTaskReadRepository, SqlxVideoTaskRepository};
 pub use sqlite::SqliteVideoTaskRepository;
+
+/// Applies `tasks` one row at a time after a batch was rolled back because of
+/// a row-level error. Failing rows are logged and dropped; the call only fails
+/// when no row could be written, so an outage still reaches the caller.
+async fn update_each_if_active<R>(
+    repository: &R,
+    tasks: Vec<UpsertVideoTask>,
+) -> Result<Vec<StoredVideoTask>, crate::DataLayerError>
+where
+    R: VideoTaskWriteRepository + ?Sized,
+{
+    let mut updated = Vec::with_capacity(tasks.len());
+    let mut any_succeeded = false;
+    let mut last_error = None;
+    for task in tasks {
+        let task_id = task.id.clone();
+        match repository.update_if_active(task).await {
+            Ok(stored) => {
+                any_succeeded = true;
+                updated.extend(stored);
+            }
+            Err(err) => {
+                tracing::warn!(task_id = %task_id, error = %err, "video task update failed");
+                last_error = Some(err);
+            }
+        }
+    }
+    match last_error {
+        Some(err) if !any_succeeded => Err(err),
+        _ => Ok(updated),
+    }
+}
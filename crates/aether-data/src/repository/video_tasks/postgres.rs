@@ -1,12 +1,13 @@
 use async_trait::async_trait;
 use futures_util::{stream::TryStream, TryStreamExt};
 use sqlx::{postgres::PgRow, PgPool, Postgres, QueryBuilder, Row};
+use tracing::warn;
 
-use crate::error::SqlxResultExt;
+use crate::error::{is_row_level_sql_error, postgres_error, SqlxResultExt};
 use crate::repository::video_tasks::{
-    StoredVideoTask, UpsertVideoTask, VideoTaskLookupKey, VideoTaskModelCount,
-    VideoTaskQueryFilter, VideoTaskReadRepository, VideoTaskStatus, VideoTaskStatusCount,
-    VideoTaskWriteRepository,
+    update_each_if_active, StoredVideoTask, UpsertVideoTask, VideoTaskLookupKey,
+    VideoTaskModelCount, VideoTaskQueryFilter, VideoTaskReadRepository, VideoTaskStatus,
+    VideoTaskStatusCount, VideoTaskWriteRepository,
 };
 use crate::DataLayerError;
 
@@ -731,64 +732,7 @@ impl SqlxVideoTaskRepository {
         task: UpsertVideoTask,
     ) -> Result<Option<StoredVideoTask>, DataLayerError> {
         let sql = update_if_active_sql();
-        let row = sqlx::query(&sql)
-            .bind(task.id)
-            .bind(task.short_id)
-            .bind(task.request_id)
-            .bind(task.user_id)
-            .bind(task.api_key_id)
-            .bind(task.username)
-            .bind(task.api_key_name)
-            .bind(task.external_task_id)
-            .bind(task.provider_id)
-            .bind(task.endpoint_id)
-            .bind(task.key_id)
-            .bind(task.client_api_format)
-            .bind(task.provider_api_format)
-            .bind(task.format_converted)
-            .bind(task.model)
-            .bind(task.prompt)
-            .bind(task.original_request_body)
-            .bind(
-                task.duration_seconds
-                    .map(i32::try_from)
-                    .transpose()
-                    .map_err(|_| {
-                        DataLayerError::UnexpectedValue(
-                            "invalid video task duration_seconds".to_string(),
-                        )
-                    })?,
-            )
-            .bind(task.resolution)
-            .bind(task.aspect_ratio)
-            .bind(task.size)
-            .bind(map_status_for_database(task.status))
-            .bind(i32::from(task.progress_percent))
-            .bind(task.progress_message)
-            .bind(i32::try_from(task.retry_count).map_err(|_| {
-                DataLayerError::UnexpectedValue("invalid video task retry_count".to_string())
-            })?)
-            .bind(i32::try_from(task.poll_interval_seconds).map_err(|_| {
-                DataLayerError::UnexpectedValue(
-                    "invalid video task poll_interval_seconds".to_string(),
-                )
-            })?)
-            .bind(task.next_poll_at_unix_secs.map(|value| value as f64))
-            .bind(i32::try_from(task.poll_count).map_err(|_| {
-                DataLayerError::UnexpectedValue("invalid video task poll_count".to_string())
-            })?)
-            .bind(i32::try_from(task.max_poll_count).map_err(|_| {
-                DataLayerError::UnexpectedValue("invalid video task max_poll_count".to_string())
-            })?)
-            .bind(task.video_url)
-            .bind(task.error_code)
-            .bind(task.error_message)
-            .bind(task.request_metadata)
-            .bind(task.created_at_unix_ms as f64)
-            .bind(task.submitted_at_unix_secs.map(|value| value as f64))
-            .bind(task.completed_at_unix_secs.map(|value| value as f64))
-            .bind(task.updated_at_unix_secs as f64)
-            .bind(vec!["pending", "submitted", "queued", "processing"])
+        let row = bind_update_if_active(sqlx::query(&sql), &task)?
             .fetch_optional(&self.pool)
             .await
             .map_postgres_err()?;
@@ -796,6 +740,68 @@ impl SqlxVideoTaskRepository {
         row.as_ref().map(map_video_task_row).transpose()
     }
 
+    pub async fn update_many_if_active(
+        &self,
+        tasks: Vec<UpsertVideoTask>,
+    ) -> Result<Vec<StoredVideoTask>, DataLayerError> {
+        if tasks.is_empty() {
+            return Ok(Vec::new());
+        }
+
+        let sql = update_if_active_sql();
+        // Bind every update, including the JSON column encoding, before the
+        // transaction takes a connection. A task that fails to bind is logged
+        // and left out instead of failing the whole batch.
+        let mut bind_error = None;
+        let queries = tasks
+            .iter()
+            .filter_map(
+                |task| match bind_update_if_active(sqlx::query(&sql), task) {
+                    Ok(query) => Some((task.id.as_str(), query)),
+                    Err(err) => {
+                        warn!(
+                            task_id = %task.id,
+                            error = %err,
+                            "skipping video task update that failed to bind"
+                        );
+                        bind_error = Some(err);
+                        None
+                    }
+                },
+            )
+            .collect::<Vec<_>>();
+        if let Some(err) = bind_error.filter(|_| queries.is_empty()) {
+            return Err(err);
+        }
+        let mut updated = Vec::with_capacity(queries.len());
+        let mut hit_row_error = false;
+        let mut tx = self.pool.begin().await.map_postgres_err()?;
+        for (id, query) in queries {
+            match query.fetch_optional(&mut *tx).await {
+                Ok(Some(row)) => updated.push(map_video_task_row(&row)?),
+                Ok(None) => {}
+                Err(err) if is_row_level_sql_error(&err) => {
+                    warn!(
+                        task_id = %id,
+                        error = %err,
+                        "video task row rejected, retrying the batch per task"
+                    );
+                    hit_row_error = true;
+                    break;
+                }
+                Err(err) => return Err(postgres_error(err)),
+            }
+        }
+        if hit_row_error {
+            // Only the offending row's values were rejected; roll back and
+            // write row by row so it does not hold back the rest.
+            tx.rollback().await.map_postgres_err()?;
+            return update_each_if_active(self, tasks).await;
+        }
+        tx.commit().await.map_postgres_err()?;
+        Ok(updated)
+    }
+
     pub async fn claim_due(
         &self,
         now_unix_secs: u64,
@@ -916,6 +922,13 @@ impl VideoTaskWriteRepository for SqlxVideoTaskRepository {
         Self::update_if_active(self, task).await
     }
 
+    async fn update_many_if_active(
+        &self,
+        tasks: Vec<UpsertVideoTask>,
+    ) -> Result<Vec<StoredVideoTask>, DataLayerError> {
+        Self::update_many_if_active(self, tasks).await
+    }
+
     async fn claim_due(
         &self,
         now_unix_secs: u64,
@@ -926,6 +939,68 @@ impl VideoTaskWriteRepository for SqlxVideoTaskRepository {
     }
 }
 
+fn bind_update_if_active<'q>(
+    query: sqlx::query::Query<'q, Postgres, sqlx::postgres::PgArguments>,
+    task: &'q UpsertVideoTask,
+) -> Result<sqlx::query::Query<'q, Postgres, sqlx::postgres::PgArguments>, DataLayerError> {
+    Ok(query
+        .bind(&task.id)
+        .bind(&task.short_id)
+        .bind(&task.request_id)
+        .bind(&task.user_id)
+        .bind(&task.api_key_id)
+        .bind(&task.username)
+        .bind(&task.api_key_name)
+        .bind(&task.external_task_id)
+        .bind(&task.provider_id)
+        .bind(&task.endpoint_id)
+        .bind(&task.key_id)
+        .bind(&task.client_api_format)
+        .bind(&task.provider_api_format)
+        .bind(task.format_converted)
+        .bind(&task.model)
+        .bind(&task.prompt)
+        .bind(&task.original_request_body)
+        .bind(
+            task.duration_seconds
+                .map(i32::try_from)
+                .transpose()
+                .map_err(|_| {
+                    DataLayerError::UnexpectedValue(
+                        "invalid video task duration_seconds".to_string(),
+                    )
+                })?,
+        )
+        .bind(&task.resolution)
+        .bind(&task.aspect_ratio)
+        .bind(&task.size)
+        .bind(map_status_for_database(task.status))
+        .bind(i32::from(task.progress_percent))
+        .bind(&task.progress_message)
+        .bind(i32::try_from(task.retry_count).map_err(|_| {
+            DataLayerError::UnexpectedValue("invalid video task retry_count".to_string())
+        })?)
+        .bind(i32::try_from(task.poll_interval_seconds).map_err(|_| {
+            DataLayerError::UnexpectedValue("invalid video task poll_interval_seconds".to_string())
+        })?)
+        .bind(task.next_poll_at_unix_secs.map(|value| value as f64))
+        .bind(i32::try_from(task.poll_count).map_err(|_| {
+            DataLayerError::UnexpectedValue("invalid video task poll_count".to_string())
+        })?)
+        .bind(i32::try_from(task.max_poll_count).map_err(|_| {
+            DataLayerError::UnexpectedValue("invalid video task max_poll_count".to_string())
+        })?)
+        .bind(&task.video_url)
+        .bind(&task.error_code)
+        .bind(&task.error_message)
+        .bind(&task.request_metadata)
+        .bind(task.created_at_unix_ms as f64)
+        .bind(task.submitted_at_unix_secs.map(|value| value as f64))
+        .bind(task.completed_at_unix_secs.map(|value| value as f64))
+        .bind(task.updated_at_unix_secs as f64)
+        .bind(vec!["pending", "submitted", "queued", "processing"]))
+}
+
 fn has_video_task_filter(
     filter: &VideoTaskQueryFilter,
     created_since_unix_secs: Option<u64>,
@@ -1,13 +1,16 @@
+use std::collections::HashMap;
+
 use async_trait::async_trait;
 use sqlx::{sqlite::SqliteRow, QueryBuilder, Row, Sqlite};
+use tracing::warn;
 
 use super::{
-    StoredVideoTask, UpsertVideoTask, VideoTaskLookupKey, VideoTaskModelCount,
-    VideoTaskQueryFilter, VideoTaskReadRepository, VideoTaskStatus, VideoTaskStatusCount,
-    VideoTaskWriteRepository,
+    update_each_if_active, StoredVideoTask, UpsertVideoTask, VideoTaskLookupKey,
+    VideoTaskModelCount, VideoTaskQueryFilter, VideoTaskReadRepository, VideoTaskStatus,
+    VideoTaskStatusCount, VideoTaskWriteRepository,
 };
 use crate::driver::sqlite::SqlitePool;
-use crate::error::SqlResultExt;
+use crate::error::{is_row_level_sql_error, sql_error, SqlResultExt};
 use crate::DataLayerError;
 
 const VIDEO_TASK_COLUMNS: &str = r#"
@@ -63,12 +66,7 @@ impl SqliteVideoTaskRepository {
     }
 
     async fn find_by_id(&self, id: &str) -> Result<Option<StoredVideoTask>, DataLayerError> {
-        let row = sqlx::query(&format!("{VIDEO_TASK_COLUMNS} WHERE id = ? LIMIT 1"))
-            .bind(id)
-            .fetch_optional(&self.pool)
-            .await
-            .map_sql_err()?;
-        row.as_ref().map(map_video_task_row).transpose()
+        find_video_task_by_id(&self.pool, id).await
     }
 
     async fn find_by_short_id(
@@ -285,11 +283,12 @@ impl VideoTaskReadRepository for SqliteVideoTaskRepository {
 impl VideoTaskWriteRepository for SqliteVideoTaskRepository {
     async fn upsert(&self, task: UpsertVideoTask) -> Result<StoredVideoTask, DataLayerError> {
         let id = task.id.clone();
-        bind_task(sqlx::query(UPSERT_SQL), task, true, false)?
-            .execute(&self.pool)
+        let mut conn = self.pool.acquire().await.map_sql_err()?;
+        bind_task(sqlx::query(UPSERT_SQL), &task, true, false)?
+            .execute(&mut *conn)
             .await
             .map_sql_err()?;
-        self.find_by_id(&id)
+        find_video_task_by_id(&mut *conn, &id)
             .await?
             .ok_or_else(|| DataLayerError::UnexpectedValue("upserted video task missing".into()))
     }
@@ -299,15 +298,91 @@ impl VideoTaskWriteRepository for SqliteVideoTaskRepository {
         task: UpsertVideoTask,
     ) -> Result<Option<StoredVideoTask>, DataLayerError> {
         let id = task.id.clone();
-        let rows_affected = bind_task(sqlx::query(UPDATE_IF_ACTIVE_SQL), task, false, true)?
-            .execute(&self.pool)
+        // The write and the read-back share one pooled connection so each
+        // poll update costs a single checkout.
+        let mut conn = self.pool.acquire().await.map_sql_err()?;
+        let rows_affected = bind_task(sqlx::query(UPDATE_IF_ACTIVE_SQL), &task, false, true)?
+            .execute(&mut *conn)
             .await
             .map_sql_err()?
             .rows_affected();
         if rows_affected == 0 {
             return Ok(None);
         }
-        self.find_by_id(&id).await
+        find_video_task_by_id(&mut *conn, &id).await
+    }
+
+    async fn update_many_if_active(
+        &self,
+        tasks: Vec<UpsertVideoTask>,
+    ) -> Result<Vec<StoredVideoTask>, DataLayerError> {
+        if tasks.is_empty() {
+            return Ok(Vec::new());
+        }
+        // Bind every update, including the JSON column serialization,
+        // before the transaction takes a connection. A task that fails to
+        // bind is logged and left out instead of failing the whole batch.
+        let mut bind_error = None;
+        let queries = tasks
+            .iter()
+            .filter_map(|task| {
+                match bind_task(sqlx::query(UPDATE_IF_ACTIVE_SQL), task, false, true) {
+                    Ok(query) => Some((task.id.as_str(), query)),
+                    Err(err) => {
+                        warn!(
+                            task_id = %task.id,
+                            error = %err,
+                            "skipping video task update that failed to bind"
+                        );
+                        bind_error = Some(err);
+                        None
+                    }
+                }
+            })
+            .collect::<Vec<_>>();
+        if let Some(err) = bind_error.filter(|_| queries.is_empty()) {
+            return Err(err);
+        }
+        let mut updated_ids = Vec::with_capacity(queries.len());
+        let mut hit_row_error = false;
+        let mut tx = self.pool.begin().await.map_sql_err()?;
+        for (id, query) in queries {
+            match query.execute(&mut *tx).await {
+                Ok(result) => {
+                    if result.rows_affected() > 0 {
+                        updated_ids.push(id.to_string());
+                    }
+                }
+                Err(err) if is_row_level_sql_error(&err) => {
+                    warn!(
+                        task_id = %id,
+                        error = %err,
+                        "video task row rejected, retrying the batch per task"
+                    );
+                    hit_row_error = true;
+                    break;
+                }
+                Err(err) => return Err(sql_error(err)),
+            }
+        }
+        if hit_row_error {
+            // Only the offending row's values were rejected; roll back and
+            // write row by row so it does not hold back the rest.
+            tx.rollback().await.map_sql_err()?;
+            return update_each_if_active(self, tasks).await;
+        }
+        tx.commit().await.map_sql_err()?;
+
+        let mut reloaded = self
+            .reload_ids(&updated_ids)
+            .await?
+            .into_iter()
+            .map(|task| (task.id.clone(), task))
+            .collect::<HashMap<_, _>>();
+        Ok(updated_ids
+            .iter()
+            .filter_map(|id| reloaded.remove(id))
+            .collect())
     }
 
     async fn claim_due(
@@ -321,17 +396,22 @@ impl VideoTaskWriteRepository for SqliteVideoTaskRepository {
         }
         let due = self.list_due(now_unix_secs, limit).await?;
         let ids = due.iter().map(|task| task.id.clone()).collect::<Vec<_>>();
-        for id in &ids {
-            sqlx::query(
-                "UPDATE video_tasks SET next_poll_at = ?, updated_at = MAX(updated_at, ?) WHERE id = ?",
-            )
-            .bind(u64_to_i64(claim_until_unix_secs, "video task claim_until")?)
-            .bind(u64_to_i64(now_unix_secs, "video task now")?)
-            .bind(id)
-            .execute(&self.pool)
-            .await
-            .map_sql_err()?;
+        if ids.is_empty() {
+            return Ok(Vec::new());
         }
+        let mut builder = QueryBuilder::<Sqlite>::new("UPDATE video_tasks SET next_poll_at = ");
+        builder.push_bind(u64_to_i64(claim_until_unix_secs, "video task claim_until")?);
+        builder.push(", updated_at = MAX(updated_at, ");
+        builder.push_bind(u64_to_i64(now_unix_secs, "video task now")?);
+        builder.push(") WHERE id IN (");
+        {
+            let mut separated = builder.separated(", ");
+            for id in &ids {
+                separated.push_bind(id);
+            }
+        }
+        builder.push(")");
+        builder.build().execute(&self.pool).await.map_sql_err()?;
         self.reload_ids(&ids).await
     }
 }
@@ -428,46 +508,61 @@ WHERE id = ?
   AND status IN ('pending', 'submitted', 'queued', 'processing')
 "#;
 
+async fn find_video_task_by_id<'e, E>(
+    executor: E,
+    id: &str,
+) -> Result<Option<StoredVideoTask>, DataLayerError>
+where
+    E: sqlx::Executor<'e, Database = Sqlite>,
+{
+    let row = sqlx::query(&format!("{VIDEO_TASK_COLUMNS} WHERE id = ? LIMIT 1"))
+        .bind(id)
+        .fetch_optional(executor)
+        .await
+        .map_sql_err()?;
+    row.as_ref().map(map_video_task_row).transpose()
+}
+
 fn bind_task<'q>(
     query: sqlx::query::Query<'q, Sqlite, sqlx::sqlite::SqliteArguments<'q>>,
-    task: UpsertVideoTask,
+    task: &'q UpsertVideoTask,
     include_insert_id: bool,
     include_update_id: bool,
 ) -> Result<sqlx::query::Query<'q, Sqlite, sqlx::sqlite::SqliteArguments<'q>>, DataLayerError> {
     let original_request_body = json_to_string(&task.original_request_body)?;
     let request_metadata = json_to_string(&task.request_metadata)?;
     let query = if include_insert_id {
-        query.bind(task.id.clone())
+        query.bind(&task.id)
     } else {
         query
     };
     let bound = query
-        .bind(task.short_id)
-        .bind(task.request_id)
-        .bind(task.user_id)
-        .bind(task.api_key_id)
-        .bind(task.username)
-        .bind(task.api_key_name)
-        .bind(task.external_task_id)
-        .bind(task.provider_id)
-        .bind(task.endpoint_id)
-        .bind(task.key_id)
-        .bind(task.client_api_format)
-        .bind(task.provider_api_format)
+        .bind(&task.short_id)
+        .bind(&task.request_id)
+        .bind(&task.user_id)
+        .bind(&task.api_key_id)
+        .bind(&task.username)
+        .bind(&task.api_key_name)
+        .bind(&task.external_task_id)
+        .bind(&task.provider_id)
+        .bind(&task.endpoint_id)
+        .bind(&task.key_id)
+        .bind(&task.client_api_format)
+        .bind(&task.provider_api_format)
         .bind(task.format_converted)
-        .bind(task.model)
-        .bind(task.prompt)
+        .bind(&task.model)
+        .bind(&task.prompt)
         .bind(original_request_body)
         .bind(optional_u32_to_i32(
             task.duration_seconds,
             "video task duration_seconds",
         )?)
-        .bind(task.resolution)
-        .bind(task.aspect_ratio)
-        .bind(task.size)
+        .bind(&task.resolution)
+        .bind(&task.aspect_ratio)
+        .bind(&task.size)
         .bind(status_to_database(task.status))
         .bind(i32::from(task.progress_percent))
-        .bind(task.progress_message)
+        .bind(&task.progress_message)
         .bind(u32_to_i32(task.retry_count, "video task retry_count")?)
         .bind(u32_to_i32(
             task.poll_interval_seconds,
@@ -482,9 +577,9 @@ fn bind_task<'q>(
             task.max_poll_count,
             "video task max_poll_count",
         )?)
-        .bind(task.video_url)
-        .bind(task.error_code)
-        .bind(task.error_message)
+        .bind(&task.video_url)
+        .bind(&task.error_code)
+        .bind(&task.error_message)
         .bind(request_metadata)
         .bind(u64_to_i64(
             task.created_at_unix_ms,
@@ -503,7 +598,7 @@ fn bind_task<'q>(
             "video task updated_at",
         )?);
     if include_update_id {
-        Ok(bound.bind(task.id))
+        Ok(bound.bind(&task.id))
     } else {
         Ok(bound)
     }
@@ -774,6 +869,134 @@ mod tests {
             .expect("active task should update")
             .expect("active task should exist");
         assert_eq!(updated.progress_percent, 50);
+
+        let batch = repository
+            .update_many_if_active(vec![
+                UpsertVideoTask {
+                    progress_percent: 75,
+                    ..sample_task("task-1", VideoTaskStatus::Processing, 160)
+                },
+                sample_task("task-2", VideoTaskStatus::Processing, 160),
+            ])
+            .await
+            .expect("batch update should succeed");
+        assert_eq!(batch.len(), 1);
+        assert_eq!(batch[0].id, "task-1");
+        assert_eq!(batch[0].progress_percent, 75);
+    }
+
+    #[tokio::test]
+    async fn sqlite_batch_update_skips_tasks_that_fail_to_bind() {
+        let pool = sqlx::sqlite::SqlitePoolOptions::new()
+            .max_connections(1)
+            .connect("sqlite::memory:")
+            .await
+            .expect("sqlite pool should connect");
+        run_sqlite_migrations(&pool)
+            .await
+            .expect("sqlite migrations should run");
+
+        let repository = SqliteVideoTaskRepository::new(pool);
+        for id in ["task-1", "task-2", "task-3"] {
+            repository
+                .upsert(sample_task(id, VideoTaskStatus::Submitted, 100))
+                .await
+                .expect("task should insert");
+        }
+
+        let batch = repository
+            .update_many_if_active(vec![
+                UpsertVideoTask {
+                    progress_percent: 25,
+                    ..sample_task("task-1", VideoTaskStatus::Processing, 110)
+                },
+                UpsertVideoTask {
+                    poll_count: u32::MAX,
+                    ..sample_task("task-2", VideoTaskStatus::Processing, 110)
+                },
+                UpsertVideoTask {
+                    progress_percent: 30,
+                    ..sample_task("task-3", VideoTaskStatus::Processing, 110)
+                },
+            ])
+            .await
+            .expect("batch update should succeed");
+        assert_eq!(
+            batch
+                .iter()
+                .map(|task| task.id.as_str())
+                .collect::<Vec<_>>(),
+            vec!["task-1", "task-3"]
+        );
+        assert_eq!(batch[1].progress_percent, 30);
+
+        let skipped = repository
+            .find(VideoTaskLookupKey::Id("task-2"))
+            .await
+            .expect("skipped task should load")
+            .expect("skipped task should exist");
+        assert_eq!(skipped.status, VideoTaskStatus::Submitted);
+
+        assert!(repository
+            .update_many_if_active(vec![UpsertVideoTask {
+                poll_count: u32::MAX,
+                ..sample_task("task-2", VideoTaskStatus::Processing, 120)
+            }])
+            .await
+            .is_err());
+    }
+
+    #[tokio::test]
+    async fn sqlite_batch_update_retries_per_task_after_row_error() {
+        let pool = sqlx::sqlite::SqlitePoolOptions::new()
+            .max_connections(1)
+            .connect("sqlite::memory:")
+            .await
+            .expect("sqlite pool should connect");
+        run_sqlite_migrations(&pool)
+            .await
+            .expect("sqlite migrations should run");
+
+        let repository = SqliteVideoTaskRepository::new(pool);
+        for id in ["task-1", "task-2", "task-3"] {
+            repository
+                .upsert(sample_task(id, VideoTaskStatus::Submitted, 100))
+                .await
+                .expect("task should insert");
+        }
+
+        let batch = repository
+            .update_many_if_active(vec![
+                UpsertVideoTask {
+                    progress_percent: 25,
+                    ..sample_task("task-1", VideoTaskStatus::Processing, 110)
+                },
+                UpsertVideoTask {
+                    short_id: Some("short-task-3".to_string()),
+                    ..sample_task("task-2", VideoTaskStatus::Processing, 110)
+                },
+                UpsertVideoTask {
+                    progress_percent: 30,
+                    ..sample_task("task-3", VideoTaskStatus::Processing, 110)
+                },
+            ])
+            .await
+            .expect("batch update should succeed");
+        assert_eq!(
+            batch
+                .iter()
+                .map(|task| task.id.as_str())
+                .collect::<Vec<_>>(),
+            vec!["task-1", "task-3"]
+        );
+        assert_eq!(batch[0].progress_percent, 25);
+
+        let rejected = repository
+            .find(VideoTaskLookupKey::Id("task-2"))
+            .await
+            .expect("rejected task should load")
+            .expect("rejected task should exist");
+        assert_eq!(rejected.short_id.as_deref(), Some("short-task-2"));
     }
 
     fn sample_task(
@@ -1,4 +1,4 @@
-use std::collections::{BTreeMap, BTreeSet};
+use std::collections::{BTreeMap, BTreeSet, HashSet};
 
 use aether_data_contracts::repository::provider_catalog::{
     StoredProviderCatalogEndpoint, StoredProviderCatalogKey,
@@ -10,6 +10,7 @@ use aether_provider_transport::url::{
 };
 use regex::Regex;
 use serde_json::{json, Value};
+use tracing::warn;
 
 const MODEL_FETCH_FORMAT_PRIORITY: &[&[&str]] = &[
     &[
@@ -458,25 +459,31 @@ pub fn apply_model_filters(
     exclude_patterns: Vec<String>,
 ) -> Vec<String> {
     let mut filtered = BTreeSet::new();
-    for model_id in fetched_model_ids {
-        if model_id.trim().is_empty() {
-            continue;
-        }
-        let included = if include_patterns.is_empty() {
-            true
-        } else {
-            include_patterns
+    if include_patterns.is_empty() && exclude_patterns.is_empty() {
+        // Most keys configure no filters; keep every non-empty id without
+        // compiling matchers or probing them per model.
+        filtered.extend(
+            fetched_model_ids
                 .iter()
-                .any(|pattern| wildcard_matches(pattern, model_id))
-        };
-        if !included {
-            continue;
-        }
-        let excluded = exclude_patterns
-            .iter()
-            .any(|pattern| wildcard_matches(pattern, model_id));
-        if !excluded {
-            filtered.insert(model_id.trim().to_string());
+                .map(|model_id| model_id.trim())
+                .filter(|model_id| !model_id.is_empty())
+                .map(ToOwned::to_owned),
+        );
+    } else {
+        let include_matcher = WildcardMatcher::new(&include_patterns);
+        let exclude_matcher = WildcardMatcher::new(&exclude_patterns);
+        for model_id in fetched_model_ids {
+            if model_id.trim().is_empty() {
+                continue;
+            }
+            let included = include_patterns.is_empty() || include_matcher.is_match(model_id);
+            if !included {
+                continue;
+            }
+            let excluded = exclude_matcher.is_match(model_id);
+            if !excluded {
+                filtered.insert(model_id.trim().to_string());
+            }
         }
     }
     for model in locked_models {
@@ -828,19 +835,66 @@ fn preset_model(model_id: &str, owned_by: &str, display_name: &str, api_format:
     })
 }
 
-fn wildcard_matches(pattern: &str, model_id: &str) -> bool {
-    let mut regex = String::from("^");
+// Literal patterns are answered with a hash lookup; the remaining wildcard
+// patterns are translated into one anchored alternation and compiled once per
+// filter pass, so the regex engine scans each model id in a single pass
+// regardless of how many globs are configured. If the alternation is too large
+// to compile, each glob gets its own regex instead.
+struct WildcardMatcher {
+    literals: HashSet<String>,
+    regexes: Vec<Regex>,
+}
+
+impl WildcardMatcher {
+    fn new(patterns: &[String]) -> Self {
+        let (wildcards, literals): (Vec<&String>, Vec<&String>) = patterns
+            .iter()
+            .partition(|pattern| pattern.contains(['*', '?']));
+        let translated = wildcards
+            .iter()
+            .map(|pattern| wildcard_pattern_regex(pattern))
+            .collect::<Vec<_>>();
+        let regexes = if translated.is_empty() {
+            Vec::new()
+        } else {
+            match Regex::new(&format!("^(?:{})$", translated.join("|"))) {
+                Ok(regex) => vec![regex],
+                Err(err) => {
+                    warn!(
+                        patterns = translated.len(),
+                        error = %err,
+                        "combined model filter regex failed to build; matching wildcard patterns one by one"
+                    );
+                    translated
+                        .iter()
+                        .filter_map(|pattern| Regex::new(&format!("^{pattern}$")).ok())
+                        .collect()
+                }
+            }
+        };
+        Self {
+            literals: literals.into_iter().cloned().collect(),
+            regexes,
+        }
+    }
+
+    fn is_match(&self, model_id: &str) -> bool {
+        self.literals.contains(model_id)
+            || self.regexes.iter().any(|regex| regex.is_match(model_id))
+    }
+}
+
+fn wildcard_pattern_regex(pattern: &str) -> String {
+    let mut regex = String::with_capacity(pattern.len() + 8);
+    let mut buf = [0u8; 4];
     for ch in pattern.chars() {
         match ch {
             '*' => regex.push_str(".*"),
             '?' => regex.push('.'),
-            other => regex.push_str(&regex::escape(&other.to_string())),
+            other => regex.push_str(&regex::escape(other.encode_utf8(&mut buf))),
         }
     }
-    regex.push('$');
-    Regex::new(&regex)
-        .ok()
-        .is_some_and(|compiled| compiled.is_match(model_id))
+    regex
 }
 
 fn normalize_api_format(value: &str) -> String {
@@ -858,6 +912,7 @@ mod tests {
         aggregate_models_for_cache, apply_model_filters, build_gemini_models_url,
         build_models_fetch_url, merge_upstream_metadata, parse_models_response,
         parse_models_response_page, preset_models_for_provider, selected_models_fetch_endpoints,
+        WildcardMatcher,
     };
 
     fn sample_endpoint(
@@ -916,6 +971,29 @@ mod tests {
         .expect("key transport should build")
     }
 
+    #[test]
+    fn apply_model_filters_without_patterns_keeps_trimmed_unique_models() {
+        let filtered = apply_model_filters(
+            &[
+                " gpt-5 ".to_string(),
+                "gpt-5".to_string(),
+                "   ".to_string(),
+                "claude-4".to_string(),
+            ],
+            vec!["locked-model".to_string()],
+            Vec::new(),
+            Vec::new(),
+        );
+        assert_eq!(
+            filtered,
+            vec![
+                "claude-4".to_string(),
+                "gpt-5".to_string(),
+                "locked-model".to_string()
+            ]
+        );
+    }
+
     #[test]
     fn apply_model_filters_respects_include_exclude_and_locked_models() {
         let filtered = apply_model_filters(
@@ -934,6 +1012,31 @@ mod tests {
         );
     }
 
+    #[test]
+    fn wildcard_matcher_combines_literal_and_glob_patterns() {
+        let matcher = WildcardMatcher::new(&[
+            "gpt-4o".to_string(),
+            "claude-*".to_string(),
+            "gemini-?.5".to_string(),
+        ]);
+        assert!(matcher.is_match("gpt-4o"));
+        assert!(matcher.is_match("claude-sonnet-4"));
+        assert!(matcher.is_match("gemini-2.5"));
+        assert!(!matcher.is_match("gpt-4o-mini"));
+        assert!(!matcher.is_match("gemini-2.50"));
+    }
+
+    #[test]
+    fn wildcard_matcher_falls_back_to_per_pattern_regexes_when_combined_is_too_large() {
+        let patterns = (0..20)
+            .map(|index| format!("model-{index}-{}", "?".repeat(800)))
+            .collect::<Vec<_>>();
+        let matcher = WildcardMatcher::new(&patterns);
+        assert_eq!(matcher.regexes.len(), patterns.len());
+        assert!(matcher.is_match(&format!("model-7-{}", "x".repeat(800))));
+        assert!(!matcher.is_match(&format!("model-7-{}", "x".repeat(799))));
+    }
+
     #[test]
     fn aggregate_models_for_cache_merges_api_formats_and_sorts_by_model_id() {
         let aggregated = aggregate_models_for_cache(&[
@@ -4,7 +4,10 @@ use super::{
 };
 use crate::core::{OAuthAdapterRegistry, OAuthAuthorizeResponse, OAuthError};
 use crate::network::OAuthHttpExecutor;
-use std::sync::Arc;
+use std::sync::{Arc, LazyLock};
+
+static BUILTIN_IDENTITY_OAUTH_SERVICE: LazyLock<IdentityOAuthService> =
+    LazyLock::new(IdentityOAuthService::with_builtin_providers);
 
 #[derive(Debug, Clone, Default)]
 pub struct IdentityOAuthService {
@@ -36,6 +39,11 @@ impl IdentityOAuthService {
             .with_provider(Arc::new(CustomOidcIdentityOAuthProvider))
     }
 
+    /// Process-wide service with the builtin providers, built on first use.
+    pub fn builtin() -> &'static Self {
+        &BUILTIN_IDENTITY_OAUTH_SERVICE
+    }
+
     pub fn with_provider(mut self, provider: Arc<dyn IdentityOAuthProvider>) -> Self {
         self.registry.insert(provider.provider_type(), provider);
         self
@@ -4,7 +4,10 @@ use super::{
 };
 use crate::core::{OAuthAdapterRegistry, OAuthAuthorizeResponse, OAuthError};
 use crate::network::OAuthHttpExecutor;
-use std::sync::Arc;
+use std::sync::{Arc, LazyLock};
+
+static BUILTIN_PROVIDER_OAUTH_SERVICE: LazyLock<ProviderOAuthService> =
+    LazyLock::new(ProviderOAuthService::with_builtin_adapters);
 
 #[derive(Debug, Clone, Default)]
 pub struct ProviderOAuthService {
@@ -35,6 +38,11 @@ impl ProviderOAuthService {
         service
     }
 
+    /// Process-wide service with the builtin adapters, built on first use.
+    pub fn builtin() -> &'static Self {
+        &BUILTIN_PROVIDER_OAUTH_SERVICE
+    }
+
     pub fn with_adapter(mut self, adapter: Arc<dyn ProviderOAuthAdapter>) -> Self {
         self.registry.insert(adapter.provider_type(), adapter);
         self
@@ -138,4 +146,12 @@ mod tests {
         }
         assert!(service.adapter("unknown").is_err());
     }
+
+    #[test]
+    fn builtin_provider_service_is_built_once() {
+        let service = ProviderOAuthService::builtin();
+
+        assert!(std::ptr::eq(service, ProviderOAuthService::builtin()));
+        assert!(service.adapter("codex").is_ok());
+    }
 }
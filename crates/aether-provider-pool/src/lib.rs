@@ -85,6 +85,15 @@ mod tests {
         assert_eq!(service.adapter("unknown").provider_type(), "default");
     }
 
+    #[test]
+    fn builtin_service_is_shared_between_callers() {
+        let first = ProviderPoolService::builtin();
+        let second = ProviderPoolService::builtin();
+
+        assert!(std::ptr::eq(first, second));
+        assert_eq!(first.adapter("kiro").provider_type(), "kiro");
+    }
+
     #[test]
     fn builtin_service_owns_quota_refresh_support_and_endpoint_selection() {
         let service = ProviderPoolService::with_builtin_adapters();
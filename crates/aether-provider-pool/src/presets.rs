@@ -84,7 +84,7 @@ pub fn normalize_provider_scheduling_presets(
 }
 
 pub fn build_admin_pool_scheduling_presets_payload() -> Value {
-    let service = ProviderPoolService::with_builtin_adapters();
+    let service = ProviderPoolService::builtin();
     json!([
         provider_pool_preset_payload(
             "lru",
@@ -10,7 +10,7 @@ pub fn provider_pool_key_account_quota_exhausted(
     key: &StoredProviderCatalogKey,
     provider_type: &str,
 ) -> bool {
-    let adapter = ProviderPoolService::with_builtin_adapters().adapter(provider_type);
+    let adapter = ProviderPoolService::builtin().adapter(provider_type);
     adapter.quota_exhausted(&ProviderPoolMemberInput {
         provider_type,
         key,
@@ -50,7 +50,7 @@ pub fn provider_pool_quota_metadata_updated_at(
 
 pub fn provider_pool_quota_metadata_provider_type(metadata_update: &Value) -> Option<String> {
     let object = metadata_update.as_object()?;
-    let service = ProviderPoolService::with_builtin_adapters();
+    let service = ProviderPoolService::builtin();
     let known_provider_type = service
         .provider_types()
         .find(|provider_type| object.contains_key(*provider_type))
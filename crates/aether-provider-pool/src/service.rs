@@ -1,5 +1,5 @@
 use std::collections::BTreeMap;
-use std::sync::Arc;
+use std::sync::{Arc, LazyLock};
 
 use aether_data_contracts::repository::provider_catalog::{
     StoredProviderCatalogEndpoint, StoredProviderCatalogKey,
@@ -17,6 +17,9 @@ use crate::providers::{
     VERTEX_AI_PROVIDER_POOL_ADAPTER,
 };
 
+static BUILTIN_PROVIDER_POOL_SERVICE: LazyLock<ProviderPoolService> =
+    LazyLock::new(ProviderPoolService::with_builtin_adapters);
+
 #[derive(Clone)]
 pub struct ProviderPoolService {
     adapters: BTreeMap<String, Arc<dyn ProviderPoolAdapter>>,
@@ -58,6 +61,12 @@ impl ProviderPoolService {
             .with_adapter(Arc::new(VERTEX_AI_PROVIDER_POOL_ADAPTER))
     }
 
+    /// Shared [`Self::with_builtin_adapters`] instance. The adapter set never
+    /// changes, so scheduling paths borrow this instead of rebuilding it.
+    pub fn builtin() -> &'static Self {
+        &BUILTIN_PROVIDER_POOL_SERVICE
+    }
+
     pub fn with_adapter(mut self, adapter: Arc<dyn ProviderPoolAdapter>) -> Self {
         self.adapters
             .insert(adapter.provider_type().trim().to_ascii_lowercase(), adapter);
@@ -2,7 +2,7 @@ use aether_ai_formats::formats::matrix::{
     api_data_format_id, request_conversion_kind, request_conversion_requires_enable_flag,
     RequestConversionKind,
 };
-use aether_ai_formats::normalize_api_format_alias;
+use aether_ai_formats::{normalize_api_format_alias, FormatId};
 
 use crate::auth::{
     resolve_local_gemini_auth, resolve_local_openai_bearer_auth, resolve_local_standard_auth,
@@ -411,28 +411,39 @@ fn endpoint_accepts_client_api_format(
         return false;
     }
 
+    let client_format = FormatId::parse(client_api_format);
     if config
         .get("reject_formats")
-        .is_some_and(|value| json_format_list_contains(value, client_api_format))
+        .is_some_and(|value| json_format_list_contains(value, client_api_format, client_format))
     {
         return false;
     }
 
     match config.get("accept_formats") {
-        Some(value) => json_format_list_contains(value, client_api_format),
+        Some(value) => json_format_list_contains(value, client_api_format, client_format),
         None => true,
     }
 }
 
-fn json_format_list_contains(value: &serde_json::Value, api_format: &str) -> bool {
+// The client format is parsed once by the caller instead of once per configured entry.
+fn json_format_list_contains(
+    value: &serde_json::Value,
+    api_format: &str,
+    parsed_api_format: Option<FormatId>,
+) -> bool {
     let Some(items) = value.as_array() else {
         return false;
     };
-    items.iter().any(|item| {
-        item.as_str().is_some_and(|candidate| {
-            aether_ai_formats::api_format_alias_matches(candidate, api_format)
+    items
+        .iter()
+        .filter_map(serde_json::Value::as_str)
+        .any(|candidate| {
+            aether_ai_formats::api_format_alias_matches_parsed(
+                candidate,
+                parsed_api_format,
+                api_format,
+            )
         })
-    })
 }
 
 #[cfg(test)]
@@ -572,6 +583,31 @@ mod tests {
         ));
     }
 
+    #[test]
+    fn endpoint_format_lists_match_client_format_aliases_and_case() {
+        let transport = transport_snapshot(
+            "custom",
+            "openai:responses",
+            "bearer",
+            false,
+            Some(json!({
+                "enabled": true,
+                "accept_formats": [" CLAUDE:MESSAGES ", 42],
+            })),
+        );
+
+        assert!(request_conversion_enabled_for_transport(
+            &transport,
+            "claude:messages",
+            "openai:responses"
+        ));
+        assert!(!request_conversion_enabled_for_transport(
+            &transport,
+            "gemini:generate_content",
+            "openai:responses"
+        ));
+    }
+
     #[test]
     fn endpoint_reject_formats_override_endpoint_cross_format_enablement() {
         let transport = transport_snapshot(
@@ -631,6 +631,24 @@ mod tests {
         );
     }
 
+    #[test]
+    fn cached_decrypted_secret_is_scoped_to_encryption_key() {
+        let key = sample_key();
+
+        let mapped = map_key(key.clone(), DEVELOPMENT_ENCRYPTION_KEY, &[])
+            .expect("development key should decrypt");
+        assert_eq!(mapped.decrypted_api_key, "sk-live-openai");
+
+        let remapped = map_key(key.clone(), DEVELOPMENT_ENCRYPTION_KEY, &[])
+            .expect("cached secret should decrypt");
+        assert_eq!(remapped, mapped);
+
+        let error = map_key(key, "wrong-encryption-key", &[])
+            .expect_err("cached secret should not be served for another encryption key");
+        assert!(matches!(error, DataLayerError::UnexpectedValue(message)
+            if message.contains("failed to decrypt provider_api_keys.api_key")));
+    }
+
     #[test]
     fn accepts_stringified_allowed_models_in_transport_key() {
         let encrypted_api_key =
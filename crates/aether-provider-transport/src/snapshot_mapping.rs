@@ -1,13 +1,33 @@
+use std::collections::HashMap;
+use std::sync::{LazyLock, RwLock};
+use std::time::{Duration, Instant};
+
 use aether_crypto::{decrypt_python_fernet_ciphertext, looks_like_python_fernet_ciphertext};
 use aether_data_contracts::repository::provider_catalog::{
     StoredProviderCatalogEndpoint, StoredProviderCatalogKey, StoredProviderCatalogProvider,
 };
 use aether_data_contracts::DataLayerError;
+use sha2::{Digest, Sha256};
 
 use super::{
     GatewayProviderTransportEndpoint, GatewayProviderTransportKey, GatewayProviderTransportProvider,
 };
 
+const DECRYPTED_SECRET_CACHE_TTL: Duration = Duration::from_secs(300);
+const DECRYPTED_SECRET_CACHE_MAX_ENTRIES: usize = 1_024;
+
+static DECRYPTED_SECRET_CACHE: LazyLock<RwLock<HashMap<String, CachedDecryptedSecret>>> =
+    LazyLock::new(|| RwLock::new(HashMap::new()));
+
+#[derive(Debug, Clone)]
+struct CachedDecryptedSecret {
+    // Entries only need to notice a key rotation, so they hold a digest
+    // prefix rather than another copy of the master key.
+    encryption_key_fingerprint: EncryptionKeyFingerprint,
+    plaintext: String,
+    decrypted_at: Instant,
+}
+
 pub(super) fn map_provider(
     provider: StoredProviderCatalogProvider,
 ) -> GatewayProviderTransportProvider {
@@ -131,13 +151,21 @@ fn decrypt_secret(
         return Ok(ciphertext.trim().to_string());
     }
 
+    if let Some(value) = cached_decrypted_secret(encryption_key, ciphertext) {
+        return Ok(value);
+    }
+
     match decrypt_python_fernet_ciphertext(encryption_key, ciphertext) {
-        Ok(value) => Ok(value),
+        Ok(value) => {
+            cache_decrypted_secret(encryption_key, ciphertext, &value);
+            Ok(value)
+        }
         Err(error) => {
             for fallback_encryption_key in fallback_encryption_keys {
                 if let Ok(value) =
                     decrypt_python_fernet_ciphertext(fallback_encryption_key, ciphertext)
                 {
+                    cache_decrypted_secret(encryption_key, ciphertext, &value);
                     return Ok(value);
                 }
             }
@@ -148,6 +176,43 @@ fn decrypt_secret(
     }
 }
 
+fn cached_decrypted_secret(encryption_key: &str, ciphertext: &str) -> Option<String> {
+    let cache = DECRYPTED_SECRET_CACHE.read().ok()?;
+    let cached = cache.get(ciphertext)?;
+    (cached.encryption_key_fingerprint == encryption_key_fingerprint(encryption_key)
+        && cached.decrypted_at.elapsed() <= DECRYPTED_SECRET_CACHE_TTL)
+        .then(|| cached.plaintext.clone())
+}
+
+fn cache_decrypted_secret(encryption_key: &str, ciphertext: &str, plaintext: &str) {
+    let Ok(mut cache) = DECRYPTED_SECRET_CACHE.write() else {
+        return;
+    };
+    if cache.len() >= DECRYPTED_SECRET_CACHE_MAX_ENTRIES && !cache.contains_key(ciphertext) {
+        cache.retain(|_, entry| entry.decrypted_at.elapsed() <= DECRYPTED_SECRET_CACHE_TTL);
+        if cache.len() >= DECRYPTED_SECRET_CACHE_MAX_ENTRIES {
+            cache.clear();
+        }
+    }
+    cache.insert(
+        ciphertext.to_string(),
+        CachedDecryptedSecret {
+            encryption_key_fingerprint: encryption_key_fingerprint(encryption_key),
+            plaintext: plaintext.to_string(),
+            decrypted_at: Instant::now(),
+        },
+    );
+}
+
+type EncryptionKeyFingerprint = [u8; 16];
+
+fn encryption_key_fingerprint(encryption_key: &str) -> EncryptionKeyFingerprint {
+    let digest = Sha256::digest(encryption_key.as_bytes());
+    let mut fingerprint = [0u8; 16];
+    fingerprint.copy_from_slice(&digest[..16]);
+    fingerprint
+}
+
 pub(super) fn fallback_encryption_keys(primary_encryption_key: &str) -> Vec<String> {
     let mut keys = Vec::new();
     for env_key in ["AETHER_GATEWAY_DATA_ENCRYPTION_KEY", "ENCRYPTION_KEY"] {
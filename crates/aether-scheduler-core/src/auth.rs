@@ -56,7 +56,7 @@ pub fn api_format_matches_allowed_value(allowed_value: &str, api_format: &str) -
     if allowed_value.is_empty() || api_format.is_empty() {
         return false;
     }
-    crate::normalize_api_format(allowed_value) == crate::normalize_api_format(api_format)
+    aether_ai_formats::api_format_alias_matches(allowed_value, api_format)
 }
 
 pub fn auth_constraints_allow_model(
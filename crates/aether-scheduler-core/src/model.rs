@@ -416,7 +416,7 @@ fn row_has_candidate_model_name(
 }
 
 fn api_format_matches(left: &str, right: &str) -> bool {
-    normalize_api_format(left) == normalize_api_format(right)
+    aether_ai_formats::api_format_alias_matches(left, right)
 }
 
 fn requested_model_name_candidates(
@@ -4,7 +4,7 @@ mod priority;
 mod reasons;
 mod types;
 
-use modes::compare_rankable_candidates;
+use modes::{compare_rankable_candidates, RankedCandidate};
 use priority::candidate_priority_slot;
 use reasons::{demoted_by as ranking_demoted_by, promoted_by as ranking_promoted_by};
 pub use reasons::{
@@ -33,9 +33,13 @@ fn scheduler_candidate_ranking_order(
     candidates: &[SchedulerRankableCandidate],
     context: SchedulerRankingContext,
 ) -> Vec<usize> {
+    let ranked = candidates
+        .iter()
+        .map(|candidate| RankedCandidate::new(candidate, context))
+        .collect::<Vec<_>>();
     let mut order = (0..candidates.len()).collect::<Vec<_>>();
     order.sort_by(|left, right| {
-        compare_rankable_candidates(&candidates[*left], &candidates[*right], context)
+        compare_rankable_candidates(&ranked[*left], &ranked[*right], context)
     });
     order
 }
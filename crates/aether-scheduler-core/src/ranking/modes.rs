@@ -9,9 +9,53 @@ use super::format::{
 use super::priority::compare_candidate_priority_slot;
 use super::types::{SchedulerRankableCandidate, SchedulerRankingContext, SchedulerRankingMode};
 
+/// A candidate paired with the seeded hashes its ranking mode compares.
+///
+/// The hashes are SHA-256 based, so they are computed once per candidate
+/// before sorting instead of twice per comparison inside the comparator.
+pub(super) struct RankedCandidate<'a> {
+    candidate: &'a SchedulerRankableCandidate,
+    provider_hash: u64,
+    global_key_hash: u64,
+    key_hash: u64,
+    tie_hash: u64,
+}
+
+impl<'a> RankedCandidate<'a> {
+    pub(super) fn new(
+        candidate: &'a SchedulerRankableCandidate,
+        context: SchedulerRankingContext,
+    ) -> Self {
+        let seed = context.load_balance_seed;
+        let mut ranked = Self {
+            candidate,
+            provider_hash: 0,
+            global_key_hash: 0,
+            key_hash: 0,
+            tie_hash: 0,
+        };
+        match context.ranking_mode {
+            SchedulerRankingMode::FixedOrder | SchedulerRankingMode::CacheAffinity => {
+                ranked.tie_hash = seeded_candidate_hash(candidate, seed, "tie");
+            }
+            SchedulerRankingMode::LoadBalance => match context.priority_mode {
+                crate::SchedulerPriorityMode::Provider => {
+                    ranked.provider_hash =
+                        seeded_rank_hash(seed, "provider", [candidate.provider_id.as_str()], 0);
+                    ranked.key_hash = seeded_candidate_hash(candidate, seed, "key");
+                }
+                crate::SchedulerPriorityMode::GlobalKey => {
+                    ranked.global_key_hash = seeded_candidate_hash(candidate, seed, "global-key");
+                }
+            },
+        }
+        ranked
+    }
+}
+
 pub(super) fn compare_rankable_candidates(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
+    left: &RankedCandidate<'_>,
+    right: &RankedCandidate<'_>,
     context: SchedulerRankingContext,
 ) -> Ordering {
     match context.ranking_mode {
@@ -22,26 +66,28 @@ pub(super) fn compare_rankable_candidates(
 }
 
 fn compare_fixed_order(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
+    left_ranked: &RankedCandidate<'_>,
+    right_ranked: &RankedCandidate<'_>,
     context: SchedulerRankingContext,
 ) -> Ordering {
+    let (left, right) = (left_ranked.candidate, right_ranked.candidate);
     left.capability_priority
         .cmp(&right.capability_priority)
         .then_with(|| compare_cross_format_demotion(left, right))
         .then_with(|| compare_demoted_format_preference(left, right))
         .then_with(|| compare_candidate_priority_slot(left, right, context.priority_mode))
         .then_with(|| compare_format_preference(left, right))
-        .then_with(|| compare_seeded_candidate_hash(left, right, context.load_balance_seed, "tie"))
+        .then(left_ranked.tie_hash.cmp(&right_ranked.tie_hash))
         .then_with(|| compare_candidate_identity_for_ranking(left, right))
         .then(left.original_index.cmp(&right.original_index))
 }
 
 fn compare_cache_affinity(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
+    left_ranked: &RankedCandidate<'_>,
+    right_ranked: &RankedCandidate<'_>,
     context: SchedulerRankingContext,
 ) -> Ordering {
+    let (left, right) = (left_ranked.candidate, right_ranked.candidate);
     left.capability_priority
         .cmp(&right.capability_priority)
         .then_with(|| right.cached_affinity_match.cmp(&left.cached_affinity_match))
@@ -51,23 +97,26 @@ fn compare_cache_affinity(
         .then(left.tunnel_bucket.cmp(&right.tunnel_bucket))
         .then_with(|| compare_format_preference(left, right))
         .then_with(|| compare_health(left, right, context.include_health))
-        .then_with(|| compare_affinity_or_seeded_hash(left, right, context.load_balance_seed))
+        .then_with(|| compare_affinity_or_seeded_hash(left_ranked, right_ranked))
         .then_with(|| compare_candidate_identity_for_ranking(left, right))
         .then(left.original_index.cmp(&right.original_index))
 }
 
 fn compare_load_balance_base(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
+    left_ranked: &RankedCandidate<'_>,
+    right_ranked: &RankedCandidate<'_>,
     context: SchedulerRankingContext,
 ) -> Ordering {
+    let (left, right) = (left_ranked.candidate, right_ranked.candidate);
     left.capability_priority
         .cmp(&right.capability_priority)
         .then_with(|| compare_cross_format_demotion(left, right))
         .then_with(|| compare_demoted_format_preference(left, right))
-        .then_with(|| compare_load_balance_distribution_slot(left, right, context))
+        .then_with(|| compare_load_balance_distribution_slot(left_ranked, right_ranked, context))
         .then_with(|| compare_conversion_priority_slot(left, right, context.priority_mode))
-        .then_with(|| compare_load_balance_distribution_tiebreakers(left, right, context))
+        .then_with(|| {
+            compare_load_balance_distribution_tiebreakers(left_ranked, right_ranked, context)
+        })
         .then_with(|| compare_format_preference(left, right))
         .then_with(|| compare_candidate_identity_for_ranking(left, right))
         .then(left.original_index.cmp(&right.original_index))
@@ -88,32 +137,32 @@ fn compare_conversion_priority_slot(
 }
 
 fn compare_load_balance_distribution_slot(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
+    left: &RankedCandidate<'_>,
+    right: &RankedCandidate<'_>,
     context: SchedulerRankingContext,
 ) -> Ordering {
     match context.priority_mode {
-        crate::SchedulerPriorityMode::Provider => {
-            compare_seeded_provider_hash(left, right, context.load_balance_seed)
-        }
-        crate::SchedulerPriorityMode::GlobalKey => {
-            compare_seeded_candidate_hash(left, right, context.load_balance_seed, "global-key")
-        }
+        crate::SchedulerPriorityMode::Provider => left.provider_hash.cmp(&right.provider_hash),
+        crate::SchedulerPriorityMode::GlobalKey => left.global_key_hash.cmp(&right.global_key_hash),
     }
 }
 
 fn compare_load_balance_distribution_tiebreakers(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
+    left: &RankedCandidate<'_>,
+    right: &RankedCandidate<'_>,
     context: SchedulerRankingContext,
 ) -> Ordering {
     match context.priority_mode {
-        crate::SchedulerPriorityMode::Provider => if left.provider_id == right.provider_id {
-            left.key_internal_priority.cmp(&right.key_internal_priority)
-        } else {
-            Ordering::Equal
+        crate::SchedulerPriorityMode::Provider => {
+            if left.candidate.provider_id == right.candidate.provider_id {
+                left.candidate
+                    .key_internal_priority
+                    .cmp(&right.candidate.key_internal_priority)
+            } else {
+                Ordering::Equal
+            }
+            .then(left.key_hash.cmp(&right.key_hash))
         }
-        .then_with(|| compare_seeded_candidate_hash(left, right, context.load_balance_seed, "key")),
         crate::SchedulerPriorityMode::GlobalKey => Ordering::Equal,
     }
 }
@@ -133,57 +182,27 @@ fn compare_health(
 }
 
 fn compare_affinity_or_seeded_hash(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
-    seed: u64,
+    left: &RankedCandidate<'_>,
+    right: &RankedCandidate<'_>,
 ) -> Ordering {
-    match (left.affinity_hash, right.affinity_hash) {
+    match (left.candidate.affinity_hash, right.candidate.affinity_hash) {
         (Some(left_hash), Some(right_hash)) => left_hash.cmp(&right_hash),
-        _ => compare_seeded_candidate_hash(left, right, seed, "tie"),
+        _ => left.tie_hash.cmp(&right.tie_hash),
     }
 }
 
-fn compare_seeded_provider_hash(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
-    seed: u64,
-) -> Ordering {
-    seeded_rank_hash(seed, "provider", [left.provider_id.as_str()], 0).cmp(&seeded_rank_hash(
-        seed,
-        "provider",
-        [right.provider_id.as_str()],
-        0,
-    ))
-}
-
-fn compare_seeded_candidate_hash(
-    left: &SchedulerRankableCandidate,
-    right: &SchedulerRankableCandidate,
-    seed: u64,
-    salt: &str,
-) -> Ordering {
+fn seeded_candidate_hash(candidate: &SchedulerRankableCandidate, seed: u64, salt: &str) -> u64 {
     seeded_rank_hash(
         seed,
         salt,
         [
-            left.provider_id.as_str(),
-            left.endpoint_id.as_str(),
-            left.key_id.as_str(),
-            left.selected_provider_model_name.as_str(),
+            candidate.provider_id.as_str(),
+            candidate.endpoint_id.as_str(),
+            candidate.key_id.as_str(),
+            candidate.selected_provider_model_name.as_str(),
         ],
-        left.original_index,
+        candidate.original_index,
     )
-    .cmp(&seeded_rank_hash(
-        seed,
-        salt,
-        [
-            right.provider_id.as_str(),
-            right.endpoint_id.as_str(),
-            right.key_id.as_str(),
-            right.selected_provider_model_name.as_str(),
-        ],
-        right.original_index,
-    ))
 }
 
 fn seeded_rank_hash<'a>(
@@ -1,4 +1,6 @@
+use std::borrow::Cow;
 use std::collections::BTreeMap;
+use std::sync::LazyLock;
 
 use crate::StandardizedUsage;
 
@@ -10,39 +12,48 @@ impl UsageMapper {
         api_format: &str,
         extra_mapping: Option<&BTreeMap<String, String>>,
     ) -> StandardizedUsage {
-        if !raw_usage.is_object() {
-            return StandardizedUsage::new();
-        }
-
-        let mut usage = StandardizedUsage::new();
-        let mut mapping = base_mapping(api_format);
-        if let Some(extra_mapping) = extra_mapping {
-            mapping.extend(extra_mapping.clone());
-        }
-
-        for (source_path, target_field) in mapping {
-            if let Some(value) = get_nested_value(raw_usage, &source_path) {
-                usage.set(&target_field, value.clone());
-            }
-        }
-
-        derive_missing_input_tokens(raw_usage, api_format, &mut usage);
-        copy_explicit_total_tokens(raw_usage, api_format, &mut usage);
-        usage.normalize_cache_creation_breakdown()
+        Self::map_with_family(raw_usage, &api_family(api_format), extra_mapping)
     }
 
     pub fn map_from_response(response: &serde_json::Value, api_format: &str) -> StandardizedUsage {
         let family = api_family(api_format);
-        let mut usage = if let Some(usage_value) = resolve_usage_value(response, family.as_str()) {
-            Self::map(usage_value, api_format, None)
+        let mut usage = if let Some(usage_value) = resolve_usage_value(response, &family) {
+            Self::map_with_family(usage_value, &family, None)
         } else {
             StandardizedUsage::new()
         };
-        if is_openai_image_api(api_format) {
+        if family == "openai" && api_kind(api_format) == "image" {
             apply_openai_image_response_dimensions(response, &mut usage);
         }
         usage
     }
+
+    fn map_with_family(
+        raw_usage: &serde_json::Value,
+        family: &str,
+        extra_mapping: Option<&BTreeMap<String, String>>,
+    ) -> StandardizedUsage {
+        if !raw_usage.is_object() {
+            return StandardizedUsage::new();
+        }
+
+        let mut usage = StandardizedUsage::new();
+        let base = base_mapping(family);
+        match extra_mapping {
+            Some(extra_mapping) => {
+                let mut mapping = base.clone();
+                mapping.extend(extra_mapping.iter().map(|(source_path, target_field)| {
+                    (source_path.as_str(), target_field.as_str())
+                }));
+                apply_usage_mapping(raw_usage, &mapping, &mut usage);
+            }
+            None => apply_usage_mapping(raw_usage, base, &mut usage),
+        }
+
+        derive_missing_input_tokens(raw_usage, family, &mut usage);
+        copy_explicit_total_tokens(raw_usage, family, &mut usage);
+        usage.normalize_cache_creation_breakdown()
+    }
 }
 
 pub fn map_usage(raw_usage: &serde_json::Value, api_format: &str) -> StandardizedUsage {
@@ -56,26 +67,12 @@ pub fn map_usage_from_response(
     UsageMapper::map_from_response(response, api_format)
 }
 
-fn api_family(api_format: &str) -> String {
-    api_format
-        .split(':')
-        .next()
-        .unwrap_or_default()
-        .trim()
-        .to_ascii_lowercase()
-}
-
-fn api_kind(api_format: &str) -> String {
-    api_format
-        .split(':')
-        .nth(1)
-        .unwrap_or_default()
-        .trim()
-        .to_ascii_lowercase()
+fn api_family(api_format: &str) -> Cow<'_, str> {
+    aether_ai_formats::fold_ascii_case(api_format.split(':').next().unwrap_or_default().trim())
 }
 
-fn is_openai_image_api(api_format: &str) -> bool {
-    api_family(api_format).as_str() == "openai" && api_kind(api_format).as_str() == "image"
+fn api_kind(api_format: &str) -> Cow<'_, str> {
+    aether_ai_formats::fold_ascii_case(api_format.split(':').nth(1).unwrap_or_default().trim())
 }
 
 fn apply_openai_image_response_dimensions(
@@ -112,120 +109,109 @@ fn image_result_count(value: Option<&serde_json::Value>) -> Option<i64> {
     }
 }
 
-fn base_mapping(api_format: &str) -> BTreeMap<String, String> {
-    let mut mapping = BTreeMap::new();
-    match api_family(api_format).as_str() {
-        "openai" => {
-            mapping.insert("prompt_tokens".to_string(), "input_tokens".to_string());
-            mapping.insert("completion_tokens".to_string(), "output_tokens".to_string());
-            mapping.insert("input_tokens".to_string(), "input_tokens".to_string());
-            mapping.insert("output_tokens".to_string(), "output_tokens".to_string());
-            mapping.insert(
-                "cache_creation_input_tokens".to_string(),
-                "cache_creation_tokens".to_string(),
-            );
-            mapping.insert(
-                "cache_creation.ephemeral_5m_input_tokens".to_string(),
-                "cache_creation_ephemeral_5m_tokens".to_string(),
-            );
-            mapping.insert(
-                "cache_creation.ephemeral_1h_input_tokens".to_string(),
-                "cache_creation_ephemeral_1h_tokens".to_string(),
-            );
-            mapping.insert(
-                "cache_read_input_tokens".to_string(),
-                "cache_read_tokens".to_string(),
-            );
-            mapping.insert(
-                "prompt_tokens_details.cached_tokens".to_string(),
-                "cache_read_tokens".to_string(),
-            );
-            mapping.insert(
-                "input_tokens_details.cached_tokens".to_string(),
-                "cache_read_tokens".to_string(),
-            );
-            mapping.insert(
-                "prompt_tokens_details.cached_creation_tokens".to_string(),
-                "cache_creation_tokens".to_string(),
-            );
-            mapping.insert(
-                "input_tokens_details.cached_creation_tokens".to_string(),
-                "cache_creation_tokens".to_string(),
-            );
-            mapping.insert(
-                "completion_tokens_details.reasoning_tokens".to_string(),
-                "reasoning_tokens".to_string(),
-            );
-            mapping.insert(
-                "output_tokens_details.reasoning_tokens".to_string(),
-                "reasoning_tokens".to_string(),
-            );
-        }
-        "gemini" => {
-            mapping.insert("promptTokenCount".to_string(), "input_tokens".to_string());
-            mapping.insert(
-                "candidatesTokenCount".to_string(),
-                "output_tokens".to_string(),
-            );
-            mapping.insert(
-                "cachedContentTokenCount".to_string(),
-                "cache_read_tokens".to_string(),
-            );
-            mapping.insert(
-                "usageMetadata.promptTokenCount".to_string(),
-                "input_tokens".to_string(),
-            );
-            mapping.insert(
-                "usageMetadata.candidatesTokenCount".to_string(),
-                "output_tokens".to_string(),
-            );
-            mapping.insert(
-                "usageMetadata.cachedContentTokenCount".to_string(),
-                "cache_read_tokens".to_string(),
-            );
-        }
-        "claude" | "anthropic" => {
-            mapping.insert("input_tokens".to_string(), "input_tokens".to_string());
-            mapping.insert("output_tokens".to_string(), "output_tokens".to_string());
-            mapping.insert(
-                "cache_creation_input_tokens".to_string(),
-                "cache_creation_tokens".to_string(),
-            );
-            mapping.insert(
-                "cache_creation.ephemeral_5m_input_tokens".to_string(),
-                "cache_creation_ephemeral_5m_tokens".to_string(),
-            );
-            mapping.insert(
-                "cache_creation.ephemeral_1h_input_tokens".to_string(),
-                "cache_creation_ephemeral_1h_tokens".to_string(),
-            );
-            mapping.insert(
-                "cache_read_input_tokens".to_string(),
-                "cache_read_tokens".to_string(),
-            );
-        }
-        _ => {
-            mapping.insert("input_tokens".to_string(), "input_tokens".to_string());
-            mapping.insert("output_tokens".to_string(), "output_tokens".to_string());
-            mapping.insert(
-                "cache_creation_input_tokens".to_string(),
-                "cache_creation_tokens".to_string(),
-            );
-            mapping.insert(
-                "cache_read_input_tokens".to_string(),
-                "cache_read_tokens".to_string(),
-            );
+type UsageFieldMapping = BTreeMap<&'static str, &'static str>;
+
+const OPENAI_USAGE_FIELDS: &[(&str, &str)] = &[
+    ("prompt_tokens", "input_tokens"),
+    ("completion_tokens", "output_tokens"),
+    ("input_tokens", "input_tokens"),
+    ("output_tokens", "output_tokens"),
+    ("cache_creation_input_tokens", "cache_creation_tokens"),
+    (
+        "cache_creation.ephemeral_5m_input_tokens",
+        "cache_creation_ephemeral_5m_tokens",
+    ),
+    (
+        "cache_creation.ephemeral_1h_input_tokens",
+        "cache_creation_ephemeral_1h_tokens",
+    ),
+    ("cache_read_input_tokens", "cache_read_tokens"),
+    ("prompt_tokens_details.cached_tokens", "cache_read_tokens"),
+    ("input_tokens_details.cached_tokens", "cache_read_tokens"),
+    (
+        "prompt_tokens_details.cached_creation_tokens",
+        "cache_creation_tokens",
+    ),
+    (
+        "input_tokens_details.cached_creation_tokens",
+        "cache_creation_tokens",
+    ),
+    (
+        "completion_tokens_details.reasoning_tokens",
+        "reasoning_tokens",
+    ),
+    ("output_tokens_details.reasoning_tokens", "reasoning_tokens"),
+];
+
+const GEMINI_USAGE_FIELDS: &[(&str, &str)] = &[
+    ("promptTokenCount", "input_tokens"),
+    ("candidatesTokenCount", "output_tokens"),
+    ("cachedContentTokenCount", "cache_read_tokens"),
+    ("usageMetadata.promptTokenCount", "input_tokens"),
+    ("usageMetadata.candidatesTokenCount", "output_tokens"),
+    ("usageMetadata.cachedContentTokenCount", "cache_read_tokens"),
+];
+
+const CLAUDE_USAGE_FIELDS: &[(&str, &str)] = &[
+    ("input_tokens", "input_tokens"),
+    ("output_tokens", "output_tokens"),
+    ("cache_creation_input_tokens", "cache_creation_tokens"),
+    (
+        "cache_creation.ephemeral_5m_input_tokens",
+        "cache_creation_ephemeral_5m_tokens",
+    ),
+    (
+        "cache_creation.ephemeral_1h_input_tokens",
+        "cache_creation_ephemeral_1h_tokens",
+    ),
+    ("cache_read_input_tokens", "cache_read_tokens"),
+];
+
+const DEFAULT_USAGE_FIELDS: &[(&str, &str)] = &[
+    ("input_tokens", "input_tokens"),
+    ("output_tokens", "output_tokens"),
+    ("cache_creation_input_tokens", "cache_creation_tokens"),
+    ("cache_read_input_tokens", "cache_read_tokens"),
+];
+
+// The per-family mappings never change, so build each ordered map once
+// instead of allocating a fresh BTreeMap of Strings for every usage payload.
+static OPENAI_USAGE_MAPPING: LazyLock<UsageFieldMapping> =
+    LazyLock::new(|| OPENAI_USAGE_FIELDS.iter().copied().collect());
+static GEMINI_USAGE_MAPPING: LazyLock<UsageFieldMapping> =
+    LazyLock::new(|| GEMINI_USAGE_FIELDS.iter().copied().collect());
+static CLAUDE_USAGE_MAPPING: LazyLock<UsageFieldMapping> =
+    LazyLock::new(|| CLAUDE_USAGE_FIELDS.iter().copied().collect());
+static DEFAULT_USAGE_MAPPING: LazyLock<UsageFieldMapping> =
+    LazyLock::new(|| DEFAULT_USAGE_FIELDS.iter().copied().collect());
+
+fn base_mapping(family: &str) -> &'static UsageFieldMapping {
+    match family {
+        "openai" => &OPENAI_USAGE_MAPPING,
+        "gemini" => &GEMINI_USAGE_MAPPING,
+        "claude" | "anthropic" => &CLAUDE_USAGE_MAPPING,
+        _ => &DEFAULT_USAGE_MAPPING,
+    }
+}
+
+fn apply_usage_mapping(
+    raw_usage: &serde_json::Value,
+    mapping: &BTreeMap<&str, &str>,
+    usage: &mut StandardizedUsage,
+) {
+    for (source_path, target_field) in mapping {
+        if let Some(value) = get_nested_value(raw_usage, source_path) {
+            usage.set(target_field, value.clone());
         }
     }
-    mapping
 }
 
 fn derive_missing_input_tokens(
     raw_usage: &serde_json::Value,
-    api_format: &str,
+    family: &str,
     usage: &mut StandardizedUsage,
 ) {
-    if usage.input_tokens > 0 || api_family(api_format).as_str() != "openai" {
+    if usage.input_tokens > 0 || family != "openai" {
         return;
     }
 
@@ -244,10 +230,10 @@ fn derive_missing_input_tokens(
 
 fn copy_explicit_total_tokens(
     raw_usage: &serde_json::Value,
-    api_format: &str,
+    family: &str,
     usage: &mut StandardizedUsage,
 ) {
-    let total_tokens = match api_family(api_format).as_str() {
+    let total_tokens = match family {
         "gemini" => numeric_i64(raw_usage.get("totalTokenCount")),
         _ => numeric_i64(raw_usage.get("total_tokens")),
     };
@@ -319,7 +305,9 @@ fn resolve_usage_value<'a>(
 
 #[cfg(test)]
 mod tests {
-    use super::{map_usage, map_usage_from_response};
+    use std::collections::BTreeMap;
+
+    use super::{map_usage, map_usage_from_response, UsageMapper};
 
     #[test]
     fn maps_openai_usage() {
@@ -715,4 +703,33 @@ mod tests {
             Some(&serde_json::json!(1))
         );
     }
+
+    #[test]
+    fn extra_mapping_overrides_family_defaults() {
+        let extra_mapping = BTreeMap::from([
+            ("input_tokens".to_string(), "output_tokens".to_string()),
+            ("billed_tokens".to_string(), "input_tokens".to_string()),
+        ]);
+        let usage = UsageMapper::map(
+            &serde_json::json!({
+                "input_tokens": 7,
+                "billed_tokens": 9
+            }),
+            "claude:messages",
+            Some(&extra_mapping),
+        );
+
+        assert_eq!(usage.input_tokens, 9);
+        assert_eq!(usage.output_tokens, 7);
+
+        let usage = map_usage(
+            &serde_json::json!({
+                "input_tokens": 7,
+                "billed_tokens": 9
+            }),
+            "claude:messages",
+        );
+        assert_eq!(usage.input_tokens, 7);
+        assert_eq!(usage.output_tokens, 0);
+    }
 }
@@ -3001,25 +3001,27 @@ fn apply_request_cache_usage_estimate(
     let Some(request_usage) = request_usage else {
         return;
     };
-    if positive_tokens(data.cache_read_input_tokens) == 0 && request_usage.cache_read_tokens > 0 {
-        data.cache_read_input_tokens = Some(request_usage.cache_read_tokens);
-    }
-    if positive_tokens(data.cache_creation_input_tokens) == 0
-        && request_usage.cache_creation_tokens > 0
-    {
-        data.cache_creation_input_tokens = Some(request_usage.cache_creation_tokens);
-    }
-    if positive_tokens(data.cache_creation_ephemeral_5m_input_tokens) == 0
-        && request_usage.cache_creation_ephemeral_5m_tokens > 0
-    {
-        data.cache_creation_ephemeral_5m_input_tokens =
-            Some(request_usage.cache_creation_ephemeral_5m_tokens);
-    }
-    if positive_tokens(data.cache_creation_ephemeral_1h_input_tokens) == 0
-        && request_usage.cache_creation_ephemeral_1h_tokens > 0
-    {
-        data.cache_creation_ephemeral_1h_input_tokens =
-            Some(request_usage.cache_creation_ephemeral_1h_tokens);
+    fill_missing_tokens(
+        &mut data.cache_read_input_tokens,
+        request_usage.cache_read_tokens,
+    );
+    fill_missing_tokens(
+        &mut data.cache_creation_input_tokens,
+        request_usage.cache_creation_tokens,
+    );
+    fill_missing_tokens(
+        &mut data.cache_creation_ephemeral_5m_input_tokens,
+        request_usage.cache_creation_ephemeral_5m_tokens,
+    );
+    fill_missing_tokens(
+        &mut data.cache_creation_ephemeral_1h_input_tokens,
+        request_usage.cache_creation_ephemeral_1h_tokens,
+    );
+}
+
+fn fill_missing_tokens(slot: &mut Option<u64>, estimated: u64) {
+    if estimated > 0 && positive_tokens(*slot) == 0 {
+        *slot = Some(estimated);
     }
 }
 
@@ -12,6 +12,20 @@ use crate::{
     DEFAULT_VIDEO_TASK_POLL_INTERVAL_SECONDS,
 };
 
+const GEMINI_OPERATION_SEGMENT: &str = "/v1beta/";
+
+fn gemini_operation_url(base_url: &str, operation_path: &str, action: &str) -> String {
+    let base_url = base_url.trim_end_matches('/');
+    let mut url = String::with_capacity(
+        base_url.len() + GEMINI_OPERATION_SEGMENT.len() + operation_path.len() + action.len(),
+    );
+    url.push_str(base_url);
+    url.push_str(GEMINI_OPERATION_SEGMENT);
+    url.push_str(operation_path);
+    url.push_str(action);
+    url
+}
+
 pub fn map_gemini_stored_task_to_read_response(
     task: StoredVideoTask,
 ) -> LocalVideoTaskReadResponse {
@@ -138,9 +152,7 @@ impl GeminiVideoTaskSeed {
         }
 
         let operation_path = self.resolve_operation_path()?;
-        let mut headers = self.transport.headers.clone();
-        headers.remove("content-type");
-        headers.remove("content-length");
+        let headers = self.transport.bodyless_request_headers();
 
         Some(ExecutionPlan {
             request_id: trace_id.to_string(),
@@ -150,11 +162,7 @@ impl GeminiVideoTaskSeed {
             endpoint_id: self.transport.endpoint_id.clone(),
             key_id: self.transport.key_id.clone(),
             method: "GET".to_string(),
-            url: format!(
-                "{}/v1beta/{}",
-                self.transport.upstream_base_url.trim_end_matches('/'),
-                operation_path
-            ),
+            url: gemini_operation_url(&self.transport.upstream_base_url, &operation_path, ""),
             headers,
             content_type: None,
             content_encoding: None,
@@ -214,10 +222,10 @@ impl GeminiVideoTaskSeed {
                 endpoint_id: self.transport.endpoint_id.clone(),
                 key_id: self.transport.key_id.clone(),
                 method: "POST".to_string(),
-                url: format!(
-                    "{}/v1beta/{}:cancel",
-                    self.transport.upstream_base_url.trim_end_matches('/'),
-                    operation_path
+                url: gemini_operation_url(
+                    &self.transport.upstream_base_url,
+                    &operation_path,
+                    ":cancel",
                 ),
                 headers,
                 content_type: Some(content_type),
@@ -15,12 +15,17 @@ use crate::{
     DEFAULT_VIDEO_TASK_POLL_INTERVAL_SECONDS,
 };
 
+const OPENAI_VIDEO_RESOURCE_SEGMENT: &str = "/videos/";
+
 fn openai_video_resource_url(api_root: &str, suffix: &str) -> String {
-    format!(
-        "{}/videos/{}",
-        api_root.trim_end_matches('/'),
-        suffix.trim_start_matches('/')
-    )
+    let api_root = api_root.trim_end_matches('/');
+    let suffix = suffix.trim_start_matches('/');
+    let mut url =
+        String::with_capacity(api_root.len() + OPENAI_VIDEO_RESOURCE_SEGMENT.len() + suffix.len());
+    url.push_str(api_root);
+    url.push_str(OPENAI_VIDEO_RESOURCE_SEGMENT);
+    url.push_str(suffix);
+    url
 }
 
 pub fn map_openai_stored_task_to_read_response(
@@ -191,9 +196,7 @@ impl OpenAiVideoTaskSeed {
             {
                 (video_url, BTreeMap::new())
             } else {
-                let mut headers = self.transport.headers.clone();
-                headers.remove("content-type");
-                headers.remove("content-length");
+                let headers = self.transport.bodyless_request_headers();
                 (
                     openai_video_resource_url(
                         &self.transport.upstream_base_url,
@@ -203,9 +206,7 @@ impl OpenAiVideoTaskSeed {
                 )
             }
         } else {
-            let mut headers = self.transport.headers.clone();
-            headers.remove("content-type");
-            headers.remove("content-length");
+            let headers = self.transport.bodyless_request_headers();
             (
                 openai_video_resource_url(
                     &self.transport.upstream_base_url,
@@ -315,9 +316,7 @@ impl OpenAiVideoTaskSeed {
             .clone()
             .or_else(|| self.transport.model_name.clone());
 
-        let mut headers = self.transport.headers.clone();
-        headers.remove("content-type");
-        headers.remove("content-length");
+        let headers = self.transport.bodyless_request_headers();
 
         Some(LocalVideoTaskFollowUpPlan {
             plan: ExecutionPlan {
@@ -377,9 +376,7 @@ impl OpenAiVideoTaskSeed {
             return None;
         }
 
-        let mut headers = self.transport.headers.clone();
-        headers.remove("content-type");
-        headers.remove("content-length");
+        let headers = self.transport.bodyless_request_headers();
 
         Some(ExecutionPlan {
             request_id: trace_id.to_string(),
@@ -439,9 +436,7 @@ impl OpenAiVideoTaskSeed {
             .clone()
             .or_else(|| self.transport.model_name.clone());
 
-        let mut headers = self.transport.headers.clone();
-        headers.remove("content-type");
-        headers.remove("content-length");
+        let headers = self.transport.bodyless_request_headers();
 
         Some(LocalVideoTaskFollowUpPlan {
             plan: ExecutionPlan {
@@ -634,7 +629,7 @@ impl OpenAiVideoTaskSeed {
 mod tests {
     use aether_data_contracts::repository::video_tasks::{StoredVideoTask, VideoTaskStatus};
 
-    use super::map_openai_stored_task_to_read_response;
+    use super::{map_openai_stored_task_to_read_response, openai_video_resource_url};
 
     fn sample_stored_task(status: VideoTaskStatus) -> StoredVideoTask {
         StoredVideoTask {
@@ -693,4 +688,16 @@ mod tests {
             "https://cdn.example.com/video.mp4"
         );
     }
+
+    #[test]
+    fn builds_openai_video_resource_url_across_slash_variants() {
+        assert_eq!(
+            openai_video_resource_url("https://api.openai.example/v1/", "/task-1/content"),
+            "https://api.openai.example/v1/videos/task-1/content"
+        );
+        assert_eq!(
+            openai_video_resource_url("https://api.openai.example/v1", "task-1"),
+            "https://api.openai.example/v1/videos/task-1"
+        );
+    }
 }
@@ -215,49 +215,15 @@ impl VideoTaskService {
         }
     }
 
-    pub fn prepare_poll_refresh_batch(
+    pub fn prepare_poll_refresh_plan_for_snapshot(
         &self,
-        limit: usize,
-        trace_prefix: &str,
-    ) -> Vec<LocalVideoTaskReadRefreshPlan> {
-        if self.truth_source_mode != VideoTaskTruthSourceMode::RustAuthoritative || limit == 0 {
-            return Vec::new();
-        }
-
-        self.store
-            .list_active_snapshots(limit)
-            .into_iter()
-            .enumerate()
-            .filter_map(|(index, snapshot)| {
-                let trace_id = format!("{trace_prefix}-{index}");
-                match snapshot {
-                    LocalVideoTaskSnapshot::OpenAi(seed) => Some(LocalVideoTaskReadRefreshPlan {
-                        plan: seed.build_get_follow_up_plan(&trace_id)?,
-                        projection_target: LocalVideoTaskProjectionTarget::OpenAi {
-                            task_id: seed.local_task_id.clone(),
-                        },
-                    }),
-                    LocalVideoTaskSnapshot::Gemini(seed) => Some(LocalVideoTaskReadRefreshPlan {
-                        plan: seed.build_get_follow_up_plan(&trace_id)?,
-                        projection_target: LocalVideoTaskProjectionTarget::Gemini {
-                            short_id: seed.local_short_id.clone(),
-                        },
-                    }),
-                }
-            })
-            .collect()
-    }
-
-    pub fn prepare_poll_refresh_plan_for_stored_task(
-        &self,
-        task: &StoredVideoTask,
+        snapshot: &LocalVideoTaskSnapshot,
         trace_id: &str,
     ) -> Option<LocalVideoTaskReadRefreshPlan> {
         if self.truth_source_mode != VideoTaskTruthSourceMode::RustAuthoritative {
             return None;
         }
 
-        let snapshot = LocalVideoTaskSnapshot::from_stored_task(task)?;
         match snapshot {
             LocalVideoTaskSnapshot::OpenAi(seed) => Some(LocalVideoTaskReadRefreshPlan {
                 plan: seed.build_get_follow_up_plan(trace_id)?,
@@ -130,23 +130,6 @@ impl LocalVideoTaskSnapshot {
         }
     }
 
-    pub fn is_active_for_refresh(&self) -> bool {
-        match self {
-            Self::OpenAi(seed) => matches!(
-                seed.status,
-                LocalVideoTaskStatus::Submitted
-                    | LocalVideoTaskStatus::Queued
-                    | LocalVideoTaskStatus::Processing
-            ),
-            Self::Gemini(seed) => matches!(
-                seed.status,
-                LocalVideoTaskStatus::Submitted
-                    | LocalVideoTaskStatus::Queued
-                    | LocalVideoTaskStatus::Processing
-            ),
-        }
-    }
-
     pub fn apply_provider_body(&mut self, provider_body: &Map<String, Value>) {
         match self {
             Self::OpenAi(seed) => seed.apply_provider_body(provider_body),
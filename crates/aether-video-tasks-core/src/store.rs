@@ -11,7 +11,6 @@ pub trait VideoTaskStore: std::fmt::Debug + Send + Sync {
     fn read_gemini(&self, short_id: &str) -> Option<LocalVideoTaskReadResponse>;
     fn clone_openai(&self, task_id: &str) -> Option<OpenAiVideoTaskSeed>;
     fn clone_gemini(&self, short_id: &str) -> Option<GeminiVideoTaskSeed>;
-    fn list_active_snapshots(&self, limit: usize) -> Vec<LocalVideoTaskSnapshot>;
     fn apply_mutation(&self, mutation: LocalVideoTaskRegistryMutation);
     fn project_openai(&self, task_id: &str, provider_body: &Map<String, Value>) -> bool;
     fn project_gemini(&self, short_id: &str, provider_body: &Map<String, Value>) -> bool;
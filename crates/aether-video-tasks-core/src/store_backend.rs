@@ -46,13 +46,6 @@ impl VideoTaskStore for InMemoryVideoTaskStore {
         registry.clone_gemini(short_id)
     }
 
-    fn list_active_snapshots(&self, limit: usize) -> Vec<LocalVideoTaskSnapshot> {
-        let Ok(registry) = self.registry.lock() else {
-            return Vec::new();
-        };
-        registry.list_active_snapshots(limit)
-    }
-
     fn apply_mutation(&self, mutation: LocalVideoTaskRegistryMutation) {
         if let Ok(mut registry) = self.registry.lock() {
             registry.apply_mutation(mutation);
@@ -147,13 +140,6 @@ impl VideoTaskStore for FileVideoTaskStore {
         registry.clone_gemini(short_id)
     }
 
-    fn list_active_snapshots(&self, limit: usize) -> Vec<LocalVideoTaskSnapshot> {
-        let Ok(registry) = self.registry.lock() else {
-            return Vec::new();
-        };
-        registry.list_active_snapshots(limit)
-    }
-
     fn apply_mutation(&self, mutation: LocalVideoTaskRegistryMutation) {
         let _ = self.mutate_registry(|registry| {
             registry.apply_mutation(mutation);
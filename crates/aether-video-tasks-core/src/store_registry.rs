@@ -52,16 +52,6 @@ impl VideoTaskRegistry {
         Some(seed)
     }
 
-    pub fn list_active_snapshots(&self, limit: usize) -> Vec<LocalVideoTaskSnapshot> {
-        self.openai
-            .values()
-            .chain(self.gemini.values())
-            .filter(|snapshot| snapshot.is_active_for_refresh())
-            .take(limit)
-            .cloned()
-            .collect()
-    }
-
     pub fn apply_mutation(&mut self, mutation: LocalVideoTaskRegistryMutation) {
         match mutation {
             LocalVideoTaskRegistryMutation::OpenAiCancelled { task_id } => {
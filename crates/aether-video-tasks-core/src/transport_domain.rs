@@ -53,6 +53,14 @@ impl LocalVideoTaskTransport {
             timeouts: input.timeouts,
         }
     }
+
+    pub(crate) fn bodyless_request_headers(&self) -> BTreeMap<String, String> {
+        self.headers
+            .iter()
+            .filter(|(name, _)| !matches!(name.as_str(), "content-type" | "content-length"))
+            .map(|(name, value)| (name.clone(), value.clone()))
+            .collect()
+    }
 }
 
 fn trim_openai_video_resource_root(url: &str) -> Option<String> {
@@ -121,3 +129,45 @@ impl LocalVideoTaskStatus {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use crate::{LocalVideoTaskTransport, LocalVideoTaskTransportBridgeInput};
+
+    #[test]
+    fn bodyless_request_headers_drop_body_headers_only() {
+        let mut transport =
+            LocalVideoTaskTransport::from_bridge_input(LocalVideoTaskTransportBridgeInput {
+                upstream_base_url: "https://api.openai.example/v1".to_string(),
+                provider_name: Some("openai".to_string()),
+                provider_id: "provider-1".to_string(),
+                endpoint_id: "endpoint-1".to_string(),
+                key_id: "key-1".to_string(),
+                auth_header: "authorization".to_string(),
+                auth_value: "Bearer sk-test".to_string(),
+                content_type: Some("application/json".to_string()),
+                model_name: None,
+                proxy: None,
+                transport_profile: None,
+                timeouts: None,
+            });
+        transport
+            .headers
+            .insert("content-type".to_string(), "application/json".to_string());
+        transport
+            .headers
+            .insert("content-length".to_string(), "42".to_string());
+        transport
+            .headers
+            .insert("x-trace".to_string(), "trace-1".to_string());
+
+        let headers = transport.bodyless_request_headers();
+
+        assert_eq!(headers.len(), 2);
+        assert_eq!(
+            headers.get("authorization").map(String::as_str),
+            Some("Bearer sk-test")
+        );
+        assert_eq!(headers.get("x-trace").map(String::as_str), Some("trace-1"));
+    }
+}